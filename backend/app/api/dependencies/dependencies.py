@@ -1,11 +1,18 @@
+from typing import List, Optional
+import secrets
+from fastapi import Header, HTTPException, Query
+from app.core.config import settings
+from app.core.translation_store import TRANSLATION_FIELDS
 from app.services.content_service import PlayerContentService
 from app.services.chat_service import ChatService
 from app.services.info_service import PlayerInfoService
+from app.services.profile_service import PlayerProfileService
 
 # Create singleton instances
 _content_service: PlayerContentService = None
 _chat_service: ChatService = None
 _info_service: PlayerInfoService = None
+_profile_service: PlayerProfileService = None
 
 def get_content_service() -> PlayerContentService:
     """Dependency to get the content service instance"""
@@ -26,4 +33,55 @@ def get_info_service() -> PlayerInfoService:
     global _info_service
     if _info_service is None:
         _info_service = PlayerInfoService()
-    return _info_service 
\ No newline at end of file
+    return _info_service
+
+def get_profile_service() -> PlayerProfileService:
+    """Dependency to get the profile service instance"""
+    global _profile_service
+    if _profile_service is None:
+        _profile_service = PlayerProfileService(get_info_service(), get_content_service())
+    return _profile_service
+
+def get_languages(
+    langs: Optional[str] = Query(
+        None, description="Comma-separated output languages (en, ja, es); defaults to Accept-Language"
+    ),
+    accept_language: Optional[str] = Header(None)
+) -> List[str]:
+    """Dependency resolving the languages content should be translated into"""
+    if langs:
+        requested = [lang.strip().lower() for lang in langs.split(",") if lang.strip()]
+        unsupported = [lang for lang in requested if lang not in TRANSLATION_FIELDS]
+        if unsupported:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Unsupported languages: {', '.join(unsupported)}"
+            )
+        return list(dict.fromkeys(requested))
+
+    if accept_language:
+        # e.g. "ja-JP,ja;q=0.9,en;q=0.8" -> primary subtags ordered by quality
+        weighted = []
+        for position, part in enumerate(accept_language.split(",")):
+            tag, _, params = part.strip().partition(";")
+            quality = 1.0
+            if params.strip().startswith("q="):
+                try:
+                    quality = float(params.strip()[2:])
+                except ValueError:
+                    continue
+            language = tag.split("-")[0].strip().lower()
+            if quality > 0 and language in TRANSLATION_FIELDS:
+                weighted.append((-quality, position, language))
+        accepted = list(dict.fromkeys(language for _, _, language in sorted(weighted)))
+        if accepted:
+            return accepted
+
+    return list(TRANSLATION_FIELDS)
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Dependency guarding maintenance endpoints; they are disabled unless ADMIN_TOKEN is set"""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
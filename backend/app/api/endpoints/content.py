@@ -1,11 +1,32 @@
 from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional, Dict
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Literal, Optional, Dict
 from fastapi import Depends
+import json
 from app.services.content_service import PlayerContentService
-from app.api.dependencies.dependencies import get_content_service
+from app.api.dependencies.dependencies import get_content_service, get_languages, require_admin
 
 router = APIRouter()
 
+def _event_stream(events: AsyncIterator[Dict]) -> StreamingResponse:
+    """Send service events as Server-Sent Events"""
+    async def format_events() -> AsyncIterator[str]:
+        async for event in events:
+            yield f"event: {event['event']}\ndata: {json.dumps(event['data'], ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        format_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/stats")
+async def get_content_stats(
+    content_service: PlayerContentService = Depends(get_content_service)
+) -> Dict:
+    """Get request coalescing and response cache counters"""
+    return content_service.get_stats()
+
 @router.get("/images/{team}/{player}")
 async def get_player_images(
     team: str,
@@ -28,12 +49,18 @@ async def get_player_news(
     max_chars_summary_en: Optional[int] = Query(50, ge=1),
     max_chars_summary_ja: Optional[int] = Query(65, ge=1),
     max_chars_summary_es: Optional[int] = Query(65, ge=1),
+    translation_mode: Literal["quality", "fast"] = Query(
+        "quality", description="'fast' shortens English sources locally instead of asking the model"
+    ),
+    langs: List[str] = Depends(get_languages),
     content_service: PlayerContentService = Depends(get_content_service)
 ):
     """
     Get news about a player
     - Translation parameters for title and summary in English, Japanese, and Spanish
     - Configurable maximum characters for each language
+    - Only the languages in `langs` (or Accept-Language) are translated
+    - English sources within the English limit are returned without a model call
     """
     news = await content_service.get_player_news(
         player,
@@ -43,10 +70,47 @@ async def get_player_news(
         max_chars_title_es=max_chars_title_es,
         max_chars_summary_en=max_chars_summary_en,
         max_chars_summary_ja=max_chars_summary_ja,
-        max_chars_summary_es=max_chars_summary_es
+        max_chars_summary_es=max_chars_summary_es,
+        langs=langs,
+        translation_mode=translation_mode
     )
     return {"news": news}
 
+@router.get("/news/{player}/stream")
+async def stream_player_news(
+    player: str,
+    limit: Optional[int] = Query(10, ge=1, le=50),
+    max_chars_title_en: Optional[int] = Query(50, ge=1),
+    max_chars_title_ja: Optional[int] = Query(30, ge=1),
+    max_chars_title_es: Optional[int] = Query(45, ge=1),
+    max_chars_summary_en: Optional[int] = Query(50, ge=1),
+    max_chars_summary_ja: Optional[int] = Query(65, ge=1),
+    max_chars_summary_es: Optional[int] = Query(65, ge=1),
+    translation_mode: Literal["quality", "fast"] = Query(
+        "quality", description="'fast' shortens English sources locally instead of asking the model"
+    ),
+    langs: List[str] = Depends(get_languages),
+    content_service: PlayerContentService = Depends(get_content_service)
+) -> StreamingResponse:
+    """
+    Stream news about a player as Server-Sent Events
+    - `items` event: untranslated results as soon as the search API answers
+    - `translation` events: {"index", "title_<lang>" or "snippet_<lang>"} patches as each translation completes
+    - `done` event once every item has been patched
+    """
+    return _event_stream(content_service.stream_player_news(
+        player,
+        limit=limit,
+        max_chars_title_en=max_chars_title_en,
+        max_chars_title_ja=max_chars_title_ja,
+        max_chars_title_es=max_chars_title_es,
+        max_chars_summary_en=max_chars_summary_en,
+        max_chars_summary_ja=max_chars_summary_ja,
+        max_chars_summary_es=max_chars_summary_es,
+        langs=langs,
+        translation_mode=translation_mode
+    ))
+
 @router.get("/search/news")
 async def search_news(
     query: str = Query(..., description="Search query string"),
@@ -57,12 +121,18 @@ async def search_news(
     max_chars_summary_en: Optional[int] = Query(50, ge=1),
     max_chars_summary_ja: Optional[int] = Query(65, ge=1),
     max_chars_summary_es: Optional[int] = Query(65, ge=1),
+    translation_mode: Literal["quality", "fast"] = Query(
+        "quality", description="'fast' shortens English sources locally instead of asking the model"
+    ),
+    langs: List[str] = Depends(get_languages),
     content_service: PlayerContentService = Depends(get_content_service)
 ) -> List[Dict]:
     """
     Search news with a custom query
     - Translation parameters for title and summary in English, Japanese, and Spanish
     - Configurable maximum characters for each language
+    - Only the languages in `langs` (or Accept-Language) are translated
+    - English sources within the English limit are returned without a model call
     """
     return await content_service.search_news(
         query,
@@ -72,9 +142,46 @@ async def search_news(
         max_chars_title_es=max_chars_title_es,
         max_chars_summary_en=max_chars_summary_en,
         max_chars_summary_ja=max_chars_summary_ja,
-        max_chars_summary_es=max_chars_summary_es
+        max_chars_summary_es=max_chars_summary_es,
+        langs=langs,
+        translation_mode=translation_mode
     )
 
+@router.get("/search/news/stream")
+async def stream_search_news(
+    query: str = Query(..., description="Search query string"),
+    limit: Optional[int] = Query(10, ge=1, le=100),
+    max_chars_title_en: Optional[int] = Query(50, ge=1),
+    max_chars_title_ja: Optional[int] = Query(30, ge=1),
+    max_chars_title_es: Optional[int] = Query(45, ge=1),
+    max_chars_summary_en: Optional[int] = Query(50, ge=1),
+    max_chars_summary_ja: Optional[int] = Query(65, ge=1),
+    max_chars_summary_es: Optional[int] = Query(65, ge=1),
+    translation_mode: Literal["quality", "fast"] = Query(
+        "quality", description="'fast' shortens English sources locally instead of asking the model"
+    ),
+    langs: List[str] = Depends(get_languages),
+    content_service: PlayerContentService = Depends(get_content_service)
+) -> StreamingResponse:
+    """
+    Stream news search results as Server-Sent Events
+    - `items` event: untranslated results as soon as the search API answers
+    - `translation` events: {"index", "title_<lang>" or "snippet_<lang>"} patches as each translation completes
+    - `done` event once every item has been patched
+    """
+    return _event_stream(content_service.stream_search_news(
+        query,
+        limit=limit,
+        max_chars_title_en=max_chars_title_en,
+        max_chars_title_ja=max_chars_title_ja,
+        max_chars_title_es=max_chars_title_es,
+        max_chars_summary_en=max_chars_summary_en,
+        max_chars_summary_ja=max_chars_summary_ja,
+        max_chars_summary_es=max_chars_summary_es,
+        langs=langs,
+        translation_mode=translation_mode
+    ))
+
 @router.get("/videos/{player}")
 async def get_player_videos(
     player: str,
@@ -87,12 +194,18 @@ async def get_player_videos(
     max_chars_description_en: Optional[int] = Query(50, ge=1),
     max_chars_description_ja: Optional[int] = Query(65, ge=1),
     max_chars_description_es: Optional[int] = Query(65, ge=1),
+    translation_mode: Literal["quality", "fast"] = Query(
+        "quality", description="'fast' shortens English sources locally instead of asking the model"
+    ),
+    langs: List[str] = Depends(get_languages),
     content_service: PlayerContentService = Depends(get_content_service)
 ):
     """
     Get YouTube videos about a player
     - Translation parameters for title and description in English, Japanese, and Spanish
     - Configurable maximum characters for each language
+    - Only the languages in `langs` (or Accept-Language) are translated
+    - English sources within the English limit are returned without a model call
     """
     videos = await content_service.get_player_videos(
         player,
@@ -104,10 +217,51 @@ async def get_player_videos(
         max_chars_title_es=max_chars_title_es,
         max_chars_description_en=max_chars_description_en,
         max_chars_description_ja=max_chars_description_ja,
-        max_chars_description_es=max_chars_description_es
+        max_chars_description_es=max_chars_description_es,
+        langs=langs,
+        translation_mode=translation_mode
     )
     return {"videos": videos}
 
+@router.get("/videos/{player}/stream")
+async def stream_player_videos(
+    player: str,
+    limit: Optional[int] = Query(10, ge=1, le=50),
+    min_duration: Optional[int] = Query(60, ge=0),
+    max_duration: Optional[int] = Query(1200, ge=0),
+    max_chars_title_en: Optional[int] = Query(50, ge=1),
+    max_chars_title_ja: Optional[int] = Query(30, ge=1),
+    max_chars_title_es: Optional[int] = Query(45, ge=1),
+    max_chars_description_en: Optional[int] = Query(50, ge=1),
+    max_chars_description_ja: Optional[int] = Query(65, ge=1),
+    max_chars_description_es: Optional[int] = Query(65, ge=1),
+    translation_mode: Literal["quality", "fast"] = Query(
+        "quality", description="'fast' shortens English sources locally instead of asking the model"
+    ),
+    langs: List[str] = Depends(get_languages),
+    content_service: PlayerContentService = Depends(get_content_service)
+) -> StreamingResponse:
+    """
+    Stream YouTube videos about a player as Server-Sent Events
+    - `items` event: untranslated results as soon as the search API answers
+    - `translation` events: {"index", "title_<lang>" or "description_<lang>"} patches as each translation completes
+    - `done` event once every item has been patched
+    """
+    return _event_stream(content_service.stream_player_videos(
+        player,
+        limit=limit,
+        min_duration=min_duration,
+        max_duration=max_duration,
+        max_chars_title_en=max_chars_title_en,
+        max_chars_title_ja=max_chars_title_ja,
+        max_chars_title_es=max_chars_title_es,
+        max_chars_description_en=max_chars_description_en,
+        max_chars_description_ja=max_chars_description_ja,
+        max_chars_description_es=max_chars_description_es,
+        langs=langs,
+        translation_mode=translation_mode
+    ))
+
 @router.get("/videos/{player}/homeruns")
 async def get_player_hr_videos(
     player: str,
@@ -115,24 +269,124 @@ async def get_player_hr_videos(
     max_chars_title_en: Optional[int] = Query(50, ge=1),
     max_chars_title_ja: Optional[int] = Query(30, ge=1),
     max_chars_title_es: Optional[int] = Query(45, ge=1),
+    translation_mode: Literal["quality", "fast"] = Query(
+        "quality", description="'fast' shortens English sources locally instead of asking the model"
+    ),
+    langs: List[str] = Depends(get_languages),
     content_service: PlayerContentService = Depends(get_content_service)
 ):
     """
     Get MLB home run videos for a player
     - Translation parameters for title in English, Japanese, and Spanish
     - Configurable maximum characters for each language
+    - Only the languages in `langs` (or Accept-Language) are translated
+    - English sources within the English limit are returned without a model call
     """
     videos = await content_service.get_player_hr_videos(
         player,
         limit=limit,
         max_chars_title_en=max_chars_title_en,
         max_chars_title_ja=max_chars_title_ja,
-        max_chars_title_es=max_chars_title_es
+        max_chars_title_es=max_chars_title_es,
+        langs=langs,
+        translation_mode=translation_mode
     )
     if not videos:
         raise HTTPException(status_code=404, detail="No home run videos found for player")
     return {"videos": videos}
 
+@router.get("/homeruns")
+async def query_homeruns(
+    season: Optional[List[int]] = Query(None, description="Seasons to include (repeatable)"),
+    min_exit_velocity: Optional[float] = Query(None),
+    max_exit_velocity: Optional[float] = Query(None),
+    min_launch_angle: Optional[float] = Query(None),
+    max_launch_angle: Optional[float] = Query(None),
+    min_hit_distance: Optional[float] = Query(None),
+    max_hit_distance: Optional[float] = Query(None),
+    player: Optional[str] = Query(None, description="Batter name"),
+    sort_by: Optional[Literal["exit_velocity", "launch_angle", "hit_distance"]] = Query(None),
+    order: Literal["desc", "asc"] = Query("desc"),
+    limit: Optional[int] = Query(10, ge=1, le=100),
+    content_service: PlayerContentService = Depends(get_content_service)
+) -> Dict:
+    """
+    Query MLB home runs across all loaded seasons, including the postseason
+    - Range filters on exit velocity, launch angle and hit distance
+    - Top-k by any metric with `sort_by` and `order`
+    """
+    return content_service.query_homeruns(
+        seasons=season,
+        min_exit_velocity=min_exit_velocity,
+        max_exit_velocity=max_exit_velocity,
+        min_launch_angle=min_launch_angle,
+        max_launch_angle=max_launch_angle,
+        min_hit_distance=min_hit_distance,
+        max_hit_distance=max_hit_distance,
+        player=player,
+        sort_by=sort_by,
+        descending=order == "desc",
+        limit=limit
+    )
+
+@router.get("/homeruns/search")
+async def search_homeruns(
+    q: str = Query(..., min_length=1, description='Terms, "quoted phrases" and prefix* terms, all required'),
+    season: Optional[List[int]] = Query(None, description="Seasons to include (repeatable)"),
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(10, ge=1, le=100),
+    content_service: PlayerContentService = Depends(get_content_service)
+) -> Dict:
+    """
+    Full-text search over home run titles
+    - `walk-off grand slam` matches titles containing both "walk off" and "grand slam"
+    - `"grand sl*"` matches a phrase whose last word is a prefix
+    - Results are in file order; page with `offset` and `limit`
+    """
+    return content_service.search_homeruns(q, seasons=season, offset=offset, limit=limit)
+
+@router.get("/homeruns/similar")
+async def get_similar_homeruns(
+    play_id: List[str] = Query(..., description="Play ids (repeatable for a batch)"),
+    k: Optional[int] = Query(10, ge=1, le=50),
+    content_service: PlayerContentService = Depends(get_content_service)
+) -> Dict:
+    """
+    Find the home runs most similar to one or more plays
+    - Similarity is the distance between standardized exit velocity, launch angle and hit distance
+    - Plays that are unknown or missing a metric are listed under `missing`
+    """
+    if len(play_id) > 100:
+        raise HTTPException(status_code=422, detail="At most 100 play ids per request")
+    return content_service.get_similar_homeruns(play_id, k=k)
+
+@router.get("/homeruns/players/{player}/stats")
+async def get_player_hr_stats(
+    player: str,
+    content_service: PlayerContentService = Depends(get_content_service)
+) -> Dict:
+    """
+    Get per-season home run aggregates for a player
+    - Count plus mean, max and 25/50/75/90th percentiles of exit velocity, launch angle and distance
+    - Regular season and postseason files are summarized separately
+    """
+    players = content_service.get_player_hr_stats(player)
+    if not players:
+        raise HTTPException(status_code=404, detail="No home runs found for player")
+    return {"players": players}
+
+@router.post("/homeruns/reload", dependencies=[Depends(require_admin)])
+async def reload_homeruns(
+    content_service: PlayerContentService = Depends(get_content_service)
+) -> Dict:
+    """
+    Load season files added to the home run snapshot since startup
+    - Requires the X-Admin-Token header to match ADMIN_TOKEN
+    - Applies to the worker handling the request right away; the other workers pick the
+      change up from the snapshot manifest within HR_RELOAD_CHECK_INTERVAL
+    """
+    return await content_service.reload_mlb_hr_data()
+
 @router.get("/search/videos")
 async def search_videos(
     query: str = Query(..., description="Search query string"),
@@ -145,12 +399,18 @@ async def search_videos(
     max_chars_description_en: Optional[int] = Query(50, ge=1),
     max_chars_description_ja: Optional[int] = Query(65, ge=1),
     max_chars_description_es: Optional[int] = Query(65, ge=1),
+    translation_mode: Literal["quality", "fast"] = Query(
+        "quality", description="'fast' shortens English sources locally instead of asking the model"
+    ),
+    langs: List[str] = Depends(get_languages),
     content_service: PlayerContentService = Depends(get_content_service)
 ) -> List[Dict]:
     """
     Search MLB videos with a custom query
     - Translation parameters for title and description in English, Japanese, and Spanish
     - Configurable maximum characters for each language
+    - Only the languages in `langs` (or Accept-Language) are translated
+    - English sources within the English limit are returned without a model call
     """
     return await content_service.search_videos(
         query,
@@ -162,7 +422,46 @@ async def search_videos(
         max_chars_title_es=max_chars_title_es,
         max_chars_description_en=max_chars_description_en,
         max_chars_description_ja=max_chars_description_ja,
-        max_chars_description_es=max_chars_description_es
+        max_chars_description_es=max_chars_description_es,
+        langs=langs,
+        translation_mode=translation_mode
     )
 
-
+@router.get("/search/videos/stream")
+async def stream_search_videos(
+    query: str = Query(..., description="Search query string"),
+    limit: Optional[int] = Query(10, ge=1, le=50),
+    min_duration: Optional[int] = Query(60, ge=0),
+    max_duration: Optional[int] = Query(1200, ge=0),
+    max_chars_title_en: Optional[int] = Query(50, ge=1),
+    max_chars_title_ja: Optional[int] = Query(30, ge=1),
+    max_chars_title_es: Optional[int] = Query(45, ge=1),
+    max_chars_description_en: Optional[int] = Query(50, ge=1),
+    max_chars_description_ja: Optional[int] = Query(65, ge=1),
+    max_chars_description_es: Optional[int] = Query(65, ge=1),
+    translation_mode: Literal["quality", "fast"] = Query(
+        "quality", description="'fast' shortens English sources locally instead of asking the model"
+    ),
+    langs: List[str] = Depends(get_languages),
+    content_service: PlayerContentService = Depends(get_content_service)
+) -> StreamingResponse:
+    """
+    Stream MLB video search results as Server-Sent Events
+    - `items` event: untranslated results as soon as the search API answers
+    - `translation` events: {"index", "title_<lang>" or "description_<lang>"} patches as each translation completes
+    - `done` event once every item has been patched
+    """
+    return _event_stream(content_service.stream_search_videos(
+        query,
+        limit=limit,
+        min_duration=min_duration,
+        max_duration=max_duration,
+        max_chars_title_en=max_chars_title_en,
+        max_chars_title_ja=max_chars_title_ja,
+        max_chars_title_es=max_chars_title_es,
+        max_chars_description_en=max_chars_description_en,
+        max_chars_description_ja=max_chars_description_ja,
+        max_chars_description_es=max_chars_description_es,
+        langs=langs,
+        translation_mode=translation_mode
+    ))
@@ -1,10 +1,40 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Optional, Dict
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import Optional, Dict, List, Literal
 from app.services.info_service import PlayerInfoService
-from app.api.dependencies.dependencies import get_info_service
+from app.services.profile_service import PlayerProfileService
+from app.api.dependencies.dependencies import get_info_service, get_languages, get_profile_service
 
 router = APIRouter()
 
+@router.get("/search")
+async def search_players(
+    q: str = Query(..., min_length=1, description="Full or partial player name"),
+    limit: Optional[int] = Query(10, ge=1, le=50),
+    info_service: PlayerInfoService = Depends(get_info_service)
+) -> Dict:
+    """
+    Autocomplete player names
+    - Accent-insensitive and typo-tolerant ("acuna" finds Ronald Acuña Jr.)
+    - Matches full names, nicknames and box score names, best match first
+    """
+    players = await info_service.search_players(q, limit=limit)
+    return {"players": players}
+
+@router.get("/info")
+async def get_players_info(
+    player: List[str] = Query(..., description="Player names or MLB ids (repeatable)"),
+    info_service: PlayerInfoService = Depends(get_info_service)
+) -> Dict:
+    """
+    Get information and headshots for many players in one request
+    - Names are resolved against one roster snapshot and details fetched in one upstream round
+    - Players that cannot be resolved carry an `error` instead of failing the request
+    """
+    if len(player) > 100:
+        raise HTTPException(status_code=422, detail="At most 100 players per request")
+    players = await info_service.get_players_info(player)
+    return {"players": players}
+
 @router.get("/info/{player}")
 async def get_player_info(
     player: str,
@@ -43,3 +73,40 @@ async def get_team_logo(
     if not logo_url:
         raise HTTPException(status_code=404, detail="Team logo not found")
     return {"logo_url": logo_url}
+
+@router.get("/teams")
+async def get_teams(
+    info_service: PlayerInfoService = Depends(get_info_service)
+) -> Dict:
+    """
+    List every MLB team with its abbreviation, names and logo URL
+    """
+    teams = await info_service.get_teams()
+    if not teams:
+        raise HTTPException(status_code=503, detail="Team directory unavailable")
+    return {"teams": teams}
+
+@router.get("/profile/{player}")
+async def get_player_profile(
+    player: str,
+    team: Optional[str] = Query(None, description="Team the player's images are filed under"),
+    limit: Optional[int] = Query(5, ge=1, le=20),
+    translation_mode: Literal["quality", "fast"] = Query(
+        "quality", description="'fast' shortens English sources locally instead of asking the model"
+    ),
+    langs: List[str] = Depends(get_languages),
+    profile_service: PlayerProfileService = Depends(get_profile_service)
+) -> Dict:
+    """
+    Get everything a player page needs in one request
+    - Info, headshot, images, news, videos and home run videos are gathered concurrently
+    - News, video and home run titles are translated in one shared batch
+    - Sections that miss their deadline or fail are returned empty and listed in `degraded`
+    """
+    return await profile_service.get_player_profile(
+        player,
+        team=team,
+        limit=limit,
+        langs=langs,
+        translation_mode=translation_mode
+    )
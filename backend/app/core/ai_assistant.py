@@ -1,10 +1,20 @@
 from google import genai
-from google.genai.types import Tool, GenerateContentConfig, GoogleSearch
-from typing import List, Optional, Dict, Any
+from google.genai.types import Tool, GenerateContentConfig, GenerateContentResponse, GoogleSearch
+from typing import AsyncIterator, List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import logging
+import threading
+
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# google-genai 0.5.0 sends every request, including client.aio ones, with blocking `requests`
+# calls; client.aio only wraps them in the default executor. Model calls get their own bounded
+# pool instead, so they cannot starve other to_thread work and their concurrency has a hard cap.
+_model_executor = ThreadPoolExecutor(max_workers=settings.MODEL_CALL_MAX_WORKERS, thread_name_prefix="genai")
+
 class AIAssistant:
     def __init__(self, api_key: str, model_id: str = "gemini-2.0-flash-exp"):
         """Initialize the AI Assistant with API credentials and configuration."""
@@ -12,6 +22,7 @@ class AIAssistant:
         self.model_id = model_id
         self.client = genai.Client(api_key=self.api_key)
         self.chat = None
+        self.generation_config = None
         self.system_instruction = None
 
     def load_system_prompt(self, file_path: str, replacements: Dict[str, str] = None) -> None:
@@ -28,23 +39,27 @@ class AIAssistant:
             logger.error(f"System prompt file not found: {file_path}")
             raise FileNotFoundError(f"System prompt file not found: {file_path}")
 
-    def initialize_chat(self, enable_google_search: bool = False, streaming: bool = False, temperature: float = 0.5, json_output: bool = False) -> None:
-        """Initialize the chat session with specified configuration."""
+    def _build_config(self, enable_google_search: bool, temperature: float, json_output: bool) -> GenerateContentConfig:
+        """Build the generation config shared by chat sessions and stateless calls."""
         if not self.system_instruction:
             raise ValueError("System prompt not loaded. Call load_system_prompt first.")
 
         google_search_tool = Tool(
             google_search = GoogleSearch()
         )
-        
+
+        return GenerateContentConfig(
+            system_instruction=self.system_instruction,
+            temperature=temperature,
+            tools=[google_search_tool] if enable_google_search else [],
+            response_modalities=["TEXT"],
+            response_mime_type="application/json" if json_output else "text/plain",
+        )
+
+    def initialize_chat(self, enable_google_search: bool = False, streaming: bool = False, temperature: float = 0.5, json_output: bool = False) -> None:
+        """Initialize the chat session with specified configuration."""
         try:
-            config = GenerateContentConfig(
-                system_instruction=self.system_instruction,
-                temperature=temperature,
-                tools=[google_search_tool] if enable_google_search else [],
-                response_modalities=["TEXT"],
-                response_mime_type="application/json" if json_output else "text/plain",
-            )
+            config = self._build_config(enable_google_search, temperature, json_output)
             
             if streaming:
                 self.chat = self.client.aio.chats.create(
@@ -60,6 +75,90 @@ class AIAssistant:
             logger.error(f"Error initializing chat: {str(e)}")
             raise
 
+    def initialize_stateless(self, enable_google_search: bool = False, temperature: float = 0.5, json_output: bool = False) -> None:
+        """Configure single-shot generate_content calls that carry no chat history."""
+        try:
+            self.generation_config = self._build_config(enable_google_search, temperature, json_output)
+        except Exception as e:
+            logger.error(f"Error initializing stateless generation: {str(e)}")
+            raise
+
+    def generate(self, message: str) -> GenerateContentResponse:
+        """Send one message with only the system instruction as context."""
+        if not self.generation_config:
+            raise RuntimeError("Stateless generation not initialized. Call initialize_stateless first.")
+
+        return self.client.models.generate_content(
+            model=self.model_id,
+            contents=message,
+            config=self.generation_config,
+        )
+
+    async def generate_async(self, message: str) -> GenerateContentResponse:
+        """
+        Async variant of generate(), run on the model-call thread pool.
+        At most MODEL_CALL_MAX_WORKERS calls run at once; further calls wait for a free thread.
+        """
+        if not self.generation_config:
+            raise RuntimeError("Stateless generation not initialized. Call initialize_stateless first.")
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_model_executor, self.generate, message)
+
+    async def generate_stream_async(self, message: str) -> AsyncIterator[str]:
+        """
+        Stream the text of a stateless call chunk by chunk as the model produces it.
+        The SDK reads the stream with blocking I/O (client.aio included), so it is consumed on the
+        model-call thread pool and handed to the event loop through a queue. When the consumer
+        stops early (e.g. a timeout), the worker drops the stream at its next chunk.
+        """
+        if not self.generation_config:
+            raise RuntimeError("Stateless generation not initialized. Call initialize_stateless first.")
+
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue()
+        stopped = threading.Event()
+
+        def put(kind: str, value: Any = None) -> None:
+            if not stopped.is_set():
+                try:
+                    loop.call_soon_threadsafe(chunks.put_nowait, (kind, value))
+                except RuntimeError:
+                    # The event loop closed while the stream was still being read
+                    stopped.set()
+
+        def produce() -> None:
+            stream = None
+            try:
+                stream = self.client.models.generate_content_stream(
+                    model=self.model_id,
+                    contents=message,
+                    config=self.generation_config,
+                )
+                for chunk in stream:
+                    if stopped.is_set():
+                        break
+                    if chunk.text:
+                        put("text", chunk.text)
+                put("end")
+            except Exception as e:
+                put("error", e)
+            finally:
+                if hasattr(stream, "close"):
+                    stream.close()
+
+        loop.run_in_executor(_model_executor, produce)
+        try:
+            while True:
+                kind, value = await chunks.get()
+                if kind == "end":
+                    return
+                if kind == "error":
+                    raise value
+                yield value
+        finally:
+            stopped.set()
+
     async def send_message_stream(self, message: str) -> Dict[str, Any]:
         """Send a message to the AI and return the response with metadata."""
         if not self.chat:
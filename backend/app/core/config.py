@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 
 class Settings(BaseSettings):
     # Database settings
@@ -21,6 +22,56 @@ class Settings(BaseSettings):
     # Add ENV to your existing settings
     ENV: str = "development"
 
+    # Token expected in the X-Admin-Token header of maintenance endpoints; they are disabled when unset
+    ADMIN_TOKEN: Optional[str] = None
+
+    # Outbound HTTP client settings
+    HTTP_TIMEOUT: float = 10.0
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP_MAX_RETRIES: int = 2
+    HTTP_RETRY_BACKOFF: float = 0.25
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+
+    # Custom Search / YouTube response cache settings
+    CONTENT_CACHE_TTL: float = 300.0
+    CONTENT_CACHE_STALE_TTL: float = 1800.0
+    CONTENT_CACHE_MAX_ENTRIES: int = 1024
+
+    # MLB roster index and team directory used for name lookups
+    ROSTER_SEASON: int = 2024
+    ROSTER_REFRESH_INTERVAL: float = 21600.0
+    TEAM_REFRESH_INTERVAL: float = 86400.0
+
+    # Player profile deadlines, in seconds
+    PROFILE_SECTION_TIMEOUT: float = 8.0
+    PROFILE_TRANSLATION_TIMEOUT: float = 6.0
+
+    # Home run dataset snapshot written by ingest_homeruns.py
+    HR_SNAPSHOT_DIR: str = "data/homeruns"
+    # Seconds between snapshot manifest checks, so every worker process picks up new season files
+    HR_RELOAD_CHECK_INTERVAL: float = 60.0
+
+    # Translation store settings (defaults to the application database when no URL is set)
+    TRANSLATION_STORE_URL: Optional[str] = None
+    TRANSLATION_CACHE_MAX_ENTRIES: int = 20000
+
+    # Cross-request translation batching
+    TRANSLATION_BATCH_MAX_ITEMS: int = 40
+    TRANSLATION_BATCH_MIN_ITEMS: int = 4
+    TRANSLATION_BATCH_MAX_TOKENS: int = 6000
+    TRANSLATION_TARGET_CALL_LATENCY_MS: float = 3000.0
+    TRANSLATION_BATCH_MAX_WAIT_MS: float = 30.0
+    TRANSLATION_MAX_CONCURRENCY: int = 8
+    TRANSLATION_CALL_TIMEOUT: float = 20.0
+    TRANSLATION_MAX_RETRIES: int = 2
+    TRANSLATION_RETRY_BACKOFF: float = 0.5
+    TRANSLATION_HEDGING_ENABLED: bool = False
+    TRANSLATION_HEDGE_PERCENTILE: float = 95.0
+
+    # Worker threads for blocking Gemini SDK calls (google-genai 0.5.0 has no async HTTP transport)
+    MODEL_CALL_MAX_WORKERS: int = 16
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
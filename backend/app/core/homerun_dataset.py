@@ -0,0 +1,394 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from collections import defaultdict
+import copy
+import logging
+import math
+import re
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from app.core.text_utils import fold_name
+from app.core.title_index import TitleIndex
+
+logger = logging.getLogger(__name__)
+
+# Columns kept from the MLB home-run CSVs, plus the season taken from the file name
+HR_COLUMNS = ['season', 'play_id', 'title', 'ExitVelocity', 'LaunchAngle', 'HitDistance', 'video']
+TEXT_COLUMNS = ['season', 'play_id', 'title', 'video']
+METRIC_COLUMNS = ['ExitVelocity', 'LaunchAngle', 'HitDistance']
+# API names of the metric columns
+METRIC_FIELDS = {
+    'exit_velocity': 'ExitVelocity',
+    'launch_angle': 'LaunchAngle',
+    'hit_distance': 'HitDistance',
+}
+
+# Percentiles reported (as p25, p50, ...) next to the mean and max of each metric
+AGGREGATE_PERCENTILES = [0.25, 0.5, 0.75, 0.9]
+
+# Season file keys: a year, optionally followed by a suffix ("2024", "2024-postseason")
+_SOURCE_KEY_PATTERN = re.compile(r"^(?P<season>\d{4})(?:-[A-Za-z0-9_-]+)?$")
+# "Aaron Judge homers (52) on a fly ball ..." / "Juan Soto hits a grand slam (2) ..."
+_BATTER_PATTERN = re.compile(r"^(?P<batter>.+?)\s+(?:homers|hits)\b", re.IGNORECASE)
+
+
+def source_season(key: str) -> str:
+    """
+    Season year of a season file key.
+    Raises:
+        ValueError: If the key does not start with a four-digit year
+    """
+    match = _SOURCE_KEY_PATTERN.match(key or "")
+    if not match:
+        raise ValueError(f"Invalid season file key {key!r}: expected a year, optionally with a suffix (e.g. 2024-postseason)")
+    return match.group("season")
+
+
+def parse_batter(title: str) -> str:
+    """Batter name at the start of a home-run title, or '' if the title has another shape"""
+    match = _BATTER_PATTERN.match(title or "")
+    return match.group("batter") if match else ""
+
+
+def columns_from_frame(frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Typed NumPy columns from a home-run DataFrame that has a season column"""
+    columns = {}
+    for column in TEXT_COLUMNS:
+        columns[column] = frame[column].fillna('').astype(str).to_numpy(dtype=str)
+    for column in METRIC_COLUMNS:
+        columns[column] = pd.to_numeric(frame[column], errors='coerce').to_numpy(dtype=np.float64)
+    return columns
+
+
+class HomeRunDataset:
+    def __init__(self, sources: Optional[Dict[str, Dict[str, np.ndarray]]] = None):
+        """
+        Column-oriented home-run table with lookup indexes and per-player aggregates.
+        Adding a season file extends the indexes and aggregates instead of rebuilding them.
+        Args:
+            sources: Season file key -> one NumPy array per HR_COLUMNS entry
+        """
+        self.columns = {column: np.empty(0, dtype=str) for column in TEXT_COLUMNS}
+        self.columns.update({column: np.empty(0, dtype=np.float64) for column in METRIC_COLUMNS})
+        self.size = 0
+        self.source_keys: List[str] = []
+        self.row_sources = np.empty(0, dtype=str)
+        self.row_batters = np.empty(0, dtype=str)
+        self.season_years = np.empty(0, dtype=np.int16)
+
+        self.batter_rows: Dict[str, np.ndarray] = {}
+        # Name token -> batters carrying it, so "judge" or "ohtani" find the full name
+        self.batter_tokens: Dict[str, set] = defaultdict(set)
+        self.batter_display: Dict[str, str] = {}
+        # Folded batter name -> season file key -> Statcast summary
+        self.aggregates: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        self.play_rows: Dict[str, int] = {}
+        self.title_index = TitleIndex()
+        self.similarity_tree: Optional[cKDTree] = None
+
+        if sources:
+            self._append(sources)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "HomeRunDataset":
+        """Build from a DataFrame with a season column, one season file per season"""
+        if frame.empty:
+            return cls()
+        return cls({
+            str(season): columns_from_frame(frame[frame['season'] == season])
+            for season in frame['season'].unique()
+        })
+
+    def copy(self) -> "HomeRunDataset":
+        """
+        Copy that can take new season files while this dataset keeps serving readers.
+        Arrays are shared (appending replaces them), only the index containers are copied.
+        """
+        dataset = copy.copy(self)
+        dataset.columns = dict(self.columns)
+        dataset.source_keys = list(self.source_keys)
+        dataset.batter_rows = dict(self.batter_rows)
+        dataset.batter_tokens = defaultdict(set, {token: set(batters) for token, batters in self.batter_tokens.items()})
+        dataset.batter_display = dict(self.batter_display)
+        dataset.aggregates = defaultdict(dict, {batter: dict(seasons) for batter, seasons in self.aggregates.items()})
+        dataset.play_rows = dict(self.play_rows)
+        dataset.title_index = self.title_index.copy()
+        return dataset
+
+    def add_source(self, key: str, columns: Dict[str, np.ndarray]) -> None:
+        """Append a new season file, indexing and aggregating only its rows"""
+        source_season(key)
+        if key in self.source_keys:
+            raise ValueError(f"Season file {key} is already loaded")
+        self._append({key: columns})
+
+    def _append(self, sources: Dict[str, Dict[str, np.ndarray]]) -> None:
+        """Concatenate season files onto the columns and index the new rows"""
+        start = self.size
+        for column in HR_COLUMNS:
+            self.columns[column] = np.concatenate(
+                [self.columns[column]] + [columns[column] for columns in sources.values()]
+            )
+        self.size = len(self.columns['play_id'])
+
+        lengths = [len(columns['play_id']) for columns in sources.values()]
+        self.source_keys.extend(sources)
+        self.row_sources = np.concatenate([self.row_sources, np.repeat(list(sources), lengths)])
+        self.season_years = np.concatenate([
+            self.season_years, self.columns['season'][start:].astype(np.int16)
+        ])
+
+        self.play_rows.update(
+            (play_id, row) for row, play_id in enumerate(self.columns['play_id'][start:].tolist(), start)
+        )
+        self._index_batters(start)
+        self.title_index.add(self.columns['title'][start:], start)
+        self._aggregate(start)
+        self._build_similarity_index()
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame view of the columns"""
+        return pd.DataFrame({column: self.columns[column] for column in HR_COLUMNS}, copy=False)
+
+    def _index_batters(self, start: int) -> None:
+        """Map each folded batter name to the (ascending) row positions of their home runs"""
+        positions = defaultdict(list)
+        batters = []
+        for row, title in enumerate(self.columns['title'][start:], start):
+            display = parse_batter(title)
+            batter = fold_name(display)
+            batters.append(batter)
+            if batter:
+                positions[batter].append(row)
+                self.batter_display.setdefault(batter, display)
+        self.row_batters = np.concatenate([self.row_batters, np.asarray(batters, dtype=str)])
+
+        for batter, rows in positions.items():
+            rows = np.asarray(rows, dtype=np.int32)
+            if batter in self.batter_rows:
+                rows = np.concatenate([self.batter_rows[batter], rows])
+            self.batter_rows[batter] = rows
+            for token in batter.split():
+                self.batter_tokens[token].add(batter)
+
+    def _aggregate(self, start: int) -> None:
+        """Per batter and season file: count, mean, max and percentiles of each metric"""
+        frame = pd.DataFrame({
+            'batter': self.row_batters[start:],
+            'source': self.row_sources[start:],
+            **{column: self.columns[column][start:] for column in METRIC_COLUMNS}
+        })
+        frame = frame[frame['batter'] != '']
+        if frame.empty:
+            return
+
+        counts = frame.groupby(['batter', 'source'], sort=False).size()
+        grouped = frame.groupby(['batter', 'source'], sort=False)[METRIC_COLUMNS]
+        # Cythonized group reductions; groupby().describe() is orders of magnitude slower
+        stats = {'mean': grouped.mean(), 'max': grouped.max()}
+        quantiles = grouped.quantile(AGGREGATE_PERCENTILES)
+        for q in AGGREGATE_PERCENTILES:
+            stats[f"p{round(q * 100)}"] = quantiles.xs(q, level=-1)
+        tables = {name: table.to_dict('index') for name, table in stats.items()}
+
+        for (batter, source), count in counts.items():
+            entry = {
+                'season': int(source_season(source)),
+                'source': source,
+                'home_runs': int(count)
+            }
+            for field, column in METRIC_FIELDS.items():
+                entry[field] = {
+                    name: _clean_float(round(table[(batter, source)][column], 2))
+                    for name, table in tables.items()
+                }
+            self.aggregates[batter][source] = entry
+
+    def _build_similarity_index(self) -> None:
+        """
+        KD-tree over the standardized (exit velocity, launch angle, distance) of every row
+        that has all three. Rebuilt whenever a season file is added, since the scaling changes.
+        """
+        metrics = np.column_stack([self.columns[column] for column in METRIC_COLUMNS])
+        complete = ~np.isnan(metrics).any(axis=1)
+        self.similarity_rows = np.flatnonzero(complete).astype(np.int32)
+        if not len(self.similarity_rows):
+            self.similarity_tree = None
+            return
+
+        points = metrics[complete]
+        std = points.std(axis=0)
+        self.similarity_points = (points - points.mean(axis=0)) / np.where(std > 0, std, 1.0)
+        # Dataset row -> position in the tree, -1 for rows missing a metric
+        self.similarity_positions = np.full(self.size, -1, dtype=np.int32)
+        self.similarity_positions[self.similarity_rows] = np.arange(len(self.similarity_rows), dtype=np.int32)
+        self.similarity_tree = cKDTree(self.similarity_points)
+
+    def similar(self, play_ids: Sequence[str], k: int = 10) -> Dict[str, List[Tuple[int, float]]]:
+        """
+        Nearest home runs by launch metrics for each play, answered in one batched tree query.
+        Args:
+            play_ids: Plays to find neighbours for
+            k: Neighbours per play, excluding the play itself
+        Returns:
+            play_id -> [(row, standardized distance)], closest first; unknown plays and
+            plays missing a metric are left out
+        """
+        if self.similarity_tree is None:
+            return {}
+        found = [
+            (play_id, self.similarity_positions[self.play_rows[play_id]])
+            for play_id in dict.fromkeys(play_ids)
+            if play_id in self.play_rows and self.similarity_positions[self.play_rows[play_id]] >= 0
+        ]
+        if not found:
+            return {}
+
+        neighbours = min(k + 1, len(self.similarity_rows))
+        distances, positions = self.similarity_tree.query(
+            self.similarity_points[[position for _, position in found]], k=neighbours
+        )
+        distances = np.asarray(distances).reshape(len(found), neighbours)
+        positions = np.asarray(positions).reshape(len(found), neighbours)
+
+        results = {}
+        for (play_id, own_position), row_distances, row_positions in zip(found, distances, positions):
+            results[play_id] = [
+                (int(self.similarity_rows[position]), float(distance))
+                for position, distance in zip(row_positions, row_distances)
+                if position != own_position
+            ][:k]
+        return results
+
+    def player_aggregates(self, name: str) -> List[Dict[str, Any]]:
+        """Season summaries of every batter matching a name (a dictionary hit for exact names)"""
+        return [
+            {
+                'player': self.batter_display[batter],
+                'seasons': list(self.aggregates[batter].values())
+            }
+            for batter in self.find_batters(name)
+        ]
+
+    def find_batters(self, name: str) -> List[str]:
+        """
+        Folded batter names matching a query: the exact name, else every batter whose name
+        contains all query tokens, else a substring match over the distinct names.
+        """
+        query = fold_name(name)
+        if not query:
+            return []
+        if query in self.batter_rows:
+            return [query]
+
+        tokens = query.split()
+        candidates = set.intersection(*(self.batter_tokens.get(token, set()) for token in tokens))
+        if candidates:
+            return sorted(candidates)
+        return sorted(batter for batter in self.batter_rows if query in batter)
+
+    def rows_for_batter(self, name: str) -> np.ndarray:
+        """Row positions of a batter's home runs in file order"""
+        batters = self.find_batters(name)
+        if not batters:
+            return np.empty(0, dtype=np.int32)
+        if len(batters) == 1:
+            return self.batter_rows[batters[0]]
+        return np.sort(np.concatenate([self.batter_rows[batter] for batter in batters]))
+
+    def query(
+        self,
+        seasons: Optional[Sequence[int]] = None,
+        ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        player: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        descending: bool = True,
+        limit: int = 10
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Filter with boolean masks over the columns and select the top rows without a full sort.
+        Args:
+            seasons: Seasons to keep (postseason rows carry their year)
+            ranges: METRIC_FIELDS name -> (minimum, maximum), either bound optional
+            player: Batter name resolved through the batter index
+            sort_by: METRIC_FIELDS name to rank by; file order when omitted
+            descending: Highest values first
+            limit: Number of rows returned
+        Returns:
+            (row positions, total number of matching rows)
+        """
+        mask = np.ones(self.size, dtype=bool)
+        if seasons:
+            mask &= np.isin(self.season_years, np.asarray(seasons, dtype=np.int16))
+        for field, (minimum, maximum) in (ranges or {}).items():
+            values = self.columns[METRIC_FIELDS[field]]
+            # Comparisons with NaN are False, so rows missing the metric drop out
+            if minimum is not None:
+                mask &= values >= minimum
+            if maximum is not None:
+                mask &= values <= maximum
+        if player is not None:
+            player_mask = np.zeros(self.size, dtype=bool)
+            player_mask[self.rows_for_batter(player)] = True
+            mask &= player_mask
+
+        if sort_by is None:
+            rows = np.flatnonzero(mask)
+            return rows[:limit], len(rows)
+
+        values = self.columns[METRIC_FIELDS[sort_by]]
+        mask &= ~np.isnan(values)
+        rows = np.flatnonzero(mask)
+        keys = -values[rows] if descending else values[rows]
+        if limit < len(rows):
+            top = np.argpartition(keys, limit - 1)[:limit]
+        else:
+            top = np.arange(len(rows))
+        top = top[np.argsort(keys[top], kind='stable')]
+        return rows[top], len(rows)
+
+    def search_titles(
+        self,
+        query: str,
+        seasons: Optional[Sequence[int]] = None,
+        offset: int = 0,
+        limit: int = 10
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Full-text search over titles through the inverted index.
+        Args:
+            query: Terms, "quoted phrases" and prefix* terms, all required
+            seasons: Seasons to keep
+            offset: Matches to skip, in file order
+            limit: Number of rows returned
+        Returns:
+            (row positions, total number of matching rows)
+        """
+        rows = None
+        if seasons:
+            rows = np.flatnonzero(np.isin(self.season_years, np.asarray(seasons, dtype=np.int16)))
+        matches = self.title_index.search(query, rows)
+        return matches[offset:offset + limit], len(matches)
+
+    def records(self, rows: np.ndarray) -> List[Dict[str, Any]]:
+        """Build response dictionaries for the given row positions only"""
+        selected = {column: self.columns[column][rows].tolist() for column in HR_COLUMNS}
+        return [
+            {
+                'play_id': selected['play_id'][i],
+                'title': selected['title'][i],
+                'video_url': selected['video'][i],
+                'exit_velocity': _clean_float(selected['ExitVelocity'][i]),
+                'launch_angle': _clean_float(selected['LaunchAngle'][i]),
+                'hit_distance': _clean_float(selected['HitDistance'][i]),
+                'season': selected['season'][i]
+            }
+            for i in range(len(rows))
+        ]
+
+
+def _clean_float(value: float) -> Optional[float]:
+    """NaN is not valid JSON; report missing metrics as null"""
+    return None if math.isnan(value) else value
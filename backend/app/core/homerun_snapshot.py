@@ -0,0 +1,160 @@
+from typing import Dict, Iterable, Optional
+from datetime import datetime, timezone
+from pathlib import Path
+import hashlib
+import io
+import json
+import logging
+import os
+import shutil
+
+import httpx
+import numpy as np
+import pandas as pd
+
+from app.core.homerun_dataset import HR_COLUMNS, columns_from_frame, source_season
+
+logger = logging.getLogger(__name__)
+
+# Remote CSVs, keyed by the snapshot name of each season file
+HR_SOURCES = {
+    '2016': 'https://storage.googleapis.com/gcp-mlb-hackathon-2025/datasets/2016-mlb-homeruns.csv',
+    '2017': 'https://storage.googleapis.com/gcp-mlb-hackathon-2025/datasets/2017-mlb-homeruns.csv',
+    '2024': 'https://storage.googleapis.com/gcp-mlb-hackathon-2025/datasets/2024-mlb-homeruns.csv',
+    '2024-postseason': 'https://storage.googleapis.com/gcp-mlb-hackathon-2025/datasets/2024-postseason-mlb-homeruns.csv',
+}
+
+DEFAULT_SNAPSHOT_DIR = Path('data/homeruns')
+MANIFEST_NAME = 'manifest.json'
+SNAPSHOT_FORMAT = 1
+
+
+def _read_manifest(snapshot_dir: Path) -> Dict:
+    """Manifest of ingested season files, or an empty one"""
+    try:
+        with open(snapshot_dir / MANIFEST_NAME, 'r') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"format": SNAPSHOT_FORMAT, "sources": {}}
+    if manifest.get("format") != SNAPSHOT_FORMAT:
+        return {"format": SNAPSHOT_FORMAT, "sources": {}}
+    return manifest
+
+
+def _write_manifest(snapshot_dir: Path, manifest: Dict) -> None:
+    """Replace the manifest atomically so readers never see a partial file"""
+    tmp_path = snapshot_dir / f"{MANIFEST_NAME}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, snapshot_dir / MANIFEST_NAME)
+
+
+def ingest_source(key: str, url: str, snapshot_dir: Path = DEFAULT_SNAPSHOT_DIR, force: bool = False) -> bool:
+    """
+    Download one season CSV and store it as .npy columns in a version-stamped directory.
+    Args:
+        key: Snapshot name of the season file (e.g. '2024-postseason')
+        url: CSV location
+        snapshot_dir: Snapshot root directory
+        force: Rewrite even when the CSV content has not changed
+    Returns:
+        True if a new version was written
+    Raises:
+        ValueError: If the key does not start with a four-digit year
+    """
+    season = source_season(key)
+    snapshot_dir = Path(snapshot_dir)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+
+    response = httpx.get(url, timeout=60.0, follow_redirects=True)
+    response.raise_for_status()
+    digest = hashlib.sha256(response.content).hexdigest()
+
+    manifest = _read_manifest(snapshot_dir)
+    previous = manifest["sources"].get(key)
+    if previous and previous["sha256"] == digest and not force:
+        logger.info(f"Home-run snapshot {key} is up to date ({previous['version']})")
+        return False
+
+    columns = columns_from_frame(pd.read_csv(io.BytesIO(response.content)).assign(season=season))
+
+    version = f"{key}-{digest[:12]}"
+    version_dir = snapshot_dir / version
+    version_dir.mkdir(exist_ok=True)
+    for column in HR_COLUMNS:
+        np.save(version_dir / f"{column}.npy", columns[column])
+
+    manifest["sources"][key] = {
+        "season": season,
+        "url": url,
+        "version": version,
+        "sha256": digest,
+        "rows": len(columns['play_id']),
+        "ingested_at": datetime.now(timezone.utc).isoformat(),
+    }
+    _write_manifest(snapshot_dir, manifest)
+
+    if previous and previous["version"] != version:
+        shutil.rmtree(snapshot_dir / previous["version"], ignore_errors=True)
+    logger.info(f"Stored home-run snapshot {version} ({manifest['sources'][key]['rows']} rows)")
+    return True
+
+
+def ingest_sources(
+    snapshot_dir: Path = DEFAULT_SNAPSHOT_DIR,
+    keys: Optional[Iterable[str]] = None,
+    force: bool = False
+) -> Dict[str, bool]:
+    """
+    Ingest several season files, carrying on past any that fail so the others are still snapshotted.
+    Returns:
+        key -> whether a new version was written, for the season files that were ingested;
+        failed season files are logged and left out
+    """
+    written = {}
+    for key in keys or HR_SOURCES:
+        try:
+            written[key] = ingest_source(key, HR_SOURCES[key], snapshot_dir, force=force)
+        except Exception as e:
+            logger.error(f"Could not ingest home-run season file {key}: {e}")
+    return written
+
+
+def snapshot_versions(snapshot_dir: Path = DEFAULT_SNAPSHOT_DIR) -> Dict[str, str]:
+    """Current version of each ingested season file"""
+    return {
+        key: source["version"]
+        for key, source in _read_manifest(Path(snapshot_dir))["sources"].items()
+    }
+
+
+def load_source(key: str, snapshot_dir: Path = DEFAULT_SNAPSHOT_DIR) -> Dict[str, np.ndarray]:
+    """
+    Load the columns of one ingested season file into memory.
+    The dataset concatenates every season into one set of columns, so the arrays are read
+    outright rather than memory-mapped; the win over the CSVs is skipping the parse.
+    """
+    snapshot_dir = Path(snapshot_dir)
+    version = snapshot_versions(snapshot_dir)[key]
+    return {
+        column: np.load(snapshot_dir / version / f"{column}.npy")
+        for column in HR_COLUMNS
+    }
+
+
+def load_snapshot(snapshot_dir: Path = DEFAULT_SNAPSHOT_DIR) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Load every ingested season file.
+    Returns:
+        Season file key -> columns, in HR_SOURCES order; season files that cannot be
+        read are logged and left out, and it is empty when nothing was ingested
+    """
+    versions = snapshot_versions(snapshot_dir)
+    ordered = [key for key in HR_SOURCES if key in versions] + sorted(set(versions) - set(HR_SOURCES))
+    sources = {}
+    for key in ordered:
+        try:
+            sources[key] = load_source(key, snapshot_dir)
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not load home-run season file {key}: {e}")
+    return sources
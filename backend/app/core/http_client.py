@@ -0,0 +1,135 @@
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+import asyncio
+import importlib.util
+import logging
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class AsyncHTTPClient:
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+        max_connections_per_host: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None
+    ):
+        """Shared async HTTP client keeping one keep-alive connection pool per upstream host."""
+        self.timeout = timeout if timeout is not None else settings.HTTP_TIMEOUT
+        self.connect_timeout = connect_timeout if connect_timeout is not None else settings.HTTP_CONNECT_TIMEOUT
+        self.max_retries = max_retries if max_retries is not None else settings.HTTP_MAX_RETRIES
+        self.retry_backoff = retry_backoff if retry_backoff is not None else settings.HTTP_RETRY_BACKOFF
+        self.max_connections_per_host = (
+            max_connections_per_host if max_connections_per_host is not None
+            else settings.HTTP_MAX_CONNECTIONS_PER_HOST
+        )
+        self.keepalive_expiry = keepalive_expiry if keepalive_expiry is not None else settings.HTTP_KEEPALIVE_EXPIRY
+
+        # HTTP/2 needs the optional `h2` package; fall back to HTTP/1.1 keep-alive without it
+        self.http2 = importlib.util.find_spec("h2") is not None
+
+        # Pools are bound to the event loop that created them, so each host keeps its owning loop
+        self._clients: Dict[str, Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+        # Pools replaced after their loop went away, closed by the next aclose()
+        self._retired: List[httpx.AsyncClient] = []
+
+    def _get_client(self, url: str) -> httpx.AsyncClient:
+        """Return the pooled client for the host of `url`, creating it on first use"""
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        loop = asyncio.get_running_loop()
+
+        owner_loop, client = self._clients.get(host, (None, None))
+        if client is None or client.is_closed or owner_loop is not loop:
+            if client is not None and not client.is_closed:
+                self._retire(owner_loop, client)
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                follow_redirects=True,
+                timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections_per_host,
+                    max_keepalive_connections=self.max_connections_per_host,
+                    keepalive_expiry=self.keepalive_expiry
+                )
+            )
+            self._clients[host] = (loop, client)
+        return client
+
+    def _retire(self, owner_loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+        """Close a replaced pool on the loop that owns it, or keep it for aclose() if that loop has stopped"""
+        if owner_loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._close_quietly(client), owner_loop)
+        else:
+            self._retired.append(client)
+
+    @staticmethod
+    async def _close_quietly(client: httpx.AsyncClient) -> None:
+        """Close a pool, logging rather than raising if its connections are already unusable"""
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug(f"Error closing retired HTTP client: {e!r}")
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        max_retries: Optional[int] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Send a request through the pooled client for the target host.
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            params: Query string parameters
+            headers: Extra request headers
+            max_retries: Override for the configured retry count
+        Returns:
+            The final httpx.Response; callers decide whether to raise_for_status()
+        """
+        client = self._get_client(url)
+        retries = self.max_retries if max_retries is None else max_retries
+
+        for attempt in range(retries + 1):
+            try:
+                response = await client.request(method, url, params=params, headers=headers, **kwargs)
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                if attempt >= retries:
+                    raise
+                logger.warning(f"{method} {url} failed ({e!r}), retry {attempt + 1}/{retries}")
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= retries:
+                    return response
+                logger.warning(f"{method} {url} returned {response.status_code}, retry {attempt + 1}/{retries}")
+
+            await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """Send a GET request"""
+        return await self.request("GET", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close every pool owned by the running event loop, plus pools retired from stopped loops"""
+        loop = asyncio.get_running_loop()
+        for host in [host for host, (owner_loop, _) in self._clients.items() if owner_loop is loop]:
+            _, client = self._clients.pop(host)
+            await client.aclose()
+        retired, self._retired = self._retired, []
+        for client in retired:
+            await self._close_quietly(client)
+
+
+http_client = AsyncHTTPClient()
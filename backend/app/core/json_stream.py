@@ -0,0 +1,89 @@
+from typing import Any, Dict, List, Optional
+import json
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+
+class JSONArrayStreamParser:
+    def __init__(self, key: str = "results"):
+        """
+        Incrementally extract the objects of one JSON array from streamed model output.
+        Each object is returned as soon as its closing brace arrives, without waiting
+        for the rest of the document.
+        Args:
+            key: Name of the array whose objects are extracted
+        """
+        self._array_start = re.compile(r'"' + re.escape(key) + r'"\s*:\s*\[')
+        self._buffer = ""
+        self._pos = 0
+        self._in_array = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._object_start: Optional[int] = None
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far"""
+        return self._buffer
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        Add the next piece of model output.
+        Args:
+            chunk: Text received since the previous call
+        Returns:
+            Array objects completed by this chunk, in order
+        """
+        self._buffer += chunk
+        if self._finished:
+            return []
+
+        if not self._in_array:
+            match = self._array_start.search(self._buffer)
+            if not match:
+                return []
+            self._in_array = True
+            self._pos = match.end()
+
+        completed = []
+        buffer = self._buffer
+        for index in range(self._pos, len(buffer)):
+            char = buffer[index]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                if self._depth == 0:
+                    self._object_start = index
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    item = self._decode(buffer[self._object_start:index + 1])
+                    if item is not None:
+                        completed.append(item)
+            elif char == "]" and self._depth == 0:
+                self._finished = True
+                break
+        self._pos = len(buffer)
+        return completed
+
+    @staticmethod
+    def _decode(fragment: str) -> Optional[Dict[str, Any]]:
+        """Parse one complete object, skipping fragments the model got wrong"""
+        try:
+            item = json.loads(fragment)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Skipping malformed streamed item: {e}")
+            return None
+        return item if isinstance(item, dict) else None
@@ -0,0 +1,115 @@
+from typing import Any, Dict, List, Optional
+from collections import defaultdict
+
+import numpy as np
+
+from app.core.text_utils import fold_name
+
+# Person fields indexed as searchable aliases
+ALIAS_FIELDS = ['fullName', 'nickName', 'boxscoreName']
+# Ranking boosts on top of trigram similarity
+EXACT_BOOST = 2.0
+PREFIX_BOOST = 1.0
+MIN_SCORE = 0.25
+
+
+def name_trigrams(folded: str, partial_last_word: bool = False) -> List[str]:
+    """
+    Trigrams of a folded name, each word padded as "  word " so word starts carry weight.
+    Args:
+        folded: Output of fold_name
+        partial_last_word: Leave off the closing trigram of the last word (it is still being typed)
+    """
+    trigrams = []
+    words = folded.split()
+    for i, word in enumerate(words):
+        padded = f"  {word}" if partial_last_word and i == len(words) - 1 else f"  {word} "
+        trigrams.extend(padded[j:j + 3] for j in range(len(padded) - 2))
+    return list(dict.fromkeys(trigrams))
+
+
+class NameSearchIndex:
+    def __init__(self, people: List[Dict[str, Any]]):
+        """
+        Trigram index over accent-folded player aliases (full name, nickname, box score name).
+        Queries score every alias with one bincount over the postings, so typo-tolerant,
+        accent-insensitive and prefix matches are ranked without scanning the names.
+        Args:
+            people: Player dictionaries with an 'id' (may be None), the ALIAS_FIELDS and any extra fields
+        """
+        self.people = people
+        self.alias_names: List[str] = []
+        self.exact: Dict[str, List[int]] = defaultdict(list)
+        alias_people = []
+        alias_sizes = []
+        postings = defaultdict(list)
+
+        for person_index, person in enumerate(people):
+            seen = set()
+            for field in ALIAS_FIELDS:
+                folded = fold_name(person.get(field))
+                if not folded or folded in seen:
+                    continue
+                seen.add(folded)
+                alias = len(self.alias_names)
+                self.alias_names.append(person[field])
+                self.exact[folded].append(alias)
+                alias_people.append(person_index)
+                trigrams = name_trigrams(folded)
+                alias_sizes.append(len(trigrams))
+                for trigram in trigrams:
+                    postings[trigram].append(alias)
+
+        self.alias_people = np.asarray(alias_people, dtype=np.int32)
+        self.alias_sizes = np.asarray(alias_sizes, dtype=np.float32)
+        self.postings = {trigram: np.asarray(aliases, dtype=np.int32) for trigram, aliases in postings.items()}
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Players ranked by how well any of their aliases matches the query.
+        Args:
+            query: Full or partial name, any accents or case
+            limit: Maximum number of players returned
+        Returns:
+            Person dictionaries with the matched alias and a score, best first
+        """
+        folded = fold_name(query)
+        if not folded or not len(self.alias_people):
+            return []
+        trigrams = name_trigrams(folded, partial_last_word=True)
+        matched = [self.postings[trigram] for trigram in trigrams if trigram in self.postings]
+        if not matched:
+            return []
+
+        shared = np.bincount(np.concatenate(matched), minlength=len(self.alias_people)).astype(np.float32)
+        candidates = np.flatnonzero(shared)
+        shared = shared[candidates]
+        # Jaccard similarity rewards close spellings; full coverage of the query means a prefix match
+        scores = shared / (len(trigrams) + self.alias_sizes[candidates] - shared)
+        scores += np.where(shared == len(trigrams), PREFIX_BOOST, 0.0)
+        for alias in self.exact.get(folded, []):
+            scores[np.searchsorted(candidates, alias)] += EXACT_BOOST
+
+        keep = scores >= MIN_SCORE
+        candidates, scores = candidates[keep], scores[keep]
+        order = np.argsort(-scores, kind='stable')
+        # Best alias per player: the first occurrence in score order
+        people = self.alias_people[candidates[order]]
+        _, first = np.unique(people, return_index=True)
+        best = order[np.sort(first)][:limit]
+
+        return [
+            {
+                **self.people[self.alias_people[candidates[i]]],
+                'matched': self.alias_names[candidates[i]],
+                'score': round(float(scores[i]), 3)
+            }
+            for i in best
+        ]
+
+    def best_id(self, query: str) -> Optional[int]:
+        """Id of the top-ranked player that has one"""
+        for person in self.search(query, limit=5):
+            if person.get('id') is not None:
+                return person['id']
+        return None
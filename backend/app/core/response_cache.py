@@ -0,0 +1,104 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable
+from collections import OrderedDict
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class _CacheEntry:
+    __slots__ = ("value", "stored_at")
+
+    def __init__(self, value: Any, stored_at: float):
+        self.value = value
+        self.stored_at = stored_at
+
+
+class ResponseCache:
+    def __init__(self, ttl: float, stale_ttl: float, max_entries: int):
+        """
+        In-memory LRU cache with a TTL and a stale-while-revalidate window.
+        Args:
+            ttl: Seconds an entry is served as fresh
+            stale_ttl: Extra seconds an expired entry is still served while it is refreshed in the background
+            max_entries: Maximum number of entries kept before least recently used ones are evicted
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        # Keeps a reference to each in-flight background refresh, one per key
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refresh_failures = 0
+        self.evictions = 0
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """Insert or replace an entry and evict the least recently used ones"""
+        self._entries[key] = _CacheEntry(value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def _refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> None:
+        """Re-run `fetch` for a stale entry, keeping the stale value if it fails"""
+        try:
+            self._store(key, await fetch())
+        except Exception as e:
+            self.refresh_failures += 1
+            logger.warning(f"Background refresh failed for {key!r}: {e}")
+        finally:
+            self._refreshing.pop(key, None)
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for `key`, fetching it on a miss.
+        Args:
+            key: Hashable cache key
+            fetch: Zero-argument coroutine function producing the value
+        Returns:
+            Fresh values directly; stale values immediately while a single
+            background refresh runs; otherwise the awaited result of `fetch`
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.stored_at
+            if age < self.ttl:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                if key not in self._refreshing:
+                    self._refreshing[key] = asyncio.create_task(self._refresh(key, fetch))
+                return entry.value
+
+            del self._entries[key]
+
+        self.misses += 1
+        value = await fetch()
+        self._store(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters"""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refresh_failures": self.refresh_failures,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,96 @@
+from typing import Any, Dict, List, Optional
+import logging
+
+from app.core.name_search import ALIAS_FIELDS, NameSearchIndex
+from app.core.text_utils import fold_name
+from app.core.upstream_index import UpstreamIndex
+
+logger = logging.getLogger(__name__)
+
+
+class RosterIndex(UpstreamIndex):
+    def __init__(
+        self,
+        url: str,
+        refresh_interval: float,
+        featured: Optional[List[Dict]] = None,
+        snapshot_path: Optional[str] = None
+    ):
+        """
+        In-memory index of the MLB roster, loaded once and refreshed in the background.
+        Args:
+            url: Stats API players endpoint returning {"people": [...]}
+            refresh_interval: Seconds before the roster is re-validated upstream
+            featured: Extra {"fullName", "team"} entries (data/players.json), searchable
+                even before the roster has loaded
+            snapshot_path: Last roster downloaded, rewritten on every change and served
+                when upstream is down at startup
+        """
+        super().__init__(url, refresh_interval, snapshot_path=snapshot_path, save_snapshot=snapshot_path is not None)
+        self.featured = featured or []
+
+        self.people: Dict[int, Dict] = {}
+        # Folded full name -> player id; the first roster entry wins for shared names
+        self.name_ids: Dict[str, int] = {}
+        self.names = self._build_name_search([])
+
+    def _build_name_search(self, people: List[Dict]) -> NameSearchIndex:
+        """Fuzzy name index over the roster plus featured players, which add their team"""
+        entries = []
+        by_name = {}
+        for person in people:
+            entry = {'id': person['id']}
+            entry.update((field, person[field]) for field in ALIAS_FIELDS if person.get(field))
+            entries.append(entry)
+            by_name.setdefault(fold_name(person.get('fullName')), entry)
+        for player in self.featured:
+            entry = by_name.get(fold_name(player.get('fullName')))
+            if entry is None:
+                entry = {'id': None, 'fullName': player['fullName']}
+                entries.append(entry)
+            entry['team'] = player.get('team')
+        return NameSearchIndex(entries)
+
+    def _build(self, document: Dict[str, Any]) -> None:
+        """Rebuild the lookup tables and swap them in together"""
+        by_id = {}
+        name_ids = {}
+        for person in document.get('people', []):
+            person_id = person.get('id')
+            if person_id is None:
+                continue
+            by_id[person_id] = person
+            name = fold_name(person.get('fullName'))
+            if name:
+                name_ids.setdefault(name, person_id)
+        names = self._build_name_search(list(by_id.values()))
+        self.people, self.name_ids, self.names = by_id, name_ids, names
+
+    def _size(self) -> int:
+        """Number of roster players"""
+        return len(self.people)
+
+    async def find_id(self, name: str) -> Optional[int]:
+        """
+        Player id for a name: an exact match on the folded full name, else the
+        best-ranked fuzzy match over names, nicknames and box score names.
+        """
+        await self.ensure_loaded()
+        query = fold_name(name)
+        if not query:
+            return None
+        player_id = self.name_ids.get(query)
+        if player_id is not None:
+            return player_id
+        return self.names.best_id(query)
+
+    async def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """
+        Ranked fuzzy name matches for autocomplete, answered from memory.
+        Falls back to the featured players when the roster cannot be loaded.
+        """
+        try:
+            await self.ensure_loaded()
+        except Exception as e:
+            logger.warning(f"Roster unavailable, searching featured players only: {e}")
+        return self.names.search(query, limit=limit)
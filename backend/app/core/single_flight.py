@@ -0,0 +1,82 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable
+from collections import defaultdict
+import asyncio
+import functools
+import inspect
+
+
+def _normalize_argument(value: Any) -> Any:
+    """Make equivalent call arguments compare equal (case and whitespace-insensitive strings)"""
+    if isinstance(value, str):
+        return " ".join(value.lower().split())
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize_argument(item) for item in value)
+    return value
+
+
+class SingleFlight:
+    def __init__(self):
+        """Coalesce concurrent calls sharing a key into one in-flight computation."""
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._calls: Dict[str, int] = defaultdict(int)
+        self._coalesced: Dict[str, int] = defaultdict(int)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """Drop a finished computation so the next caller starts a fresh one"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]], name: str = "default") -> Any:
+        """
+        Run `fn` once for all concurrent callers with the same key.
+        Args:
+            key: Hashable key identifying equivalent calls
+            fn: Zero-argument coroutine function performing the work
+            name: Counter bucket the call is recorded under
+        Returns:
+            The shared result; callers must treat it as read-only
+        """
+        self._calls[name] += 1
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._coalesced[name] += 1
+        else:
+            # Run as a separate task so one caller being cancelled does not cancel the others
+            task = asyncio.create_task(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._forget, key))
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return per-name call and coalesced-caller counters"""
+        return {
+            name: {
+                "calls": calls,
+                "coalesced": self._coalesced[name],
+                "executions": calls - self._coalesced[name]
+            }
+            for name, calls in self._calls.items()
+        }
+
+
+def coalesce(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Decorator routing an async service method through `self.single_flight`,
+    keyed by the method name and its normalized, default-filled arguments.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__,) + tuple(
+            (name, _normalize_argument(value))
+            for name, value in bound.arguments.items()
+            if name != "self"
+        )
+        return await self.single_flight.do(key, lambda: method(self, *args, **kwargs), name=method.__name__)
+
+    return wrapper
@@ -0,0 +1,67 @@
+from typing import Any, Dict, List, Optional
+
+from app.core.text_utils import fold_name
+from app.core.upstream_index import UpstreamIndex
+
+# Team fields kept in the directory
+TEAM_FIELDS = ['id', 'name', 'abbreviation', 'teamName', 'shortName', 'locationName', 'franchiseName', 'clubName']
+# Fields a team can be looked up by, most specific first; a shared key ("chicago")
+# resolves to the first team registered under it
+LOOKUP_FIELDS = ['name', 'teamName', 'clubName', 'shortName', 'abbreviation', 'franchiseName', 'locationName']
+
+
+class TeamDirectory(UpstreamIndex):
+    def __init__(self, url: str, refresh_interval: float, snapshot_path: Optional[str] = None):
+        """
+        In-memory MLB team directory, loaded once and refreshed in the background.
+        Args:
+            url: Stats API teams endpoint returning {"teams": [...]}
+            refresh_interval: Seconds before the teams are re-validated upstream
+            snapshot_path: Local {"teams": [...]} copy served when the first load fails
+        """
+        super().__init__(url, refresh_interval, snapshot_path=snapshot_path)
+        self.teams: List[Dict[str, Any]] = []
+        # Folded name, short name, abbreviation or location -> team
+        self.keys: Dict[str, Dict[str, Any]] = {}
+
+    def _build(self, document: Dict[str, Any]) -> None:
+        """Rebuild the team list and lookup keys and swap them in together"""
+        teams = [
+            {field: team.get(field) for field in TEAM_FIELDS}
+            for team in document.get('teams', [])
+            if team.get('id') is not None
+        ]
+        teams.sort(key=lambda team: team['name'] or '')
+        keys = {}
+        for field in LOOKUP_FIELDS:
+            for team in teams:
+                key = fold_name(team[field])
+                if key:
+                    keys.setdefault(key, team)
+        self.teams, self.keys = teams, keys
+
+    def _size(self) -> int:
+        """Number of teams"""
+        return len(self.teams)
+
+    async def find(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Team for a full name, short name, abbreviation or location, else the first
+        team whose full name contains the query.
+        """
+        await self.ensure_loaded()
+        query = fold_name(name)
+        if not query:
+            return None
+        team = self.keys.get(query)
+        if team is not None:
+            return team
+        for team in self.teams:
+            if query in fold_name(team['name']):
+                return team
+        return None
+
+    async def all(self) -> List[Dict[str, Any]]:
+        """Every team, ordered by name"""
+        await self.ensure_loaded()
+        return self.teams
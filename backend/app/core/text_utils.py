@@ -0,0 +1,68 @@
+from typing import Optional
+import re
+import unicodedata
+
+# Characters that only show up in Spanish (or other non-English) Latin-script text
+_NON_ENGLISH_MARKERS = set("¿¡ñáéíóúü")
+_ENGLISH_STOPWORDS = {"the", "of", "in", "and", "to", "for", "with", "on", "at", "is", "his", "her", "as", "by", "from", "after"}
+_SPANISH_STOPWORDS = {"el", "la", "los", "las", "de", "del", "y", "que", "con", "por", "para", "una", "un", "se", "su"}
+_WORD_PATTERN = re.compile(r"[a-z']+")
+_TRAILING_PUNCTUATION = " ,;:-–—"
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+
+ELLIPSIS = "…"
+
+
+def looks_english(text: Optional[str]) -> bool:
+    """
+    Cheap check that a source text is English, so it can be used as-is for English output.
+    Errs towards False: a miss only costs a model round-trip, so text without
+    more English than Spanish stopwords is not treated as English.
+    """
+    if not text:
+        return False
+    lowered = text.lower()
+    # Non-Latin letters (kana, kanji, hangul, ...) or Spanish-only characters
+    if any(char.isalpha() and ord(char) > 0x24F for char in lowered):
+        return False
+    if any(char in _NON_ENGLISH_MARKERS for char in lowered):
+        return False
+
+    words = _WORD_PATTERN.findall(lowered)
+    english = sum(word in _ENGLISH_STOPWORDS for word in words)
+    spanish = sum(word in _SPANISH_STOPWORDS for word in words)
+    return english > spanish
+
+
+def shorten_at_word_boundary(text: str, max_chars: int, ellipsis: str = ELLIPSIS) -> str:
+    """
+    Shorten text to at most max_chars, cutting at the last whole word and adding an ellipsis.
+    Args:
+        text: Text to shorten
+        max_chars: Maximum length of the result, ellipsis included
+        ellipsis: Suffix marking the cut
+    """
+    if len(text) <= max_chars:
+        return text
+    budget = max_chars - len(ellipsis)
+    if budget <= 0:
+        return text[:max_chars]
+
+    # Look one character past the budget so a word ending exactly at the limit is kept
+    head = text[:budget + 1]
+    boundary = head.rfind(" ")
+    head = head[:boundary] if boundary > 0 else text[:budget]
+    return head.rstrip(_TRAILING_PUNCTUATION) + ellipsis
+
+
+def fold_name(name: Optional[str]) -> str:
+    """
+    Normalize a person's name for lookups: accents removed, lowercased, punctuation
+    collapsed to single spaces ("José Ramírez" and "Jose Ramirez" both become "jose ramirez").
+    """
+    if not name:
+        return ""
+    if not name.isascii():
+        decomposed = unicodedata.normalize("NFKD", name)
+        name = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _NON_ALPHANUMERIC.sub(" ", name.lower()).strip()
@@ -0,0 +1,120 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from collections import defaultdict
+import re
+
+import numpy as np
+
+from app.core.text_utils import fold_name
+
+# Postings pack (row, token position) into one uint32: 24 bits of row, 8 bits of position
+POSITION_BITS = 8
+MAX_POSITIONS = 1 << POSITION_BITS
+MAX_ROWS = 1 << (32 - POSITION_BITS)
+
+# A quoted phrase or a bare term; a trailing * marks the last word as a prefix
+_CLAUSE_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def parse_query(query: str) -> List[Tuple[List[str], bool]]:
+    """
+    Split a search query into clauses that must all match.
+    Bare terms that fold into several tokens ("walk-off") are matched as phrases.
+    Returns:
+        [(tokens, last token is a prefix)]
+    """
+    clauses = []
+    for match in _CLAUSE_PATTERN.finditer(query or ""):
+        text = match.group(1) if match.group(1) is not None else match.group(2)
+        tokens = fold_name(text).split()
+        if tokens:
+            clauses.append((tokens, text.rstrip().endswith("*")))
+    return clauses
+
+
+class TitleIndex:
+    def __init__(self):
+        """
+        Token-level inverted index over home-run titles.
+        Each token maps to a sorted uint32 array of packed (row, position) postings, so
+        AND queries are array intersections and phrases are intersections of shifted positions.
+        """
+        self.postings: Dict[str, np.ndarray] = {}
+        # Sorted vocabulary for prefix lookups
+        self.vocabulary = np.empty(0, dtype=str)
+        self.size = 0
+
+    def copy(self) -> "TitleIndex":
+        """Independent index sharing the posting arrays, which add() replaces rather than modifies"""
+        index = TitleIndex()
+        index.postings = dict(self.postings)
+        index.vocabulary = self.vocabulary
+        index.size = self.size
+        return index
+
+    def add(self, titles: Sequence[str], start: int) -> None:
+        """
+        Index titles for rows start, start + 1, ...; rows must come after those already indexed.
+        Only the first MAX_POSITIONS tokens of a title are indexed.
+        """
+        if start + len(titles) > MAX_ROWS:
+            raise ValueError(f"Title index holds at most {MAX_ROWS} rows")
+        positions = defaultdict(list)
+        for row, title in enumerate(titles, start):
+            for position, token in enumerate(fold_name(title).split()[:MAX_POSITIONS]):
+                positions[token].append((row << POSITION_BITS) | position)
+        self.size = start + len(titles)
+
+        for token, keys in positions.items():
+            keys = np.asarray(keys, dtype=np.uint32)
+            if token in self.postings:
+                keys = np.concatenate([self.postings[token], keys])
+            self.postings[token] = keys
+        if positions:
+            self.vocabulary = np.asarray(sorted(self.postings), dtype=str)
+
+    def _token_postings(self, token: str, prefix: bool) -> np.ndarray:
+        """Postings of a token, or the merged postings of every token starting with it"""
+        if not prefix:
+            return self.postings.get(token, np.empty(0, dtype=np.uint32))
+        # Every vocabulary entry in [token, token + highest code point) starts with token
+        first = np.searchsorted(self.vocabulary, token, side='left')
+        last = np.searchsorted(self.vocabulary, token + '\U0010ffff', side='left')
+        if first == last:
+            return np.empty(0, dtype=np.uint32)
+        if last - first == 1:
+            return self.postings[self.vocabulary[first]]
+        return np.unique(np.concatenate([self.postings[token] for token in self.vocabulary[first:last]]))
+
+    def _clause_rows(self, tokens: List[str], prefix: bool) -> np.ndarray:
+        """Rows containing the tokens as consecutive words"""
+        keys = self._token_postings(tokens[0], prefix and len(tokens) == 1)
+        for i, token in enumerate(tokens[1:], 1):
+            if not len(keys):
+                break
+            following = self._token_postings(token, prefix and i == len(tokens) - 1)
+            # Next word of the phrase sits at position + 1 in the same row; keys at the last
+            # position are dropped so the increment cannot carry into the next row
+            shifted = keys[(keys & (MAX_POSITIONS - 1)) < MAX_POSITIONS - 1] + 1
+            keys = np.intersect1d(shifted, following, assume_unique=True)
+        return np.unique(keys >> POSITION_BITS)
+
+    def search(self, query: str, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Rows whose titles match every clause of the query, in file order.
+        Args:
+            query: Terms, "quoted phrases" and prefix* terms, all required
+            rows: Optional sorted candidate rows to restrict the result to
+        """
+        clauses = parse_query(query)
+        if not clauses:
+            return np.empty(0, dtype=np.uint32)
+        # Cheapest clauses first so the intersections shrink quickly
+        matches = sorted((self._clause_rows(tokens, prefix) for tokens, prefix in clauses), key=len)
+        result = matches[0]
+        for clause_rows in matches[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, clause_rows, assume_unique=True)
+        if rows is not None:
+            result = np.intersect1d(result, rows.astype(np.uint32), assume_unique=True)
+        return result
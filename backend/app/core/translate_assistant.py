@@ -1,21 +1,27 @@
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Callable, Dict, Any, Optional, List
 from .ai_assistant import AIAssistant
+from .json_stream import JSONArrayStreamParser
+from .translation_batcher import TranslationBatcher
+from .text_utils import looks_english, shorten_at_word_boundary
+from .translation_store import TRANSLATION_FIELDS, TranslationStore, max_chars_for, task_languages
+from .config import settings
 import json
 import re
 from pathlib import Path
 import logging
-from datetime import datetime
 import asyncio
-from itertools import islice
-from concurrent.futures import ThreadPoolExecutor
-from functools import partial
 
-from google import genai
 from google.genai.types import GenerateContentResponse
 
 class TranslateAssistant:
-    def __init__(self, api_key: str, num_assistants: int = 8):
-        """Initialize multiple Translation Assistants for parallel processing."""
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrency: Optional[int] = None,
+        call_timeout: Optional[float] = None,
+        store: Optional[TranslationStore] = None
+    ):
+        """Initialize the Translation Assistant on the async Gemini client."""
         # Set up logging
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
@@ -29,21 +35,23 @@ class TranslateAssistant:
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
 
-        # Initialize multiple assistants
-        self.assistants = []
-        for i in range(num_assistants):
-            assistant = AIAssistant(api_key, model_id="gemini-1.5-flash-8b-latest")
-            
-            # Get absolute path to the prompt file
-            current_dir = Path(__file__).parent
-            prompt_path = current_dir.parent / "prompts" / "translate_prompt.txt"
+        self.assistant = AIAssistant(api_key, model_id="gemini-1.5-flash-8b-latest")
+
+        # Get absolute path to the prompt file
+        current_dir = Path(__file__).parent
+        prompt_path = current_dir.parent / "prompts" / "translate_prompt.txt"
+
+        self.assistant.load_system_prompt(str(prompt_path))
+        # Stateless calls: a long-lived chat would resend every earlier translation as history
+        self.assistant.initialize_stateless(temperature=0.1, enable_google_search=False, json_output=True)
 
-            assistant.load_system_prompt(str(prompt_path))
-            assistant.initialize_chat(temperature=0.1, enable_google_search=False, json_output=True)
-            self.assistants.append(assistant)
+        self.max_concurrency = max_concurrency or settings.TRANSLATION_MAX_CONCURRENCY
+        self.call_timeout = call_timeout or settings.TRANSLATION_CALL_TIMEOUT
+        self.store = store or TranslationStore()
 
-        self.num_assistants = num_assistants
-        self.thread_pool = ThreadPoolExecutor(max_workers=num_assistants)
+        # Sub-batches from every concurrent request go through one queue; its semaphore
+        # caps the number of model calls in flight at max_concurrency
+        self.batcher = TranslationBatcher(self._translate_sub_batch, max_concurrency=self.max_concurrency)
 
     def _parse_response(self, response: GenerateContentResponse | str) -> Dict[str, Any]:
         """
@@ -124,7 +132,10 @@ class TranslateAssistant:
             self.logger.info(f"\tSending translation request for content type: {content_type}")
             
             # Send the request as a proper JSON-formatted string
-            response = await self.assistants[0].send_message(json.dumps(request))
+            response = await asyncio.wait_for(
+                self.assistant.generate_async(json.dumps(request)),
+                timeout=self.call_timeout
+            )
             
             # Log response received
             self.logger.info(f"\tReceived translation response for content type: {content_type}")
@@ -147,96 +158,177 @@ class TranslateAssistant:
                 "translatedEsText": text,
             }
 
-    async def translate_batch(
+    async def _translate_sub_batch(
         self,
-        translation_tasks: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
+        sub_batch: List[Dict[str, Any]],
+        on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
-        Translate a batch of texts using multiple assistants concurrently.
+        Translate one sub-batch flushed by the batcher with a single streamed model call.
         
         Args:
-            translation_tasks: List of translation task dictionaries
+            sub_batch: Translation task dictionaries
+            on_result: Called with (task id, result) as soon as each item has been parsed
+        Returns:
+            Results keyed by task id; items parsed before a failure or timeout are kept
         """
-        if not translation_tasks:
-            return {"results": []}
-
-        def process_sub_batch_sync(assistant: AIAssistant, sub_batch: List[Dict[str, Any]], batch_index: int) -> Dict[str, Any]:
-            """Synchronous version of process_sub_batch to run in thread pool"""
-            batch_request = {
-                "translations": [
-                    {
-                        "id": task["id"],
-                        "text": task["text"],
-                        "type": task["type"],
-                        "maxEnCharacters": task.get("max_chars_en", len(task["text"]) * 2),
-                        "maxJaCharacters": task.get("max_chars_ja", len(task["text"]) * 2),
-                        "maxEsCharacters": task.get("max_chars_es", len(task["text"]) * 2)
-                    }
-                    for task in sub_batch
-                ]
+        batch_request = {"translations": []}
+        for task in sub_batch:
+            languages = task_languages(task)
+            request = {
+                "id": task["id"],
+                "text": task["text"],
+                "type": task["type"],
+                "languages": languages
             }
+            # Only the requested languages are sent, so the model only writes those fields
+            for language in languages:
+                request[f"max{language.capitalize()}Characters"] = max_chars_for(task, language)
+            batch_request["translations"].append(request)
 
-            try:
-                # self.logger.info(f"\tAssistant {batch_index} processing sub-batch of {len(sub_batch)} items")
-                # Use synchronous version of send_message
-                response = assistant.chat.send_message(json.dumps(batch_request))
-                parsed_response = self._parse_response(response)
-                
-                if "error" in parsed_response:
-                    return {"error": f"Sub-batch {batch_index} processing failed: {parsed_response['error']}"}
-                
-                return parsed_response
-            except Exception as e:
-                return {"error": f"Sub-batch {batch_index} processing failed: {str(e)}"}
+        results = {}
+        parser = JSONArrayStreamParser("results")
+
+        def collect(items: List[Dict[str, Any]]) -> None:
+            for item in items:
+                if "id" in item and item["id"] not in results:
+                    results[item["id"]] = item
+                    if on_result:
+                        on_result(item["id"], item)
+
+        async def consume() -> None:
+            async for chunk in self.assistant.generate_stream_async(json.dumps(batch_request)):
+                collect(parser.feed(chunk))
 
         try:
-            # Calculate items per sub-batch
-            total_items = len(translation_tasks)
-            items_per_batch = (total_items + self.num_assistants - 1) // self.num_assistants
-
-            # Split tasks into sub-batches
-            sub_batches = [
-                translation_tasks[i:i + items_per_batch]
-                for i in range(0, total_items, items_per_batch)
-            ]
-
-            self.logger.info(f"Split {total_items} tasks into {len(sub_batches)} sub-batches")
-
-            # Create futures for each sub-batch
-            futures = []
-            for i, batch in enumerate(sub_batches):
-                if i < self.num_assistants and batch:
-                    future = self.thread_pool.submit(
-                        process_sub_batch_sync,
-                        self.assistants[i],
-                        batch,
-                        i
-                    )
-                    futures.append(future)
-
-            # Wait for all futures to complete
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None,
-                lambda: [future.result() for future in futures]
+            await asyncio.wait_for(consume(), timeout=self.call_timeout)
+        except asyncio.TimeoutError:
+            self.logger.error(
+                f"Sub-batch of {len(sub_batch)} items timed out after {self.call_timeout}s "
+                f"with {len(results)} items parsed"
             )
+            return results
+        except Exception as e:
+            self.logger.error(f"Sub-batch processing failed: {str(e)}")
+            return results
+
+        if not results:
+            # Output the incremental parser could not follow (e.g. no "results" key); parse it whole
+            parsed_response = self._parse_response(parser.text)
+            if "error" in parsed_response:
+                self.logger.error(f"Sub-batch processing failed: {parsed_response['error']}")
+                return {}
+            collect(parsed_response.get("results", []))
+
+        return results
+
+    def _translate_locally(self, task: Dict[str, Any]) -> Dict[str, str]:
+        """
+        English output for an English source that needs no model call.
+        
+        Args:
+            task: Translation task dictionary; "mode": "fast" allows shortening locally
+        Returns:
+            {"en": text} when the source can be used directly, otherwise empty
+        """
+        text = task.get("text")
+        if "en" not in task_languages(task) or not looks_english(text):
+            return {}
 
-            # Combine results
-            combined_results = {}
-            for result in results:
-                if "error" in result:
-                    self.logger.error(f"Error in sub-batch: {result['error']}")
-                    continue
-                    
-                for item in result["results"]:
-                    combined_results[item["id"]] = item
+        max_chars = max_chars_for(task, "en") or len(text) * 2
+        if len(text) <= max_chars:
+            return {"en": text}
+        if task.get("mode") == "fast":
+            return {"en": shorten_at_word_boundary(text, max_chars)}
+        return {}
 
-            return combined_results
+    def _complete_result(
+        self,
+        task: Dict[str, Any],
+        texts: Dict[str, str],
+        model_result: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Build a task's result, or None until every requested language is present"""
+        result = {"id": task["id"], "originalText": task["text"]}
+        for language in task_languages(task):
+            field = TRANSLATION_FIELDS[language]
+            text = texts.get(language) or (model_result or {}).get(field)
+            if not text:
+                return None
+            result[field] = text
+        return result
 
+    async def translate_batch_stream(
+        self,
+        translation_tasks: List[Dict[str, Any]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Translate a batch of texts, yielding each result as soon as it is available.
+        Local and stored translations come first, then model output item by item.
+        
+        Args:
+            translation_tasks: List of translation task dictionaries
+        Yields:
+            Results with id, originalText and the requested translated*Text fields;
+            tasks that could not be translated are skipped
+        """
+        # English sources that already fit (or may be cut locally) skip the model for English
+        local_texts = {}
+        remote_tasks = []
+        for task in translation_tasks:
+            texts = self._translate_locally(task)
+            if texts:
+                local_texts[task["id"]] = texts
+            remaining = [language for language in task_languages(task) if language not in texts]
+            if remaining:
+                remote_tasks.append({**task, "langs": remaining})
+
+        # Serve previously translated languages from the store; only the missing
+        # languages of each task reach the model
+        stored = await self.store.get_many(remote_tasks) if remote_tasks else {}
+        known_texts = {}
+        pending_tasks = []
+        for task in translation_tasks:
+            texts = {**stored.get(task["id"], {}), **local_texts.get(task["id"], {})}
+            missing = [language for language in task_languages(task) if language not in texts]
+            if missing:
+                known_texts[task["id"]] = (task, texts)
+                pending_tasks.append({**task, "langs": missing})
+            else:
+                yield self._complete_result(task, texts)
+
+        if not pending_tasks:
+            return
+
+        model_results = {}
+        try:
+            async for task_id, model_result in self.batcher.stream(pending_tasks):
+                model_results[task_id] = model_result
+                task, texts = known_texts[task_id]
+                result = self._complete_result(task, texts, model_result)
+                if result:
+                    yield result
+        finally:
+            self.store.put_many(pending_tasks, model_results)
+
+    async def translate_batch(
+        self,
+        translation_tasks: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Translate a batch of texts through the shared cross-request batcher.
+        
+        Args:
+            translation_tasks: List of translation task dictionaries
+        """
+        if not translation_tasks:
+            return {"results": []}
+
+        try:
+            return {
+                result["id"]: result
+                async for result in self.translate_batch_stream(translation_tasks)
+            }
         except Exception as e:
             self.logger.error(f"Batch translation error: {e}")
             return {"error": "Failed to translate batch"}
-
-    def __del__(self):
-        """Cleanup thread pool on deletion"""
-        self.thread_pool.shutdown(wait=False) 
\ No newline at end of file
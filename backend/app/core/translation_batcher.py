@@ -0,0 +1,453 @@
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from collections import deque
+import asyncio
+import itertools
+import logging
+import math
+import time
+
+from app.core.config import settings
+from app.core.translation_store import TRANSLATION_FIELDS, max_chars_for, task_languages
+
+logger = logging.getLogger(__name__)
+
+# Called with (task id, result) for each item as soon as the model output for it is parsed
+ResultCallback = Callable[[str, Dict[str, Any]], None]
+SendBatch = Callable[[List[Dict[str, Any]], ResultCallback], Awaitable[Dict[str, Dict[str, Any]]]]
+
+
+class _QueuedTask:
+    __slots__ = ("task", "future", "tokens")
+
+    def __init__(self, task: Dict[str, Any], future: asyncio.Future):
+        self.task = task
+        self.future = future
+        self.tokens = estimate_tokens(task)
+
+
+# Rough characters-per-token ratio across English, Japanese and Spanish output
+CHARS_PER_TOKEN = 3
+# JSON keys and punctuation around each request/result item
+ITEM_OVERHEAD_TOKENS = 40
+
+
+def estimate_tokens(task: Dict[str, Any]) -> int:
+    """Estimate the input plus output tokens one translation task adds to a model call"""
+    text_chars = len(task["text"])
+    # The source is sent once and echoed back as originalText; each requested language is at most its limit
+    output_chars = text_chars + sum(
+        min(max_chars_for(task, language) or text_chars * 2, text_chars * 2)
+        for language in task_languages(task)
+    )
+    return (text_chars + output_chars) // CHARS_PER_TOKEN + ITEM_OVERHEAD_TOKENS
+
+
+# Recent call latencies kept for the hedge delay, and how many are needed before hedging starts
+HEDGE_LATENCY_WINDOW = 200
+HEDGE_MIN_SAMPLES = 20
+
+
+class _SizeBucket:
+    __slots__ = ("latency", "samples", "updated_at")
+
+    def __init__(self):
+        self.latency = 0.0
+        self.samples = 0
+        self.updated_at = 0.0
+
+
+class BatchSizer:
+    # Observations needed before a bucket influences the target, and how long they stay valid
+    MIN_SAMPLES = 3
+    OBSERVATION_TTL = 600.0
+    EWMA_ALPHA = 0.2
+
+    def __init__(
+        self,
+        min_items: int,
+        max_items: int,
+        max_tokens: int,
+        target_latency_ms: float
+    ):
+        """
+        Plans sub-batches from estimated token counts and learns the largest
+        batch size whose observed per-call latency stays within the target.
+        Args:
+            min_items: Smallest sub-batch worth a separate call when spreading over idle slots
+            max_items: Hard cap on items per call
+            max_tokens: Estimated input plus output token budget per call
+            target_latency_ms: Per-call latency the learned batch size should stay under
+        """
+        self.min_items = min_items
+        self.max_items = max_items
+        self.max_tokens = max_tokens
+        self.target_latency = target_latency_ms / 1000
+
+        # Latency EWMA per power-of-two item-count bucket
+        self._buckets: Dict[int, _SizeBucket] = {}
+
+    @staticmethod
+    def _bucket(items: int) -> int:
+        return 1 << (max(items, 1).bit_length() - 1)
+
+    def observe(self, items: int, latency: float) -> None:
+        """Record the latency of a successful call carrying `items` tasks"""
+        bucket = self._buckets.setdefault(self._bucket(items), _SizeBucket())
+        bucket.latency = latency if bucket.samples == 0 else (
+            self.EWMA_ALPHA * latency + (1 - self.EWMA_ALPHA) * bucket.latency
+        )
+        bucket.samples += 1
+        bucket.updated_at = time.monotonic()
+
+    def target_items(self) -> int:
+        """Largest items-per-call whose bucket has not been observed above the target latency"""
+        now = time.monotonic()
+        slow = [
+            size for size, bucket in self._buckets.items()
+            if bucket.samples >= self.MIN_SAMPLES
+            and now - bucket.updated_at < self.OBSERVATION_TTL
+            and bucket.latency > self.target_latency
+        ]
+        if not slow:
+            return self.max_items
+        return max(self.min_items, min(self.max_items, min(slow) - 1))
+
+    def plan(self, tokens: List[int], idle_slots: int) -> List[int]:
+        """
+        Split a flushed batch into consecutive sub-batches.
+        Args:
+            tokens: Estimated tokens of each queued task, in queue order
+            idle_slots: Model calls that could start right away
+        Returns:
+            Size of each sub-batch, in order
+        """
+        total_items = len(tokens)
+        total_tokens = sum(tokens)
+        item_cap = self.target_items()
+
+        chunks = max(
+            math.ceil(total_items / item_cap),
+            math.ceil(total_tokens / self.max_tokens),
+            min(idle_slots, total_items // self.min_items),
+            1
+        )
+        token_target = total_tokens / min(chunks, total_items)
+
+        sizes = []
+        count = 0
+        chunk_tokens = 0
+        for task_tokens in tokens:
+            if count and (
+                count >= item_cap
+                or chunk_tokens + task_tokens > self.max_tokens
+                or chunk_tokens + task_tokens / 2 > token_target
+            ):
+                sizes.append(count)
+                count = 0
+                chunk_tokens = 0
+            count += 1
+            chunk_tokens += task_tokens
+        sizes.append(count)
+        return sizes
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the learned target and per-bucket latency"""
+        return {
+            "target_items": self.target_items(),
+            "latency_ms_by_items": {
+                size: round(bucket.latency * 1000, 1)
+                for size, bucket in sorted(self._buckets.items())
+            }
+        }
+
+
+class TranslationBatcher:
+    def __init__(
+        self,
+        send: SendBatch,
+        max_concurrency: int,
+        max_batch_items: Optional[int] = None,
+        min_batch_items: Optional[int] = None,
+        max_batch_tokens: Optional[int] = None,
+        target_latency_ms: Optional[float] = None,
+        max_wait_ms: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+        hedging: Optional[bool] = None,
+        hedge_percentile: Optional[float] = None
+    ):
+        """
+        Central queue gathering translation tasks from all concurrent requests into sub-batches.
+        Args:
+            send: Coroutine function translating one sub-batch, reporting each result to the
+                  callback as it arrives and returning all results keyed by task id
+            max_concurrency: Maximum number of sub-batches in flight
+            max_batch_items: Most tasks sent in one model call
+            min_batch_items: Smallest sub-batch worth a separate model call when splitting across idle slots
+            max_batch_tokens: Estimated input plus output tokens allowed in one model call
+            target_latency_ms: Per-call latency used to learn the preferred sub-batch size
+            max_wait_ms: Longest time the first queued task waits for more tasks to arrive
+            max_retries: Times the tasks missing from a sub-batch result are re-sent
+            retry_backoff: Base delay in seconds before a retry, doubled on every attempt
+            hedging: Send a duplicate of a straggling call and keep whichever answers first
+            hedge_percentile: Percentile of recent call latencies after which a call counts as straggling
+        """
+        self.send = send
+        self.max_concurrency = max_concurrency
+        self.sizer = BatchSizer(
+            min_items=min_batch_items or settings.TRANSLATION_BATCH_MIN_ITEMS,
+            max_items=max_batch_items or settings.TRANSLATION_BATCH_MAX_ITEMS,
+            max_tokens=max_batch_tokens or settings.TRANSLATION_BATCH_MAX_TOKENS,
+            target_latency_ms=target_latency_ms or settings.TRANSLATION_TARGET_CALL_LATENCY_MS
+        )
+        self.max_wait = (max_wait_ms if max_wait_ms is not None else settings.TRANSLATION_BATCH_MAX_WAIT_MS) / 1000
+        self.max_retries = max_retries if max_retries is not None else settings.TRANSLATION_MAX_RETRIES
+        self.retry_backoff = retry_backoff if retry_backoff is not None else settings.TRANSLATION_RETRY_BACKOFF
+        self.hedging = hedging if hedging is not None else settings.TRANSLATION_HEDGING_ENABLED
+        self.hedge_percentile = hedge_percentile or settings.TRANSLATION_HEDGE_PERCENTILE
+        self._latencies = deque(maxlen=HEDGE_LATENCY_WINDOW)
+
+        self._ids = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight = 0
+        self._hedges_in_flight = 0
+        self._dispatches: Set[asyncio.Task] = set()
+
+        self.batches_sent = 0
+        self.items_sent = 0
+        self.retries = 0
+        self.retried_items = 0
+        self.failed_items = 0
+        self.hedges_sent = 0
+        self.hedges_won = 0
+
+    def _ensure_worker(self) -> None:
+        """Start the flush loop on the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._worker is not None and not self._worker.done():
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._in_flight = 0
+        self._hedges_in_flight = 0
+        self._worker = loop.create_task(self._run())
+
+    async def stream(self, tasks: List[Dict[str, Any]]) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Queue translation tasks and yield each result as soon as it is parsed.
+        Args:
+            tasks: Translation task dictionaries with caller-chosen ids
+        Yields:
+            (caller's task id, result) in completion order; tasks that failed are skipped
+        """
+        self._ensure_worker()
+
+        pending = {}
+        for task in tasks:
+            # Ids from different requests collide ("title_0"), so every task gets a batcher-wide id
+            item = _QueuedTask(dict(task, id=f"q{next(self._ids)}"), self._loop.create_future())
+            self._queue.put_nowait(item)
+            pending[item.future] = task["id"]
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    task_id = pending.pop(future)
+                    result = future.result()
+                    if result:
+                        yield task_id, dict(result, id=task_id)
+        finally:
+            # A caller that stops waiting (timeout, disconnect) cancels its tasks, so
+            # the ones still queued are never sent to the model
+            for future in pending:
+                future.cancel()
+
+    async def submit(self, tasks: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Queue translation tasks and wait for all of their results.
+        Args:
+            tasks: Translation task dictionaries with caller-chosen ids
+        Returns:
+            Results keyed by the caller's task ids; tasks that failed are missing
+        """
+        return {task_id: result async for task_id, result in self.stream(tasks)}
+
+    async def _collect(self) -> List[_QueuedTask]:
+        """Wait for the next task, then gather more until every slot could be filled or the deadline"""
+        batch = [await self._queue.get()]
+        tokens = batch[0].tokens
+        deadline = self._loop.time() + self.max_wait
+
+        max_items = self.sizer.max_items * self.max_concurrency
+        max_tokens = self.sizer.max_tokens * self.max_concurrency
+        while len(batch) < max_items and tokens < max_tokens:
+            try:
+                item = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - self._loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            batch.append(item)
+            tokens += item.tokens
+        return batch
+
+    def _split(self, batch: List[_QueuedTask]) -> List[List[_QueuedTask]]:
+        """Cut a flushed batch into token-budgeted sub-batches, spread over the idle slots"""
+        idle = max(1, self.max_concurrency - self._in_flight - self._hedges_in_flight)
+        chunks = []
+        start = 0
+        for size in self.sizer.plan([item.tokens for item in batch], idle):
+            chunks.append(batch[start:start + size])
+            start += size
+        return chunks
+
+    async def _run(self) -> None:
+        """Flush loop: collect, split and dispatch sub-batches forever"""
+        while True:
+            # Collected tasks not yet handed to a dispatch; failed if the loop body raises
+            batch: List[_QueuedTask] = []
+            try:
+                # Skip tasks whose caller has already given up
+                batch = [item for item in await self._collect() if not item.future.done()]
+                for chunk in self._split(batch) if batch else []:
+                    await self._slots.acquire()
+                    self._in_flight += 1
+                    dispatch = self._loop.create_task(self._dispatch(chunk))
+                    self._dispatches.add(dispatch)
+                    dispatch.add_done_callback(self._dispatches.discard)
+                    batch = batch[len(chunk):]
+            except asyncio.CancelledError:
+                self._fail(batch, RuntimeError("Translation batcher stopped"))
+                raise
+            except Exception as e:
+                logger.error(f"Translation batcher failed to dispatch {len(batch)} tasks: {e}")
+                self._fail(batch, e)
+
+    @staticmethod
+    def _fail(items: List[_QueuedTask], error: BaseException) -> None:
+        """Hand an error to every caller still waiting on one of the items"""
+        for item in items:
+            if not item.future.done():
+                item.future.set_exception(error)
+
+    def _hedge_delay(self) -> Optional[float]:
+        """Seconds after which an unanswered call is duplicated, or None when hedging is off"""
+        if not self.hedging or len(self._latencies) < HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * self.hedge_percentile / 100))]
+
+    async def _send_hedged(
+        self,
+        tasks: List[Dict[str, Any]],
+        on_result: ResultCallback
+    ) -> Dict[str, Dict[str, Any]]:
+        """Send one call; if it outlives the hedge delay and a slot is spare, race a duplicate"""
+        started = time.monotonic()
+        primary = self._loop.create_task(self.send(tasks, on_result))
+        delay = self._hedge_delay()
+
+        if delay is not None:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            # A hedge takes a concurrency slot like any other call, and only when one is free
+            # right away, so it never delays queued sub-batches
+            if not done and not self._slots.locked():
+                await self._slots.acquire()
+                self.hedges_sent += 1
+                self._hedges_in_flight += 1
+                # Both calls stream into the same callback; whichever parses an item first delivers it
+                hedge = self._loop.create_task(self.send(tasks, on_result))
+                pending = {primary, hedge}
+                try:
+                    while pending:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for call in done:
+                            # A failed call returns no results; keep waiting for the other one
+                            if not call.exception() and call.result():
+                                if call is hedge:
+                                    self.hedges_won += 1
+                                self._latencies.append(time.monotonic() - started)
+                                return call.result()
+                    return {}
+                finally:
+                    self._hedges_in_flight -= 1
+                    self._slots.release()
+                    for call in pending:
+                        call.cancel()
+
+        results = await primary
+        if results:
+            self._latencies.append(time.monotonic() - started)
+        return results
+
+    async def _dispatch(self, chunk: List[_QueuedTask]) -> None:
+        """Send one sub-batch, re-sending only the missing tasks, and resolve each caller's future"""
+        by_id = {item.task["id"]: item for item in chunk}
+
+        def deliver(task_id: str, result: Dict[str, Any]) -> None:
+            item = by_id.get(task_id)
+            if item is None or item.future.done():
+                return
+            # An item missing any requested language stays in `remaining` and is re-sent
+            if all(result.get(TRANSLATION_FIELDS[language]) for language in task_languages(item.task)):
+                item.future.set_result(result)
+
+        remaining = chunk
+        try:
+            self.batches_sent += 1
+            self.items_sent += len(chunk)
+
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    self.retries += 1
+                    self.retried_items += len(remaining)
+                    await asyncio.sleep(self.retry_backoff * (2 ** (attempt - 1)))
+
+                started = time.monotonic()
+                try:
+                    results = await self._send_hedged([item.task for item in remaining], deliver)
+                except Exception as e:
+                    logger.error(f"Translation sub-batch of {len(remaining)} items failed: {e}")
+                    results = {}
+                if results:
+                    self.sizer.observe(len(remaining), time.monotonic() - started)
+
+                # Items are normally handed back while the call streams; catch any the callback missed
+                for task_id, result in results.items():
+                    deliver(task_id, result)
+                remaining = [item for item in remaining if not item.future.done()]
+                if not remaining:
+                    break
+        finally:
+            self._in_flight -= 1
+            self._slots.release()
+
+            self.failed_items += len(remaining)
+            for item in remaining:
+                if not item.future.done():
+                    item.future.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return batching counters"""
+        return {
+            "batches_sent": self.batches_sent,
+            "items_sent": self.items_sent,
+            "avg_items_per_batch": round(self.items_sent / self.batches_sent, 2) if self.batches_sent else 0,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "in_flight": self._in_flight,
+            "retries": self.retries,
+            "retried_items": self.retried_items,
+            "failed_items": self.failed_items,
+            "hedges_sent": self.hedges_sent,
+            "hedges_won": self.hedges_won,
+            "sizing": self.sizer.stats()
+        }
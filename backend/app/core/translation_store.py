@@ -0,0 +1,150 @@
+from typing import Any, Dict, List, Optional, Set
+import asyncio
+import hashlib
+import json
+import logging
+
+from cachetools import LRUCache
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.translation import TranslationEntry
+
+logger = logging.getLogger(__name__)
+
+# Output field produced by the translation model for each supported language
+TRANSLATION_FIELDS = {
+    "en": "translatedEnText",
+    "ja": "translatedJaText",
+    "es": "translatedEsText",
+}
+
+
+def task_languages(task: Dict[str, Any]) -> List[str]:
+    """Languages requested for a translation task (all supported languages by default)"""
+    return task.get("langs") or list(TRANSLATION_FIELDS)
+
+
+def max_chars_for(task: Dict[str, Any], language: str) -> int:
+    """Character limit sent to the model for one language of a translation task"""
+    return task.get(f"max_chars_{language}", len(task["text"]) * 2)
+
+
+class TranslationStore:
+    def __init__(self, database_url: Optional[str] = None, max_entries: Optional[int] = None):
+        """
+        Content-addressed translation store: an in-process LRU in front of a SQL table.
+        Args:
+            database_url: Separate database for the store (e.g. sqlite:///data/translations.db);
+                          defaults to the application's Postgres database
+            max_entries: Number of per-language translations kept in memory
+        """
+        database_url = database_url or settings.TRANSLATION_STORE_URL
+        if database_url:
+            engine = create_engine(database_url)
+            TranslationEntry.__table__.create(bind=engine, checkfirst=True)
+            self.session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        else:
+            self.session_factory = SessionLocal
+
+        self.memory = LRUCache(maxsize=max_entries or settings.TRANSLATION_CACHE_MAX_ENTRIES)
+        self._pending_writes: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def make_key(text: str, content_type: str, language: str, max_chars: Optional[int]) -> str:
+        """Hash identifying one translation of `text` into `language`"""
+        payload = json.dumps([content_type, language, max_chars, text], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _task_keys(self, task: Dict[str, Any]) -> Dict[str, str]:
+        """Store keys for every language of a translation task"""
+        return {
+            language: self.make_key(task["text"], task["type"], language, max_chars_for(task, language))
+            for language in task_languages(task)
+        }
+
+    def _load(self, keys: List[str]) -> Dict[str, str]:
+        """Fetch stored translations for `keys` from the database"""
+        db = self.session_factory()
+        try:
+            rows = db.query(TranslationEntry).filter(TranslationEntry.key.in_(keys)).all()
+            return {row.key: row.translated_text for row in rows}
+        finally:
+            db.close()
+
+    def _save(self, entries: Dict[str, Dict[str, str]]) -> None:
+        """Insert translations, ignoring keys another worker stored first"""
+        db = self.session_factory()
+        try:
+            dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+            stmt = dialect.insert(TranslationEntry).values([
+                {"key": key, "language": entry["language"], "translated_text": entry["text"]}
+                for key, entry in entries.items()
+            ]).on_conflict_do_nothing(index_elements=["key"])
+            db.execute(stmt)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to persist translations: {e}")
+        finally:
+            db.close()
+
+    async def get_many(self, tasks: List[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
+        """
+        Look up the requested languages of translation tasks in memory, then in the database.
+        Args:
+            tasks: Translation task dictionaries
+        Returns:
+            Stored translations keyed by task id, then by language; languages
+            that were never translated are absent so callers can fill them in
+        """
+        task_keys = {task["id"]: self._task_keys(task) for task in tasks}
+
+        missing = [
+            key for keys in task_keys.values() for key in keys.values()
+            if key not in self.memory
+        ]
+        if missing:
+            try:
+                found = await asyncio.to_thread(self._load, missing)
+            except Exception as e:
+                logger.error(f"Failed to read translation store: {e}")
+                found = {}
+            self.memory.update(found)
+
+        stored = {}
+        for task_id, keys in task_keys.items():
+            texts = {
+                language: self.memory[key]
+                for language, key in keys.items()
+                if key in self.memory
+            }
+            if texts:
+                stored[task_id] = texts
+        return stored
+
+    def put_many(self, tasks: List[Dict[str, Any]], results: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Remember model translations in memory and persist them in the background.
+        Args:
+            tasks: Translation tasks that were sent to the model
+            results: Model results keyed by task id
+        """
+        entries = {}
+        for task in tasks:
+            result = results.get(task["id"])
+            if not result:
+                continue
+            for language, key in self._task_keys(task).items():
+                text = result.get(TRANSLATION_FIELDS[language])
+                if text:
+                    self.memory[key] = text
+                    entries[key] = {"language": language, "text": text}
+
+        if entries:
+            write = asyncio.create_task(asyncio.to_thread(self._save, entries))
+            self._pending_writes.add(write)
+            write.add_done_callback(self._pending_writes.discard)
@@ -0,0 +1,176 @@
+from typing import Any, Dict, Optional
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+
+from app.core.http_client import http_client
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before retrying a failed first load, so lookups do not hammer a down upstream
+LOAD_RETRY_INTERVAL = 60.0
+
+
+class UpstreamIndex:
+    def __init__(
+        self,
+        url: str,
+        refresh_interval: float,
+        snapshot_path: Optional[str] = None,
+        save_snapshot: bool = False
+    ):
+        """
+        In-memory index over one Stats API document, loaded once and refreshed in the background.
+        Refreshes are conditional requests, so an unchanged document costs a 304 and no rebuild.
+        Subclasses implement _build to turn the JSON document into lookup tables.
+        Args:
+            url: Stats API endpoint
+            refresh_interval: Seconds before the document is re-validated upstream
+            snapshot_path: Local copy of the document served when the first load fails
+            save_snapshot: Overwrite snapshot_path with each changed upstream document, so the
+                last good copy survives restarts
+        """
+        self.url = url
+        self.refresh_interval = refresh_interval
+        self.snapshot_path = snapshot_path
+        self.save_snapshot = save_snapshot
+        self.loaded_at: Optional[float] = None
+        self._refresh_due: Optional[float] = None
+        # "upstream" or "snapshot" once loaded
+        self.source: Optional[str] = None
+        self._load_failed_at: Optional[float] = None
+
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._digest: Optional[str] = None
+        self._loading: Optional[asyncio.Task] = None
+        self._refreshing: Optional[asyncio.Task] = None
+
+        self.refreshes = 0
+        self.not_modified = 0
+        self.refresh_failures = 0
+
+    def _build(self, document: Dict[str, Any]) -> None:
+        """Rebuild the lookup tables from the document and swap them in together"""
+        raise NotImplementedError
+
+    def _size(self) -> int:
+        """Number of indexed entries, for stats"""
+        return 0
+
+    async def refresh(self) -> bool:
+        """
+        Re-validate the document upstream and rebuild the index if it changed.
+        Returns:
+            True if the index was rebuilt
+        """
+        headers = {}
+        if self._etag:
+            headers['If-None-Match'] = self._etag
+        if self._last_modified:
+            headers['If-Modified-Since'] = self._last_modified
+
+        response = await http_client.get(self.url, headers=headers or None)
+        self.refreshes += 1
+        if response.status_code == 304:
+            self._refresh_due = time.monotonic() + self.refresh_interval
+            self.not_modified += 1
+            return False
+        response.raise_for_status()
+
+        self._etag = response.headers.get('ETag')
+        self._last_modified = response.headers.get('Last-Modified')
+        # Upstreams without validators still skip the rebuild when the body is unchanged
+        digest = hashlib.sha256(response.content).hexdigest()
+        self._refresh_due = time.monotonic() + self.refresh_interval
+        if digest == self._digest:
+            self.not_modified += 1
+            return False
+
+        self._build(response.json())
+        self._digest = digest
+        self.loaded_at = time.monotonic()
+        self.source = "upstream"
+        logger.info(f"{type(self).__name__} loaded {self._size()} entries")
+        if self.save_snapshot and self.snapshot_path:
+            await asyncio.to_thread(self._write_snapshot, response.content)
+        return True
+
+    def _write_snapshot(self, content: bytes) -> None:
+        """Replace the snapshot atomically; a failed write only loses the fallback"""
+        tmp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            logger.warning(f"Could not write snapshot {self.snapshot_path}: {e}")
+
+    def _load_snapshot(self) -> bool:
+        """
+        Build from the local snapshot and schedule the next upstream attempt
+        as a background refresh after LOAD_RETRY_INTERVAL.
+        """
+        if not self.snapshot_path:
+            return False
+        try:
+            with open(self.snapshot_path, 'r') as f:
+                document = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read snapshot {self.snapshot_path}: {e}")
+            return False
+        self._build(document)
+        self.source = "snapshot"
+        self.loaded_at = time.monotonic()
+        self._refresh_due = self.loaded_at + LOAD_RETRY_INTERVAL
+        logger.info(f"{type(self).__name__} loaded {self._size()} entries from {self.snapshot_path}")
+        return True
+
+    async def _background_refresh(self) -> None:
+        """Scheduled refresh that keeps serving the current index if it fails"""
+        try:
+            await self.refresh()
+        except Exception as e:
+            self.refresh_failures += 1
+            self._refresh_due = time.monotonic() + LOAD_RETRY_INTERVAL
+            logger.warning(f"{type(self).__name__} refresh failed: {e}")
+        finally:
+            self._refreshing = None
+
+    async def ensure_loaded(self) -> None:
+        """
+        Load the document on first use (concurrent callers share one download) and
+        start a background refresh once the refresh interval has passed.
+        """
+        if self.loaded_at is None:
+            if self._load_failed_at is not None and time.monotonic() - self._load_failed_at < LOAD_RETRY_INTERVAL:
+                raise RuntimeError(f"{type(self).__name__} unavailable, waiting before the next load attempt")
+            if self._loading is None:
+                self._loading = asyncio.create_task(self.refresh())
+            try:
+                await asyncio.shield(self._loading)
+            except Exception as e:
+                if self.loaded_at is None and not self._load_snapshot():
+                    self._load_failed_at = time.monotonic()
+                    raise
+                logger.warning(f"{type(self).__name__} serving its snapshot: {e}")
+            finally:
+                self._loading = None
+            return
+
+        if time.monotonic() >= self._refresh_due and self._refreshing is None:
+            self._refreshing = asyncio.create_task(self._background_refresh())
+
+    def stats(self) -> Dict[str, Any]:
+        """Return index size, source and refresh counters"""
+        return {
+            "entries": self._size(),
+            "source": self.source,
+            "age_seconds": None if self.loaded_at is None else round(time.monotonic() - self.loaded_at, 1),
+            "refreshes": self.refreshes,
+            "not_modified": self.not_modified,
+            "refresh_failures": self.refresh_failures
+        }
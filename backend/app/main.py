@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from app.api.endpoints import chat, content, auth, player, subscriptions
 from app.core.database import Base, engine, get_db
+from app.core.http_client import http_client
 from datetime import datetime
 from fastapi.responses import JSONResponse
 from sqlalchemy import text
@@ -26,7 +27,8 @@ app = FastAPI(
     title="MLB API",
     description="Backend API for MLB application",
     version="1.0.0",
-    on_startup=[create_tables]
+    on_startup=[create_tables],
+    on_shutdown=[http_client.aclose]
 )
 
 # Configure CORS with HTTPS
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, Text, DateTime, func
+from ..core.database import Base
+
+class TranslationEntry(Base):
+    __tablename__ = "translations"
+
+    # sha256 of (content type, language, max characters, source text)
+    key = Column(String(64), primary_key=True)
+    language = Column(String(8), nullable=False)
+    translated_text = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,17 +1,32 @@
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
 import json
-import requests
+import time
 from app.core.config import settings
+from app.core.homerun_dataset import HomeRunDataset
+from app.core.homerun_snapshot import HR_SOURCES, ingest_sources, load_snapshot, load_source, snapshot_versions
+from app.core.http_client import http_client
+from app.core.response_cache import ResponseCache
+from app.core.single_flight import SingleFlight, coalesce
+from app.core.text_utils import fold_name
 from app.core.translate_assistant import TranslateAssistant
-import pandas as pd
-import re
+from app.core.translation_store import TRANSLATION_FIELDS
 import isodate
+import numpy as np
+
+CUSTOM_SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
 
 class PlayerContentService:
     def __init__(self):
         self._load_player_images()
         self._load_mlb_hr_data()
         self.translator = TranslateAssistant(settings.GOOGLE_API_KEY)
+        self.response_cache = ResponseCache(
+            ttl=settings.CONTENT_CACHE_TTL,
+            stale_ttl=settings.CONTENT_CACHE_STALE_TTL,
+            max_entries=settings.CONTENT_CACHE_MAX_ENTRIES
+        )
+        self.single_flight = SingleFlight()
     
     def _load_player_images(self):
         """Load player images from JSON file"""
@@ -22,29 +37,262 @@ class PlayerContentService:
             self.player_images = {}
     
     def _load_mlb_hr_data(self):
-        """Load MLB home run data from CSV files"""
+        """
+        Load the local home run snapshot, downloading only the season CSVs missing from it.
+        Season files that fail to download or load are skipped; the rest are still served.
+        """
         try:
-            mlb_hr_csvs_list = [
-                'https://storage.googleapis.com/gcp-mlb-hackathon-2025/datasets/2016-mlb-homeruns.csv',
-                'https://storage.googleapis.com/gcp-mlb-hackathon-2025/datasets/2017-mlb-homeruns.csv',
-                'https://storage.googleapis.com/gcp-mlb-hackathon-2025/datasets/2024-mlb-homeruns.csv',
-                'https://storage.googleapis.com/gcp-mlb-hackathon-2025/datasets/2024-postseason-mlb-homeruns.csv'
-            ]
-            
-            # Create DataFrame to store all home run data
-            dfs = []
-            for csv_url in mlb_hr_csvs_list:
-                df = pd.read_csv(csv_url)
-                season = re.search(r'/datasets/(\d{4})', csv_url).group(1)
-                df['season'] = season
-                dfs.append(df)
-            
-            self.all_mlb_hrs = pd.concat(dfs, ignore_index=True)[
-                ['season', 'play_id', 'title', 'ExitVelocity', 'LaunchAngle', 'HitDistance', 'video']
-            ]
+            missing = [key for key in HR_SOURCES if key not in snapshot_versions(settings.HR_SNAPSHOT_DIR)]
+            if missing:
+                print(f"Home run seasons missing from the local snapshot, ingesting: {', '.join(missing)}")
+                ingested = ingest_sources(settings.HR_SNAPSHOT_DIR, keys=missing)
+                failed = [key for key in missing if key not in ingested]
+                if failed:
+                    print(f"Could not ingest home run seasons: {', '.join(failed)}")
+            sources = load_snapshot(settings.HR_SNAPSHOT_DIR)
         except Exception as e:
             print(f"Error loading MLB home run data: {e}")
-            self.all_mlb_hrs = pd.DataFrame()
+            sources = {}
+
+        self.homeruns = HomeRunDataset(sources)
+        versions = snapshot_versions(settings.HR_SNAPSHOT_DIR) if sources else {}
+        self.homerun_versions = {key: version for key, version in versions.items() if key in sources}
+        # Every worker process re-reads the snapshot manifest on access, so a reload or ingest
+        # seen by one worker reaches the others within HR_RELOAD_CHECK_INTERVAL
+        self._homerun_check_due = time.monotonic() + settings.HR_RELOAD_CHECK_INTERVAL
+        self._homerun_reload: Optional[asyncio.Task] = None
+        self._homerun_lock = asyncio.Lock()
+
+    async def reload_mlb_hr_data(self) -> Dict:
+        """
+        Pick up season files ingested since startup
+        Returns:
+            Loaded versions; new season files are appended to the dataset, and
+            a season file that changed in place triggers a full rebuild
+        """
+        async with self._homerun_lock:
+            versions = await asyncio.to_thread(snapshot_versions, settings.HR_SNAPSHOT_DIR)
+            changed = [
+                key for key in self.homeruns.source_keys
+                if versions.get(key) != self.homerun_versions.get(key)
+            ]
+            added = [key for key in versions if key not in self.homeruns.source_keys]
+
+            if changed:
+                sources = await asyncio.to_thread(load_snapshot, settings.HR_SNAPSHOT_DIR)
+                self.homeruns = await asyncio.to_thread(HomeRunDataset, sources)
+            elif added:
+                self.homeruns = await asyncio.to_thread(self._extend_homeruns, added)
+            self.homerun_versions = versions
+            self._homerun_check_due = time.monotonic() + settings.HR_RELOAD_CHECK_INTERVAL
+
+        return {"versions": versions, "added": added, "rebuilt": changed}
+
+    def _extend_homeruns(self, keys: List[str]) -> HomeRunDataset:
+        """Append season files to a copy of the dataset, which keeps serving until it is swapped out"""
+        homeruns = self.homeruns.copy()
+        for key in keys:
+            homeruns.add_source(key, load_source(key, settings.HR_SNAPSHOT_DIR))
+        return homeruns
+
+    async def _background_homerun_reload(self) -> None:
+        """Scheduled snapshot check that keeps serving the current dataset if it fails"""
+        try:
+            await self.reload_mlb_hr_data()
+        except Exception as e:
+            print(f"Error reloading MLB home run data: {e}")
+        finally:
+            self._homerun_check_due = time.monotonic() + settings.HR_RELOAD_CHECK_INTERVAL
+            self._homerun_reload = None
+
+    def _current_homeruns(self) -> HomeRunDataset:
+        """
+        The loaded dataset; once HR_RELOAD_CHECK_INTERVAL has passed, also start a background
+        check of the snapshot manifest (only from the event loop thread)
+        """
+        if time.monotonic() >= self._homerun_check_due and self._homerun_reload is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return self.homeruns
+            self._homerun_reload = loop.create_task(self._background_homerun_reload())
+        return self.homeruns
+
+    async def _get_json(self, url: str, params: Dict) -> Dict:
+        """
+        GET a Google API endpoint through the response cache
+        Args:
+            url: API endpoint
+            params: Query parameters, including the API key
+        Returns:
+            Decoded JSON body; the cache key is the endpoint plus every
+            parameter except the API key, with the search query normalized
+        """
+        key_params = {
+            name: (" ".join(str(value).lower().split()) if name == 'q' else value)
+            for name, value in params.items()
+            if name != 'key'
+        }
+        cache_key = (url, tuple(sorted(key_params.items())))
+
+        async def fetch() -> Dict:
+            response = await http_client.get(url, params=params)
+            response.raise_for_status()
+            return response.json()
+
+        return await self.response_cache.get_or_fetch(cache_key, fetch)
+
+    async def _fetch_custom_search_page(self, query: str, start_index: int) -> Dict:
+        """Fetch a single Custom Search results page"""
+        params = {
+            'key': settings.GOOGLE_API_KEY,
+            'cx': settings.GOOGLE_SEARCH_ENGINE_ID,
+            'q': query,
+            'start': start_index
+        }
+
+        return await self._get_json(CUSTOM_SEARCH_URL, params)
+
+    def _parse_news_items(self, data: Dict) -> List[Dict]:
+        """Extract news results with all required fields from a Custom Search page"""
+        results = []
+        for item in data.get('items', []):
+            result = {
+                'url': item.get('link'),
+                'domain': item.get('displayLink'),
+                'title': item.get('title'),
+                'snippet': item.get('snippet'),
+                'image_url': (item.get('pagemap', {})
+                            .get('metatags', [{}])[0]
+                            .get('og:image'))
+            }
+
+            if not all(result.values()):
+                continue
+
+            results.append(result)
+        return results
+
+    async def _search_news_items(self, query: str, limit: int) -> List[Dict]:
+        """
+        Fetch Custom Search pages concurrently and collect up to `limit` news results
+        Args:
+            query: Search query string
+            limit: Maximum number of valid results to return
+        Returns:
+            Results in page order; pages still in flight once the leading
+            pages hold `limit` valid results are cancelled
+        """
+        num_requests = (min(limit, 100) + 9) // 10
+        page_tasks = [
+            asyncio.create_task(self._fetch_custom_search_page(query, (i * 10) + 1))
+            for i in range(num_requests)
+        ]
+        pages: Dict[int, List[Dict]] = {}
+        results = []
+        next_page = 0
+
+        try:
+            pending = set(page_tasks)
+            while pending and len(results) < limit:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pages[page_tasks.index(task)] = self._parse_news_items(task.result())
+
+                # Only consume pages in order so results stay stable across runs
+                while next_page in pages and len(results) < limit:
+                    results.extend(pages.pop(next_page))
+                    next_page += 1
+        finally:
+            for task in page_tasks:
+                if not task.done():
+                    task.cancel()
+
+        return results[:limit]
+
+    async def _search_video_items(
+        self,
+        query: str,
+        max_results: int,
+        order: str,
+        min_duration: int,
+        max_duration: int,
+        limit: int
+    ) -> List[Dict]:
+        """
+        Search YouTube and keep up to `limit` videos within the duration range
+        Args:
+            query: YouTube search query
+            max_results: Number of search results requested
+            order: YouTube result order ('date' or 'relevance')
+            min_duration: Shortest video kept, in seconds
+            max_duration: Longest video kept, in seconds
+            limit: Maximum number of videos returned
+        """
+        API_KEY = settings.GOOGLE_API_KEY
+        BASE_URL = "https://www.googleapis.com/youtube/v3/search"
+        
+        params = {
+            'part': 'snippet',
+            'q': query,
+            'maxResults': max_results,
+            'key': API_KEY,
+            'type': 'video',
+            'order': order
+        }
+        
+        data = await self._get_json(BASE_URL, params)
+        
+        video_ids = [item['id']['videoId'] for item in data.get('items', [])]
+        
+        # Get video durations
+        videos_url = "https://www.googleapis.com/youtube/v3/videos"
+        videos_params = {
+            'part': 'contentDetails',
+            'id': ','.join(video_ids),
+            'key': API_KEY
+        }
+        
+        videos_data = await self._get_json(videos_url, videos_params)
+        
+        processed_videos = []
+        for item in data.get('items', []):
+            video_id = item['id']['videoId']
+            video_details = next(
+                (v for v in videos_data.get('items', []) 
+                 if v['id'] == video_id), None
+            )
+            
+            if video_details:
+                duration_str = video_details['contentDetails']['duration']
+                duration_seconds = int(isodate.parse_duration(duration_str).total_seconds())
+                
+                if min_duration <= duration_seconds <= max_duration:
+                    video_info = {
+                        'video_id': video_id,
+                        'title': item['snippet']['title'],
+                        'description': item['snippet']['description'],
+                        'thumbnail': item['snippet']['thumbnails']['high']['url'],
+                        'duration_seconds': duration_seconds,
+                        'embed_code': f'<iframe width="560" height="315" src="https://www.youtube.com/embed/{video_id}" frameborder="0" allowfullscreen></iframe>'
+                    }
+                    
+                    if not all(video_info.values()):
+                        continue
+                    
+                    processed_videos.append(video_info)
+                    if len(processed_videos) >= limit:
+                        break
+
+        return processed_videos
+
+    def get_stats(self) -> Dict:
+        """Return request coalescing and response cache counters"""
+        return {
+            "single_flight": self.single_flight.stats(),
+            "response_cache": self.response_cache.stats(),
+            "translation_batcher": self.translator.batcher.stats()
+        }
 
     def get_player_images(self, team: str, player: str) -> List[str]:
         """Get Getty Images embeds for a player"""
@@ -54,6 +302,26 @@ class PlayerContentService:
             print(f"Error getting player images: {e}")
             return []
 
+    def find_player_images(self, player: str, team: Optional[str] = None) -> List[str]:
+        """Get Getty Images embeds for a player, searching every team when none is given"""
+        if team:
+            return self.get_player_images(team, player)
+        name = fold_name(player)
+        for players in self.player_images.values():
+            for candidate, images in players.items():
+                if fold_name(candidate) == name:
+                    return images
+        return []
+
+    def _apply_translation(self, item: Dict, field: str, translation: Optional[Dict], langs: List[str]):
+        """Set `{field}_{lang}` on an item for each requested language"""
+        for language in langs:
+            if translation:
+                item[f"{field}_{language}"] = translation[TRANSLATION_FIELDS[language]]
+            else:
+                item[f"{field}_{language}"] = "Not Translated"
+
+    @coalesce
     async def get_player_news(
         self,
         player_name: str,
@@ -63,50 +331,17 @@ class PlayerContentService:
         max_chars_title_es: Optional[int] = 45,
         max_chars_summary_en: Optional[int] = 50,
         max_chars_summary_ja: Optional[int] = 65,
-        max_chars_summary_es: Optional[int] = 65
+        max_chars_summary_es: Optional[int] = 65,
+        langs: Optional[List[str]] = None,
+        translation_mode: str = "quality"
     ) -> List[Dict]:
         """Get news about a player with batch translation"""
+        langs = langs or list(TRANSLATION_FIELDS)
         results = {}
-        results_idx = 0
         try:
-            API_KEY = settings.GOOGLE_API_KEY
-            SEARCH_ENGINE_ID = settings.GOOGLE_SEARCH_ENGINE_ID
-            BASE_URL = "https://www.googleapis.com/customsearch/v1"
-            
-            num_requests = (min(limit, 100) + 9) // 10
-            
-            for i in range(num_requests):
-                start_index = (i * 10) + 1
-                
-                params = {
-                    'key': API_KEY,
-                    'cx': SEARCH_ENGINE_ID,
-                    'q': f"{player_name} mlb latest news",
-                    'start': start_index
-                }
-                
-                response = requests.get(BASE_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                for item in data.get('items', []):
-                    result = {
-                        'url': item.get('link'),
-                        'domain': item.get('displayLink'),
-                        'title': item.get('title'),
-                        'snippet': item.get('snippet'),
-                        'image_url': (item.get('pagemap', {})
-                                    .get('metatags', [{}])[0]
-                                    .get('og:image'))
-                    }
-                    
-                    if not all(result.values()):
-                        continue
-
-                    results[results_idx] = result
-                    results_idx += 1
-                    if results_idx >= limit:
-                        break
+            news_items = await self._search_news_items(f"{player_name} mlb latest news", limit)
+            for results_idx, result in enumerate(news_items):
+                results[results_idx] = result
 
             # Prepare batch translation tasks
             translation_tasks = []
@@ -118,7 +353,9 @@ class PlayerContentService:
                     "type": "news_title",
                     "max_chars_en": max_chars_title_en,
                     "max_chars_ja": max_chars_title_ja,
-                    "max_chars_es": max_chars_title_es
+                    "max_chars_es": max_chars_title_es,
+                    "langs": langs,
+                    "mode": translation_mode
                 })
                 
                 # Add summary translation task
@@ -128,7 +365,9 @@ class PlayerContentService:
                     "type": "news_summary",
                     "max_chars_en": max_chars_summary_en,
                     "max_chars_ja": max_chars_summary_ja,
-                    "max_chars_es": max_chars_summary_es
+                    "max_chars_es": max_chars_summary_es,
+                    "langs": langs,
+                    "mode": translation_mode
                 })
 
             # Process batch translation
@@ -139,20 +378,8 @@ class PlayerContentService:
                 title_key = f"title_{idx}"
                 summary_key = f"summary_{idx}"
                 
-                if title_key in translated_results and summary_key in translated_results:
-                    results[idx]['title_en'] = translated_results[title_key]['translatedEnText']
-                    results[idx]['title_ja'] = translated_results[title_key]['translatedJaText']
-                    results[idx]['title_es'] = translated_results[title_key]['translatedEsText']
-                    results[idx]['snippet_en'] = translated_results[summary_key]['translatedEnText']
-                    results[idx]['snippet_ja'] = translated_results[summary_key]['translatedJaText']
-                    results[idx]['snippet_es'] = translated_results[summary_key]['translatedEsText']
-                else:
-                    results[idx]['title_en'] = "Not Translated"
-                    results[idx]['title_ja'] = "Not Translated"
-                    results[idx]['title_es'] = "Not Translated"
-                    results[idx]['snippet_en'] = "Not Translated"
-                    results[idx]['snippet_ja'] = "Not Translated"
-                    results[idx]['snippet_es'] = "Not Translated"
+                self._apply_translation(results[idx], 'title', translated_results.get(title_key), langs)
+                self._apply_translation(results[idx], 'snippet', translated_results.get(summary_key), langs)
             
             return results
             
@@ -160,6 +387,7 @@ class PlayerContentService:
             print(f"Error getting player news: {e}")
             return []
 
+    @coalesce
     async def get_player_videos(
         self,
         player_name: str,
@@ -171,91 +399,50 @@ class PlayerContentService:
         max_chars_title_es: Optional[int] = 45,
         max_chars_description_en: Optional[int] = 50,
         max_chars_description_ja: Optional[int] = 65,
-        max_chars_description_es: Optional[int] = 65
+        max_chars_description_es: Optional[int] = 65,
+        langs: Optional[List[str]] = None,
+        translation_mode: str = "quality"
     ) -> List[Dict]:
         """Get YouTube videos about a player with batch translation"""
+        langs = langs or list(TRANSLATION_FIELDS)
         try:
-            API_KEY = settings.GOOGLE_API_KEY
-            BASE_URL = "https://www.googleapis.com/youtube/v3/search"
-            
-            params = {
-                'part': 'snippet',
-                'q': f"{player_name} mlb highlights",
-                'maxResults': 20,
-                'key': API_KEY,
-                'type': 'video',
-                'order': 'date'
-            }
-            
-            response = requests.get(BASE_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            video_ids = [item['id']['videoId'] for item in data.get('items', [])]
-            
-            # Get video durations
-            videos_url = "https://www.googleapis.com/youtube/v3/videos"
-            videos_params = {
-                'part': 'contentDetails',
-                'id': ','.join(video_ids),
-                'key': API_KEY
-            }
-            
-            videos_response = requests.get(videos_url, params=videos_params)
-            videos_response.raise_for_status()
-            videos_data = videos_response.json()
-            
-            # Process and filter videos with batch translation
-            processed_videos = []
+            processed_videos = await self._search_video_items(
+                f"{player_name} mlb highlights",
+                max_results=20,
+                order='date',
+                min_duration=min_duration,
+                max_duration=max_duration,
+                limit=limit
+            )
+
+            # Prepare batch translation tasks
             translation_tasks = []
-            
-            for item in data.get('items', []):
-                video_id = item['id']['videoId']
-                video_details = next(
-                    (v for v in videos_data.get('items', []) 
-                     if v['id'] == video_id), None
-                )
-                
-                if video_details:
-                    duration_str = video_details['contentDetails']['duration']
-                    duration_seconds = int(isodate.parse_duration(duration_str).total_seconds())
-                    
-                    if min_duration <= duration_seconds <= max_duration:
-                        video_info = {
-                            'video_id': video_id,
-                            'title': item['snippet']['title'],
-                            'description': item['snippet']['description'],
-                            'thumbnail': item['snippet']['thumbnails']['high']['url'],
-                            'duration_seconds': duration_seconds,
-                            'embed_code': f'<iframe width="560" height="315" src="https://www.youtube.com/embed/{video_id}" frameborder="0" allowfullscreen></iframe>'
-                        }
-                        
-                        if not all(video_info.values()):
-                            continue
-                        
-                        # Add title translation task
-                        translation_tasks.append({
-                            "id": f"title_{video_id}",
-                            "text": video_info['title'],
-                            "type": "news_title",
-                            "max_chars_en": max_chars_title_en,
-                            "max_chars_ja": max_chars_title_ja,
-                            "max_chars_es": max_chars_title_es
-                        })
-                        
-                        # Add description translation task
-                        translation_tasks.append({
-                            "id": f"desc_{video_id}",
-                            "text": video_info['description'],
-                            "type": "news_summary",
-                            "max_chars_en": max_chars_description_en,
-                            "max_chars_ja": max_chars_description_ja,
-                            "max_chars_es": max_chars_description_es
-                        })
-                        
-                        processed_videos.append(video_info)
-                        if len(processed_videos) >= limit:
-                            break
+            for video_info in processed_videos:
+                video_id = video_info['video_id']
+
+                # Add title translation task
+                translation_tasks.append({
+                    "id": f"title_{video_id}",
+                    "text": video_info['title'],
+                    "type": "news_title",
+                    "max_chars_en": max_chars_title_en,
+                    "max_chars_ja": max_chars_title_ja,
+                    "max_chars_es": max_chars_title_es,
+                    "langs": langs,
+                    "mode": translation_mode
+                })
+
+                # Add description translation task
+                translation_tasks.append({
+                    "id": f"desc_{video_id}",
+                    "text": video_info['description'],
+                    "type": "news_summary",
+                    "max_chars_en": max_chars_description_en,
+                    "max_chars_ja": max_chars_description_ja,
+                    "max_chars_es": max_chars_description_es,
+                    "langs": langs,
+                    "mode": translation_mode
+                })
 
             # Process batch translation
             translated_results = await self.translator.translate_batch(translation_tasks)
@@ -265,20 +452,8 @@ class PlayerContentService:
                 title_key = f"title_{video['video_id']}"
                 desc_key = f"desc_{video['video_id']}"
                 
-                if title_key in translated_results and desc_key in translated_results:
-                    video['title_en'] = translated_results[title_key]['translatedEnText']
-                    video['title_ja'] = translated_results[title_key]['translatedJaText']
-                    video['title_es'] = translated_results[title_key]['translatedEsText']
-                    video['description_en'] = translated_results[desc_key]['translatedEnText']
-                    video['description_ja'] = translated_results[desc_key]['translatedJaText']
-                    video['description_es'] = translated_results[desc_key]['translatedEsText']
-                else:
-                    video['title_en'] = "Not Translated"
-                    video['title_ja'] = "Not Translated"
-                    video['title_es'] = "Not Translated"
-                    video['description_en'] = "Not Translated"
-                    video['description_ja'] = "Not Translated"
-                    video['description_es'] = "Not Translated"
+                self._apply_translation(video, 'title', translated_results.get(title_key), langs)
+                self._apply_translation(video, 'description', translated_results.get(desc_key), langs)
             
             return processed_videos[:limit]
             
@@ -286,6 +461,7 @@ class PlayerContentService:
             print(f"Error getting player videos: {e}")
             return []
 
+    @coalesce
     async def search_news(
         self,
         query: str,
@@ -295,72 +471,41 @@ class PlayerContentService:
         max_chars_title_es: Optional[int] = 45,
         max_chars_summary_en: Optional[int] = 50,
         max_chars_summary_ja: Optional[int] = 65,
-        max_chars_summary_es: Optional[int] = 65
+        max_chars_summary_es: Optional[int] = 65,
+        langs: Optional[List[str]] = None,
+        translation_mode: str = "quality"
     ) -> List[Dict]:
         """Search news with batch translation"""
+        langs = langs or list(TRANSLATION_FIELDS)
         results = []
         translation_tasks = []
         try:
-            API_KEY = settings.GOOGLE_API_KEY
-            SEARCH_ENGINE_ID = settings.GOOGLE_SEARCH_ENGINE_ID
-            BASE_URL = "https://www.googleapis.com/customsearch/v1"
-            
-            num_requests = (min(limit, 100) + 9) // 10
-            
-            for i in range(num_requests):
-                start_index = (i * 10) + 1
-                
-                params = {
-                    'key': API_KEY,
-                    'cx': SEARCH_ENGINE_ID,
-                    'q': query,
-                    'start': start_index
-                }
-                
-                response = requests.get(BASE_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                for item in data.get('items', []):
-                    result = {
-                        'url': item.get('link'),
-                        'domain': item.get('displayLink'),
-                        'title': item.get('title'),
-                        'snippet': item.get('snippet'),
-                        'image_url': (item.get('pagemap', {})
-                                    .get('metatags', [{}])[0]
-                                    .get('og:image'))
-                    }
-                    
-                    if not all(result.values()):
-                        continue
-                    
-                    # Add title translation task
-                    translation_tasks.append({
-                        "id": f"title_{len(results)}",
-                        "text": result['title'],
-                        "type": "news_title",
-                        "max_chars_en": max_chars_title_en,
-                        "max_chars_ja": max_chars_title_ja,
-                        "max_chars_es": max_chars_title_es
-                    })
-                    
-                    # Add snippet translation task
-                    translation_tasks.append({
-                        "id": f"snippet_{len(results)}",
-                        "text": result['snippet'],
-                        "type": "news_summary",
-                        "max_chars_en": max_chars_summary_en,
-                        "max_chars_ja": max_chars_summary_ja,
-                        "max_chars_es": max_chars_summary_es
-                    })
-                    
-                    results.append(result)
-                    if len(results) >= limit:
-                        break
-                
-                if len(results) >= limit:
-                    break
+            results = await self._search_news_items(query, limit)
+
+            for idx, result in enumerate(results):
+                # Add title translation task
+                translation_tasks.append({
+                    "id": f"title_{idx}",
+                    "text": result['title'],
+                    "type": "news_title",
+                    "max_chars_en": max_chars_title_en,
+                    "max_chars_ja": max_chars_title_ja,
+                    "max_chars_es": max_chars_title_es,
+                    "langs": langs,
+                    "mode": translation_mode
+                })
+
+                # Add snippet translation task
+                translation_tasks.append({
+                    "id": f"snippet_{idx}",
+                    "text": result['snippet'],
+                    "type": "news_summary",
+                    "max_chars_en": max_chars_summary_en,
+                    "max_chars_ja": max_chars_summary_ja,
+                    "max_chars_es": max_chars_summary_es,
+                    "langs": langs,
+                    "mode": translation_mode
+                })
             
             # Process batch translation
             translated_results = await self.translator.translate_batch(translation_tasks)
@@ -370,20 +515,8 @@ class PlayerContentService:
                 title_key = f"title_{idx}"
                 snippet_key = f"snippet_{idx}"
                 
-                if title_key in translated_results and snippet_key in translated_results:
-                    result['title_en'] = translated_results[title_key]['translatedEnText']
-                    result['title_ja'] = translated_results[title_key]['translatedJaText']
-                    result['title_es'] = translated_results[title_key]['translatedEsText']
-                    result['snippet_en'] = translated_results[snippet_key]['translatedEnText']
-                    result['snippet_ja'] = translated_results[snippet_key]['translatedJaText']
-                    result['snippet_es'] = translated_results[snippet_key]['translatedEsText']
-                else:
-                    result['title_en'] = "Not Translated"
-                    result['title_ja'] = "Not Translated"
-                    result['title_es'] = "Not Translated"
-                    result['snippet_en'] = "Not Translated"
-                    result['snippet_ja'] = "Not Translated"
-                    result['snippet_es'] = "Not Translated"
+                self._apply_translation(result, 'title', translated_results.get(title_key), langs)
+                self._apply_translation(result, 'snippet', translated_results.get(snippet_key), langs)
             
             return results[:limit]
             
@@ -391,48 +524,38 @@ class PlayerContentService:
             print(f"Error searching news: {e}")
             return []
 
+    @coalesce
     async def get_player_hr_videos(
         self, 
         player_name: str, 
         limit: int = 10,
         max_chars_title_en: Optional[int] = 50,
         max_chars_title_ja: Optional[int] = 30,
-        max_chars_title_es: Optional[int] = 45
+        max_chars_title_es: Optional[int] = 45,
+        langs: Optional[List[str]] = None,
+        translation_mode: str = "quality"
     ) -> List[Dict]:
         """Get home run videos for a specific player with batch translation"""
+        langs = langs or list(TRANSLATION_FIELDS)
         try:
-            # Filter home runs by player name
-            player_hrs = []
-            translation_tasks = []
-
-            for _, row in self.all_mlb_hrs.iterrows():
-                if pd.isna(row['title']):
-                    continue
-                title_idx = row['title'].lower().find("homers")
-                if player_name.lower() in row['title'].lower()[:title_idx]:
-                    hr_info = {
-                        'play_id': row['play_id'],
-                        'title': row['title'],
-                        'video_url': row['video'],
-                        'exit_velocity': row['ExitVelocity'],
-                        'launch_angle': row['LaunchAngle'],
-                        'hit_distance': row['HitDistance'],
-                        'season': row['season']
-                    }
+            # Batter-name index lookup; dictionaries are only built for the returned rows
+            homeruns = self._current_homeruns()
+            rows = homeruns.rows_for_batter(player_name)[:limit]
+            player_hrs = homeruns.records(rows)
 
-                    # Add title translation task
-                    translation_tasks.append({
-                        "id": f"title_{row['play_id']}",
-                        "text": hr_info['title'],
-                        "type": "news_title",
-                        "max_chars_en": max_chars_title_en,
-                        "max_chars_ja": max_chars_title_ja,
-                        "max_chars_es": max_chars_title_es
-                    })
-
-                    player_hrs.append(hr_info)
-                    if len(player_hrs) >= limit:
-                        break
+            translation_tasks = []
+            for hr_info in player_hrs:
+                # Add title translation task
+                translation_tasks.append({
+                    "id": f"title_{hr_info['play_id']}",
+                    "text": hr_info['title'],
+                    "type": "news_title",
+                    "max_chars_en": max_chars_title_en,
+                    "max_chars_ja": max_chars_title_ja,
+                    "max_chars_es": max_chars_title_es,
+                    "langs": langs,
+                    "mode": translation_mode
+                })
 
             # Process batch translation
             translated_results = await self.translator.translate_batch(translation_tasks)
@@ -441,14 +564,7 @@ class PlayerContentService:
             for hr in player_hrs:
                 title_key = f"title_{hr['play_id']}"
                 
-                if title_key in translated_results:
-                    hr['title_en'] = translated_results[title_key]['translatedEnText']
-                    hr['title_ja'] = translated_results[title_key]['translatedJaText']
-                    hr['title_es'] = translated_results[title_key]['translatedEsText']
-                else:
-                    hr['title_en'] = "Not Translated"
-                    hr['title_ja'] = "Not Translated"
-                    hr['title_es'] = "Not Translated"
+                self._apply_translation(hr, 'title', translated_results.get(title_key), langs)
             
             return player_hrs[:limit]
             
@@ -456,6 +572,73 @@ class PlayerContentService:
             print(f"Error getting player home run videos: {e}")
             return []
 
+    def query_homeruns(
+        self,
+        seasons: Optional[List[int]] = None,
+        min_exit_velocity: Optional[float] = None,
+        max_exit_velocity: Optional[float] = None,
+        min_launch_angle: Optional[float] = None,
+        max_launch_angle: Optional[float] = None,
+        min_hit_distance: Optional[float] = None,
+        max_hit_distance: Optional[float] = None,
+        player: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        descending: bool = True,
+        limit: int = 10
+    ) -> Dict:
+        """Filter and rank home runs across all loaded seasons"""
+        homeruns = self._current_homeruns()
+        rows, total = homeruns.query(
+            seasons=seasons,
+            ranges={
+                'exit_velocity': (min_exit_velocity, max_exit_velocity),
+                'launch_angle': (min_launch_angle, max_launch_angle),
+                'hit_distance': (min_hit_distance, max_hit_distance)
+            },
+            player=player,
+            sort_by=sort_by,
+            descending=descending,
+            limit=limit
+        )
+        return {"total": total, "homeruns": homeruns.records(rows)}
+
+    def search_homeruns(
+        self,
+        query: str,
+        seasons: Optional[List[int]] = None,
+        offset: int = 0,
+        limit: int = 10
+    ) -> Dict:
+        """Search home-run titles; returns the total match count and one page of home runs"""
+        homeruns = self._current_homeruns()
+        rows, total = homeruns.search_titles(query, seasons=seasons, offset=offset, limit=limit)
+        return {
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "homeruns": homeruns.records(rows)
+        }
+
+    def get_player_hr_stats(self, player_name: str) -> List[Dict]:
+        """Per-season home run Statcast summaries for the batters matching a name"""
+        return self._current_homeruns().player_aggregates(player_name)
+
+    def get_similar_homeruns(self, play_ids: List[str], k: int = 10) -> Dict:
+        """Home runs closest to each play in exit velocity, launch angle and distance"""
+        homeruns = self._current_homeruns()
+        neighbours = homeruns.similar(play_ids, k)
+        results = {}
+        for play_id, matches in neighbours.items():
+            records = homeruns.records(np.asarray([row for row, _ in matches], dtype=np.int32))
+            for record, (_, distance) in zip(records, matches):
+                record['distance'] = round(distance, 4)
+            results[play_id] = records
+        return {
+            "results": results,
+            "missing": [play_id for play_id in dict.fromkeys(play_ids) if play_id not in neighbours]
+        }
+
+    @coalesce
     async def search_videos(
         self,
         query: str,
@@ -467,91 +650,50 @@ class PlayerContentService:
         max_chars_title_es: Optional[int] = 45,
         max_chars_description_en: Optional[int] = 50,
         max_chars_description_ja: Optional[int] = 65,
-        max_chars_description_es: Optional[int] = 65
+        max_chars_description_es: Optional[int] = 65,
+        langs: Optional[List[str]] = None,
+        translation_mode: str = "quality"
     ) -> List[Dict]:
         """Search videos with batch translation"""
+        langs = langs or list(TRANSLATION_FIELDS)
         try:
-            API_KEY = settings.GOOGLE_API_KEY
-            BASE_URL = "https://www.googleapis.com/youtube/v3/search"
-            
-            params = {
-                'part': 'snippet',
-                'q': f"{query} mlb",
-                'maxResults': limit,
-                'key': API_KEY,
-                'type': 'video',
-                'order': 'relevance'
-            }
-            
-            response = requests.get(BASE_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            video_ids = [item['id']['videoId'] for item in data.get('items', [])]
-            
-            # Get video durations
-            videos_url = "https://www.googleapis.com/youtube/v3/videos"
-            videos_params = {
-                'part': 'contentDetails',
-                'id': ','.join(video_ids),
-                'key': API_KEY
-            }
-            
-            videos_response = requests.get(videos_url, params=videos_params)
-            videos_response.raise_for_status()
-            videos_data = videos_response.json()
-            
-            # Process and filter videos
-            processed_videos = []
+            processed_videos = await self._search_video_items(
+                f"{query} mlb",
+                max_results=limit,
+                order='relevance',
+                min_duration=min_duration,
+                max_duration=max_duration,
+                limit=limit
+            )
+
+            # Prepare batch translation tasks
             translation_tasks = []
-            
-            for item in data.get('items', []):
-                video_id = item['id']['videoId']
-                video_details = next(
-                    (v for v in videos_data.get('items', []) 
-                     if v['id'] == video_id), None
-                )
-                
-                if video_details:
-                    duration_str = video_details['contentDetails']['duration']
-                    duration_seconds = int(isodate.parse_duration(duration_str).total_seconds())
-                    
-                    if min_duration <= duration_seconds <= max_duration:
-                        video_info = {
-                            'video_id': video_id,
-                            'title': item['snippet']['title'],
-                            'description': item['snippet']['description'],
-                            'thumbnail': item['snippet']['thumbnails']['high']['url'],
-                            'duration_seconds': duration_seconds,
-                            'embed_code': f'<iframe width="560" height="315" src="https://www.youtube.com/embed/{video_id}" frameborder="0" allowfullscreen></iframe>'
-                        }
-                        
-                        if not all(video_info.values()):
-                            continue
-                        
-                        # Add title translation task
-                        translation_tasks.append({
-                            "id": f"title_{video_id}",
-                            "text": video_info['title'],
-                            "type": "news_title",
-                            "max_chars_en": max_chars_title_en,
-                            "max_chars_ja": max_chars_title_ja,
-                            "max_chars_es": max_chars_title_es
-                        })
-                        
-                        # Add description translation task
-                        translation_tasks.append({
-                            "id": f"desc_{video_id}",
-                            "text": video_info['description'],
-                            "type": "news_summary",
-                            "max_chars_en": max_chars_description_en,
-                            "max_chars_ja": max_chars_description_ja,
-                            "max_chars_es": max_chars_description_es
-                        })
-                        
-                        processed_videos.append(video_info)
-                        if len(processed_videos) >= limit:
-                            break
+            for video_info in processed_videos:
+                video_id = video_info['video_id']
+
+                # Add title translation task
+                translation_tasks.append({
+                    "id": f"title_{video_id}",
+                    "text": video_info['title'],
+                    "type": "news_title",
+                    "max_chars_en": max_chars_title_en,
+                    "max_chars_ja": max_chars_title_ja,
+                    "max_chars_es": max_chars_title_es,
+                    "langs": langs,
+                    "mode": translation_mode
+                })
+
+                # Add description translation task
+                translation_tasks.append({
+                    "id": f"desc_{video_id}",
+                    "text": video_info['description'],
+                    "type": "news_summary",
+                    "max_chars_en": max_chars_description_en,
+                    "max_chars_ja": max_chars_description_ja,
+                    "max_chars_es": max_chars_description_es,
+                    "langs": langs,
+                    "mode": translation_mode
+                })
 
             # Process batch translation
             translated_results = await self.translator.translate_batch(translation_tasks)
@@ -561,23 +703,268 @@ class PlayerContentService:
                 title_key = f"title_{video['video_id']}"
                 desc_key = f"desc_{video['video_id']}"
                 
-                if title_key in translated_results and desc_key in translated_results:
-                    video['title_en'] = translated_results[title_key]['translatedEnText']
-                    video['title_ja'] = translated_results[title_key]['translatedJaText']
-                    video['title_es'] = translated_results[title_key]['translatedEsText']
-                    video['description_en'] = translated_results[desc_key]['translatedEnText']
-                    video['description_ja'] = translated_results[desc_key]['translatedJaText']
-                    video['description_es'] = translated_results[desc_key]['translatedEsText']
-                else:
-                    video['title_en'] = "Not Translated"
-                    video['title_ja'] = "Not Translated"
-                    video['title_es'] = "Not Translated"
-                    video['description_en'] = "Not Translated"
-                    video['description_ja'] = "Not Translated"
-                    video['description_es'] = "Not Translated"
+                self._apply_translation(video, 'title', translated_results.get(title_key), langs)
+                self._apply_translation(video, 'description', translated_results.get(desc_key), langs)
             
             return processed_videos[:limit]
             
         except Exception as e:
             print(f"Error searching videos: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    async def get_player_news_items(self, player_name: str, limit: int = 10) -> List[Dict]:
+        """Untranslated news about a player"""
+        return await self._search_news_items(f"{player_name} mlb latest news", limit)
+
+    async def get_player_video_items(
+        self,
+        player_name: str,
+        limit: int = 10,
+        min_duration: int = 20,
+        max_duration: int = 350
+    ) -> List[Dict]:
+        """Untranslated YouTube videos about a player"""
+        return await self._search_video_items(
+            f"{player_name} mlb highlights",
+            max_results=20,
+            order='date',
+            min_duration=min_duration,
+            max_duration=max_duration,
+            limit=limit
+        )
+
+    def get_player_hr_items(self, player_name: str, limit: int = 10) -> List[Dict]:
+        """Untranslated home run videos for a player"""
+        homeruns = self._current_homeruns()
+        return homeruns.records(homeruns.rows_for_batter(player_name)[:limit])
+
+    async def translate_sections(
+        self,
+        sections: Dict[str, Tuple[List[Dict], Dict[str, Tuple[str, Dict[str, Optional[int]]]]]],
+        langs: List[str],
+        translation_mode: str = "quality",
+        timeout: Optional[float] = None
+    ) -> List[str]:
+        """
+        Translate the items of several result sections in place with one shared batch
+        Args:
+            sections: Section name -> (items, item field -> (translation content type, max characters per language))
+            langs: Languages to translate into
+            translation_mode: 'quality' or 'fast'
+            timeout: Seconds to wait; translations completed by then are kept
+        Returns:
+            Sections left with fields marked "Not Translated"
+        """
+        translation_tasks = []
+        pending = {}
+        for section, (items, fields) in sections.items():
+            for idx, item in enumerate(items):
+                for field, (content_type, max_chars) in fields.items():
+                    if not item.get(field):
+                        self._apply_translation(item, field, None, langs)
+                        continue
+                    task_id = f"{section}_{field}_{idx}"
+                    pending[task_id] = (section, item, field)
+                    translation_tasks.append({
+                        "id": task_id,
+                        "text": item[field],
+                        "type": content_type,
+                        **{f"max_chars_{language}": limit for language, limit in max_chars.items()},
+                        "langs": langs,
+                        "mode": translation_mode
+                    })
+
+        try:
+            async with asyncio.timeout(timeout):
+                async for result in self.translator.translate_batch_stream(translation_tasks):
+                    _, item, field = pending.pop(result["id"])
+                    self._apply_translation(item, field, result, langs)
+        except TimeoutError:
+            print(f"Translation deadline reached with {len(pending)} fields pending")
+        except Exception as e:
+            print(f"Error translating sections: {e}")
+
+        for _, item, field in pending.values():
+            self._apply_translation(item, field, None, langs)
+        return list(dict.fromkeys(section for section, _, _ in pending.values()))
+
+    async def _stream_with_translations(
+        self,
+        items: List[Dict],
+        fields: Dict[str, Tuple[str, Dict[str, Optional[int]]]],
+        langs: List[str],
+        translation_mode: str
+    ) -> AsyncIterator[Dict]:
+        """
+        Yield the untranslated items first, then one patch per field as its translation completes
+        Args:
+            items: Untranslated results in response order
+            fields: Item field -> (translation content type, max characters per language)
+            langs: Languages to translate into
+            translation_mode: 'quality' or 'fast'
+        """
+        yield {"event": "items", "data": items}
+
+        translation_tasks = []
+        targets = {}
+        for idx, item in enumerate(items):
+            for field, (content_type, max_chars) in fields.items():
+                task_id = f"{field}_{idx}"
+                targets[task_id] = (idx, field)
+                if not item.get(field):
+                    continue
+                translation_tasks.append({
+                    "id": task_id,
+                    "text": item[field],
+                    "type": content_type,
+                    **{f"max_chars_{language}": limit for language, limit in max_chars.items()},
+                    "langs": langs,
+                    "mode": translation_mode
+                })
+
+        try:
+            async for result in self.translator.translate_batch_stream(translation_tasks):
+                idx, field = targets.pop(result["id"])
+                patch = {"index": idx}
+                self._apply_translation(patch, field, result, langs)
+                yield {"event": "translation", "data": patch}
+        except Exception as e:
+            print(f"Error streaming translations: {e}")
+
+        # Fields the model never answered for get the same marker as the batch endpoints
+        for idx, field in targets.values():
+            patch = {"index": idx}
+            self._apply_translation(patch, field, None, langs)
+            yield {"event": "translation", "data": patch}
+
+        yield {"event": "done", "data": {"count": len(items)}}
+
+    async def stream_player_news(
+        self,
+        player_name: str,
+        limit: int = 10,
+        max_chars_title_en: Optional[int] = 50,
+        max_chars_title_ja: Optional[int] = 30,
+        max_chars_title_es: Optional[int] = 45,
+        max_chars_summary_en: Optional[int] = 50,
+        max_chars_summary_ja: Optional[int] = 65,
+        max_chars_summary_es: Optional[int] = 65,
+        langs: Optional[List[str]] = None,
+        translation_mode: str = "quality"
+    ) -> AsyncIterator[Dict]:
+        """Stream news about a player: raw results first, then translations as they complete"""
+        langs = langs or list(TRANSLATION_FIELDS)
+        try:
+            items = await self._search_news_items(f"{player_name} mlb latest news", limit)
+        except Exception as e:
+            print(f"Error getting player news: {e}")
+            items = []
+
+        fields = {
+            'title': ("news_title", {"en": max_chars_title_en, "ja": max_chars_title_ja, "es": max_chars_title_es}),
+            'snippet': ("news_summary", {"en": max_chars_summary_en, "ja": max_chars_summary_ja, "es": max_chars_summary_es})
+        }
+        async for event in self._stream_with_translations(items, fields, langs, translation_mode):
+            yield event
+
+    async def stream_search_news(
+        self,
+        query: str,
+        limit: int = 10,
+        max_chars_title_en: Optional[int] = 50,
+        max_chars_title_ja: Optional[int] = 30,
+        max_chars_title_es: Optional[int] = 45,
+        max_chars_summary_en: Optional[int] = 50,
+        max_chars_summary_ja: Optional[int] = 65,
+        max_chars_summary_es: Optional[int] = 65,
+        langs: Optional[List[str]] = None,
+        translation_mode: str = "quality"
+    ) -> AsyncIterator[Dict]:
+        """Stream news search results: raw results first, then translations as they complete"""
+        langs = langs or list(TRANSLATION_FIELDS)
+        try:
+            items = await self._search_news_items(query, limit)
+        except Exception as e:
+            print(f"Error searching news: {e}")
+            items = []
+
+        fields = {
+            'title': ("news_title", {"en": max_chars_title_en, "ja": max_chars_title_ja, "es": max_chars_title_es}),
+            'snippet': ("news_summary", {"en": max_chars_summary_en, "ja": max_chars_summary_ja, "es": max_chars_summary_es})
+        }
+        async for event in self._stream_with_translations(items, fields, langs, translation_mode):
+            yield event
+
+    async def stream_player_videos(
+        self,
+        player_name: str,
+        limit: int = 10,
+        min_duration: int = 20,
+        max_duration: int = 350,
+        max_chars_title_en: Optional[int] = 50,
+        max_chars_title_ja: Optional[int] = 30,
+        max_chars_title_es: Optional[int] = 45,
+        max_chars_description_en: Optional[int] = 50,
+        max_chars_description_ja: Optional[int] = 65,
+        max_chars_description_es: Optional[int] = 65,
+        langs: Optional[List[str]] = None,
+        translation_mode: str = "quality"
+    ) -> AsyncIterator[Dict]:
+        """Stream YouTube videos about a player: raw videos first, then translations as they complete"""
+        langs = langs or list(TRANSLATION_FIELDS)
+        try:
+            items = await self._search_video_items(
+                f"{player_name} mlb highlights",
+                max_results=20,
+                order='date',
+                min_duration=min_duration,
+                max_duration=max_duration,
+                limit=limit
+            )
+        except Exception as e:
+            print(f"Error getting player videos: {e}")
+            items = []
+
+        fields = {
+            'title': ("news_title", {"en": max_chars_title_en, "ja": max_chars_title_ja, "es": max_chars_title_es}),
+            'description': ("news_summary", {"en": max_chars_description_en, "ja": max_chars_description_ja, "es": max_chars_description_es})
+        }
+        async for event in self._stream_with_translations(items, fields, langs, translation_mode):
+            yield event
+
+    async def stream_search_videos(
+        self,
+        query: str,
+        limit: int = 10,
+        min_duration: int = 60,
+        max_duration: int = 1200,
+        max_chars_title_en: Optional[int] = 50,
+        max_chars_title_ja: Optional[int] = 30,
+        max_chars_title_es: Optional[int] = 45,
+        max_chars_description_en: Optional[int] = 50,
+        max_chars_description_ja: Optional[int] = 65,
+        max_chars_description_es: Optional[int] = 65,
+        langs: Optional[List[str]] = None,
+        translation_mode: str = "quality"
+    ) -> AsyncIterator[Dict]:
+        """Stream video search results: raw videos first, then translations as they complete"""
+        langs = langs or list(TRANSLATION_FIELDS)
+        try:
+            items = await self._search_video_items(
+                f"{query} mlb",
+                max_results=limit,
+                order='relevance',
+                min_duration=min_duration,
+                max_duration=max_duration,
+                limit=limit
+            )
+        except Exception as e:
+            print(f"Error searching videos: {e}")
+            items = []
+
+        fields = {
+            'title': ("news_title", {"en": max_chars_title_en, "ja": max_chars_title_ja, "es": max_chars_title_es}),
+            'description': ("news_summary", {"en": max_chars_description_en, "ja": max_chars_description_ja, "es": max_chars_description_es})
+        }
+        async for event in self._stream_with_translations(items, fields, langs, translation_mode):
+            yield event
@@ -1,16 +1,47 @@
-from typing import Dict, Optional
-import requests
+from typing import Dict, List, Optional
+import asyncio
+import json
 from app.core.config import settings
+from app.core.http_client import http_client
+from app.core.roster_index import RosterIndex
+from app.core.team_directory import TeamDirectory
 
 class PlayerInfoService:
     def __init__(self):
         self.BASE_URL = "https://statsapi.mlb.com/api/v1"
         self.TEAM_ENDPOINT = f"{self.BASE_URL}/teams?sportId=1"
-        self.PLAYER_ENDPOINT = f"{self.BASE_URL}/sports/1/players?season=2024"
+        self.PLAYER_ENDPOINT = f"{self.BASE_URL}/sports/1/players?season={settings.ROSTER_SEASON}"
         self.SINGLE_PLAYER_ENDPOINT = f"{self.BASE_URL}/people"
+        self.PEOPLE_BATCH_SIZE = 50
         self.HEADSHOT_ENDPOINT = f"https://securea.mlb.com/mlb/images/players/head_shot"
+        self.TEAM_LOGO_ENDPOINT = "https://www.mlbstatic.com/team-logos"
+        # Team lookups are served from memory, falling back to the bundled snapshot when upstream is down
+        self.teams = TeamDirectory(
+            self.TEAM_ENDPOINT, settings.TEAM_REFRESH_INTERVAL, snapshot_path='data/teams.json'
+        )
+        # Name lookups are served from memory; the roster is downloaded once and re-validated on a
+        # schedule, and the last good copy is kept on disk for when upstream is down at startup
+        self.roster = RosterIndex(
+            self.PLAYER_ENDPOINT,
+            settings.ROSTER_REFRESH_INTERVAL,
+            featured=self._load_featured_players(),
+            snapshot_path=f'data/roster_{settings.ROSTER_SEASON}.json'
+        )
+
+    def _load_featured_players(self) -> List[Dict]:
+        """Load the featured players of each team from JSON file"""
+        try:
+            with open('data/players.json', 'r') as f:
+                teams = json.load(f)
+        except FileNotFoundError:
+            return []
+        return [
+            {'fullName': player, 'team': team}
+            for team, players in teams
+            for player in players
+        ]
     
-    def _get_team_id_by_name(self, team_name: str) -> Optional[int]:
+    async def _get_team_id_by_name(self, team_name: str) -> Optional[int]:
         """
         Get MLB team ID by team name
         Args:
@@ -19,14 +50,8 @@ class PlayerInfoService:
             Team ID if found, None otherwise
         """
         try:
-            response = requests.get(f"{self.TEAM_ENDPOINT}")
-            response.raise_for_status()
-            teams = response.json().get('teams', [])
-            
-            for team in teams:
-                if team_name.lower() in team['name'].lower():
-                    return team['id']
-            return None
+            team = await self.teams.find(team_name)
+            return team['id'] if team else None
             
         except Exception as e:
             print(f"Error getting team ID: {e}")
@@ -41,17 +66,34 @@ class PlayerInfoService:
             Logo URL if found, None otherwise
         """
         try:
-            team_id = self._get_team_id_by_name(team_name)
+            team_id = await self._get_team_id_by_name(team_name)
             if not team_id:
                 return None
             # Using MLB's logo CDN
-            return f"https://www.mlbstatic.com/team-logos/{team_id}.svg"
+            return f"{self.TEAM_LOGO_ENDPOINT}/{team_id}.svg"
             
         except Exception as e:
             print(f"Error getting team logo: {e}")
             return None
 
-    def _get_player_id_by_name(self, player_name: str) -> Optional[int]:
+    async def get_teams(self) -> List[Dict]:
+        """
+        Get every MLB team with its logo URL
+        Returns:
+            Team dictionaries ordered by name, empty if the directory is unavailable
+        """
+        try:
+            teams = await self.teams.all()
+            return [
+                {**team, 'logo_url': f"{self.TEAM_LOGO_ENDPOINT}/{team['id']}.svg"}
+                for team in teams
+            ]
+
+        except Exception as e:
+            print(f"Error getting teams: {e}")
+            return []
+
+    async def _get_player_id_by_name(self, player_name: str) -> Optional[int]:
         """
         Get MLB player ID by player name
         Args:
@@ -60,19 +102,70 @@ class PlayerInfoService:
             Player ID if found, None otherwise
         """
         try:
-            response = requests.get(f"{self.PLAYER_ENDPOINT}")
-            response.raise_for_status()
-            players = response.json().get('people', [])
-            
-            for player in players:
-                if player_name.lower() in player['fullName'].lower():
-                    return player['id']
-            return None
+            return await self.roster.find_id(player_name)
             
         except Exception as e:
             print(f"Error getting player ID: {e}")
             return None
 
+    async def search_players(self, query: str, limit: int = 10) -> List[Dict]:
+        """
+        Autocomplete player names
+        Args:
+            query: Full or partial player name; accents and case are ignored
+            limit: Maximum number of players returned
+        Returns:
+            Matching players, best first
+        """
+        try:
+            return await self.roster.search(query, limit=limit)
+
+        except Exception as e:
+            print(f"Error searching players: {e}")
+            return []
+
+    @staticmethod
+    def _format_player_info(player_data: Dict) -> Dict:
+        """Pick the player fields returned to clients from a Stats API person"""
+        return {
+            'id': player_data.get('id'),
+            'fullName': player_data.get('fullName'),
+            'link': player_data.get('link'),
+            'firstName': player_data.get('firstName'),
+            'lastName': player_data.get('lastName'),
+            'primaryNumber': player_data.get('primaryNumber'),
+            'currentAge': player_data.get('currentAge'),
+            'birthDate': player_data.get('birthDate'),
+            'birthCity': player_data.get('birthCity'),
+            'birthCountry': player_data.get('birthCountry'),
+            'height': player_data.get('height'),
+            'weight': player_data.get('weight'),
+            'active': player_data.get('active'),
+            'primaryPosition': {
+                'code': player_data.get('primaryPosition', {}).get('code'),
+                'name': player_data.get('primaryPosition', {}).get('name'),
+                'type': player_data.get('primaryPosition', {}).get('type'),
+                'abbreviation': player_data.get('primaryPosition', {}).get('abbreviation')
+            },
+            'useName': player_data.get('useName'),
+            'useLastName': player_data.get('useLastName'),
+            'boxscoreName': player_data.get('boxscoreName'),
+            'nickName': player_data.get('nickName'),
+            'pronunciation': player_data.get('pronunciation'),
+            'mlbDebutDate': player_data.get('mlbDebutDate'),
+            'batSide': {
+                'code': player_data.get('batSide', {}).get('code'),
+                'description': player_data.get('batSide', {}).get('description')
+            },
+            'pitchHand': {
+                'code': player_data.get('pitchHand', {}).get('code'),
+                'description': player_data.get('pitchHand', {}).get('description')
+            },
+            'nameSlug': player_data.get('nameSlug'),
+            'strikeZoneTop': player_data.get('strikeZoneTop'),
+            'strikeZoneBottom': player_data.get('strikeZoneBottom')
+        }
+
     async def get_player_info_by_name(self, player_name: str) -> Optional[Dict]:
         """
         Get player information by player name
@@ -82,57 +175,83 @@ class PlayerInfoService:
             Dictionary containing player information if found, None otherwise
         """
         try:
-            player_id = self._get_player_id_by_name(player_name)
+            player_id = await self._get_player_id_by_name(player_name)
             if not player_id:
                 return None
             
-            response = requests.get(f"{self.SINGLE_PLAYER_ENDPOINT}/{player_id}")
+            response = await http_client.get(f"{self.SINGLE_PLAYER_ENDPOINT}/{player_id}")
             response.raise_for_status()
             player_data = response.json().get('people', [])[0]
             
-            return {
-                'id': player_data.get('id'),
-                'fullName': player_data.get('fullName'),
-                'link': player_data.get('link'),
-                'firstName': player_data.get('firstName'),
-                'lastName': player_data.get('lastName'),
-                'primaryNumber': player_data.get('primaryNumber'),
-                'currentAge': player_data.get('currentAge'),
-                'birthDate': player_data.get('birthDate'),
-                'birthCity': player_data.get('birthCity'),
-                'birthCountry': player_data.get('birthCountry'),
-                'height': player_data.get('height'),
-                'weight': player_data.get('weight'),
-                'active': player_data.get('active'),
-                'primaryPosition': {
-                    'code': player_data.get('primaryPosition', {}).get('code'),
-                    'name': player_data.get('primaryPosition', {}).get('name'),
-                    'type': player_data.get('primaryPosition', {}).get('type'),
-                    'abbreviation': player_data.get('primaryPosition', {}).get('abbreviation')
-                },
-                'useName': player_data.get('useName'),
-                'useLastName': player_data.get('useLastName'),
-                'boxscoreName': player_data.get('boxscoreName'),
-                'nickName': player_data.get('nickName'),
-                'pronunciation': player_data.get('pronunciation'),
-                'mlbDebutDate': player_data.get('mlbDebutDate'),
-                'batSide': {
-                    'code': player_data.get('batSide', {}).get('code'),
-                    'description': player_data.get('batSide', {}).get('description')
-                },
-                'pitchHand': {
-                    'code': player_data.get('pitchHand', {}).get('code'),
-                    'description': player_data.get('pitchHand', {}).get('description')
-                },
-                'nameSlug': player_data.get('nameSlug'),
-                'strikeZoneTop': player_data.get('strikeZoneTop'),
-                'strikeZoneBottom': player_data.get('strikeZoneBottom')
-            }
+            return self._format_player_info(player_data)
             
         except Exception as e:
             print(f"Error getting player info: {e}")
             return None
 
+    async def _get_people(self, player_ids: List[int]) -> Dict[int, Dict]:
+        """
+        Fetch Stats API people with multi-id requests, all chunks concurrently
+        Args:
+            player_ids: MLB player IDs
+        Returns:
+            Player ID -> person, leaving out players whose chunk failed
+        """
+        async def fetch(chunk: List[int]) -> List[Dict]:
+            try:
+                response = await http_client.get(
+                    self.SINGLE_PLAYER_ENDPOINT,
+                    params={'personIds': ','.join(str(player_id) for player_id in chunk)}
+                )
+                response.raise_for_status()
+                return response.json().get('people', [])
+            except Exception as e:
+                print(f"Error getting player details: {e}")
+                return []
+
+        chunks = [
+            player_ids[i:i + self.PEOPLE_BATCH_SIZE]
+            for i in range(0, len(player_ids), self.PEOPLE_BATCH_SIZE)
+        ]
+        people = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        return {person['id']: person for chunk in people for person in chunk}
+
+    async def get_players_info(self, players: List[str]) -> List[Dict]:
+        """
+        Get information and headshots for many players in one upstream round
+        Args:
+            players: MLB player names or IDs
+        Returns:
+            One entry per requested player, in order, with 'info' and 'headshot_url' or an 'error'
+        """
+        # Every name resolves against the same roster snapshot
+        player_ids = {}
+        for player in dict.fromkeys(players):
+            if player.strip().isdigit():
+                player_ids[player] = int(player)
+            else:
+                player_ids[player] = await self._get_player_id_by_name(player)
+
+        details = await self._get_people(sorted({player_id for player_id in player_ids.values() if player_id}))
+
+        results = []
+        for player in players:
+            player_id = player_ids[player]
+            if not player_id:
+                results.append({'query': player, 'error': 'Player not found'})
+                continue
+            # Roster entries carry the same fields when the people request failed
+            player_data = details.get(player_id) or self.roster.people.get(player_id)
+            if player_data is None:
+                results.append({'query': player, 'id': player_id, 'error': 'Player details unavailable'})
+                continue
+            results.append({
+                'query': player,
+                'info': self._format_player_info(player_data),
+                'headshot_url': f"{self.HEADSHOT_ENDPOINT}/{player_id}.jpg"
+            })
+        return results
+
     async def get_player_headshot_by_name(self, player_name: str) -> Optional[str]:
         """
         Get player headshot image URL by player name
@@ -142,7 +261,7 @@ class PlayerInfoService:
             Headshot URL if found, None otherwise
         """
         try:
-            player_id = self._get_player_id_by_name(player_name)
+            player_id = await self._get_player_id_by_name(player_name)
             if not player_id:
                 return None
             # Using MLB's player headshot CDN
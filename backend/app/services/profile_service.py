@@ -0,0 +1,116 @@
+from typing import Any, Awaitable, Dict, List, Optional
+import asyncio
+from app.core.config import settings
+from app.core.translation_store import TRANSLATION_FIELDS
+from app.services.content_service import PlayerContentService
+from app.services.info_service import PlayerInfoService
+
+# Translated fields of each content section, with the default limits of the single-section endpoints
+TITLE_LIMITS = {"en": 50, "ja": 30, "es": 45}
+SUMMARY_LIMITS = {"en": 50, "ja": 65, "es": 65}
+SECTION_FIELDS = {
+    "news": {'title': ("news_title", TITLE_LIMITS), 'snippet': ("news_summary", SUMMARY_LIMITS)},
+    "videos": {'title': ("news_title", TITLE_LIMITS), 'description': ("news_summary", SUMMARY_LIMITS)},
+    "homeruns": {'title': ("news_title", TITLE_LIMITS)}
+}
+
+class PlayerProfileService:
+    def __init__(self, info_service: PlayerInfoService, content_service: PlayerContentService):
+        self.info_service = info_service
+        self.content_service = content_service
+
+    async def _section(
+        self,
+        name: str,
+        awaitable: Awaitable[Any],
+        default: Any,
+        degraded: Dict[str, str],
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Await one profile section within its deadline
+        Returns:
+            The section result, or `default` with the reason recorded in `degraded`
+        """
+        timeout = timeout if timeout is not None else settings.PROFILE_SECTION_TIMEOUT
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            degraded[name] = f"Timed out after {timeout:g}s"
+        except Exception as e:
+            print(f"Error getting profile {name}: {e}")
+            degraded[name] = "Unavailable"
+        return default
+
+    async def get_player_profile(
+        self,
+        player_name: str,
+        team: Optional[str] = None,
+        limit: int = 5,
+        langs: Optional[List[str]] = None,
+        translation_mode: str = "quality"
+    ) -> Dict:
+        """
+        Gather everything a player page shows in one call
+        Args:
+            player_name: MLB player name
+            team: Team the player's images are filed under; searched when omitted
+            limit: Maximum number of news items, videos and home runs
+            langs: Languages to translate into
+            translation_mode: 'quality' or 'fast'
+        Returns:
+            Every section, plus `degraded`: section -> reason for sections that are
+            missing, timed out or only partly translated
+        """
+        langs = langs or list(TRANSLATION_FIELDS)
+        degraded: Dict[str, str] = {}
+
+        async def content_sections() -> Dict[str, List[Dict]]:
+            # Fetch all content first so news, video and home run titles share one translation batch
+            news, videos, homeruns = await asyncio.gather(
+                self._section("news", self.content_service.get_player_news_items(player_name, limit), [], degraded),
+                self._section("videos", self.content_service.get_player_video_items(player_name, limit), [], degraded),
+                self._section(
+                    "homeruns",
+                    asyncio.to_thread(self.content_service.get_player_hr_items, player_name, limit),
+                    [],
+                    degraded
+                )
+            )
+            sections = {"news": news, "videos": videos, "homeruns": homeruns}
+            untranslated = await self.content_service.translate_sections(
+                {name: (items, SECTION_FIELDS[name]) for name, items in sections.items()},
+                langs,
+                translation_mode=translation_mode,
+                timeout=settings.PROFILE_TRANSLATION_TIMEOUT
+            )
+            for name in untranslated:
+                degraded.setdefault(name, "Partly translated")
+            return sections
+
+        info, headshot_url, images, sections = await asyncio.gather(
+            self._section("info", self.info_service.get_player_info_by_name(player_name), None, degraded),
+            self._section("headshot", self.info_service.get_player_headshot_by_name(player_name), None, degraded),
+            self._section(
+                "images",
+                asyncio.to_thread(self.content_service.find_player_images, player_name, team),
+                [],
+                degraded
+            ),
+            content_sections()
+        )
+
+        # The info service reports lookup failures as None
+        if info is None:
+            degraded.setdefault("info", "Unavailable")
+        if headshot_url is None:
+            degraded.setdefault("headshot", "Unavailable")
+
+        return {
+            "player": player_name,
+            "info": info,
+            "headshot_url": headshot_url,
+            "images": images,
+            **sections,
+            "degraded": degraded
+        }
@@ -0,0 +1,48 @@
+import argparse
+import logging
+import sys
+
+from app.core.homerun_dataset import source_season
+from app.core.homerun_snapshot import DEFAULT_SNAPSHOT_DIR, HR_SOURCES, ingest_source, ingest_sources, snapshot_versions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert the MLB home run CSVs into the local .npy snapshot loaded at startup"
+    )
+    parser.add_argument("--data-dir", default=str(DEFAULT_SNAPSHOT_DIR), help="Snapshot directory")
+    parser.add_argument(
+        "--season", action="append", choices=list(HR_SOURCES),
+        help="Season file to ingest (repeatable); defaults to all"
+    )
+    parser.add_argument(
+        "--source", action="append", default=[], metavar="KEY=URL",
+        help="Additional season file, e.g. 2025=https://.../2025-mlb-homeruns.csv (repeatable)"
+    )
+    parser.add_argument("--force", action="store_true", help="Rewrite files whose CSV has not changed")
+    args = parser.parse_args()
+
+    sources = []
+    for source in args.source:
+        key, _, url = source.partition("=")
+        try:
+            source_season(key)
+        except ValueError as e:
+            parser.error(str(e))
+        if not url:
+            parser.error(f"--source {source!r} has no URL; expected KEY=URL")
+        sources.append((key, url))
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    if sources:
+        # New season files only; a running service picks them up via POST /content/homeruns/reload
+        for key, url in sources:
+            ingest_source(key, url, args.data_dir, force=args.force)
+        failed = []
+    else:
+        requested = args.season or list(HR_SOURCES)
+        written = ingest_sources(args.data_dir, keys=requested, force=args.force)
+        failed = [key for key in requested if key not in written]
+    for key, version in snapshot_versions(args.data_dir).items():
+        print(f"{key}: {version}")
+    if failed:
+        sys.exit(f"Failed to ingest: {', '.join(failed)}")
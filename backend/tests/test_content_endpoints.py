@@ -1,5 +1,7 @@
+import json
 import pytest
 from fastapi.testclient import TestClient
+from app.core.config import settings
 
 def test_get_player_images(client: TestClient):
     """Test getting player images"""
@@ -150,4 +152,119 @@ def test_translation_length_constraints(client: TestClient):
     
     for news_item in list(data["news"].values()):
         assert len(news_item["title_en"]) <= max_title_en + 2
-        assert len(news_item["snippet_ja"]) <= max_summary_ja + 2
\ No newline at end of file
+        assert len(news_item["snippet_ja"]) <= max_summary_ja + 2
+
+def test_content_stats(client: TestClient):
+    """Test that coalescing and cache counters are exposed"""
+    client.get("/api/v1/content/news/Aaron Judge?limit=2")
+
+    response = client.get("/api/v1/content/stats")
+    assert response.status_code == 200
+    data = response.json()
+    assert "single_flight" in data
+    assert "response_cache" in data
+    assert data["single_flight"]["get_player_news"]["calls"] >= 1
+
+def test_stream_player_news(client: TestClient):
+    """Test streaming player news: raw items first, then translation patches"""
+    response = client.get("/api/v1/content/news/Aaron Judge/stream?limit=2&langs=ja")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = [
+        (block.split("\n")[0].removeprefix("event: "), json.loads(block.split("\n")[1].removeprefix("data: ")))
+        for block in response.text.strip().split("\n\n")
+    ]
+    assert events[0][0] == "items"
+    assert len(events[0][1]) == 2
+    assert events[-1][0] == "done"
+
+    patches = [data for name, data in events if name == "translation"]
+    assert all("index" in patch for patch in patches)
+    assert any("title_ja" in patch for patch in patches)
+    assert not any("title_en" in patch for patch in patches)
+
+def test_get_player_news_langs(client: TestClient):
+    """Test that only the requested languages are returned"""
+    response = client.get("/api/v1/content/news/Aaron Judge?limit=2&langs=es")
+    assert response.status_code == 200
+    news_item = response.json()["news"]["0"]
+    assert "title_es" in news_item and "snippet_es" in news_item
+    assert "title_ja" not in news_item
+
+    response = client.get("/api/v1/content/news/Aaron Judge?limit=2&langs=fr")
+    assert response.status_code == 422
+
+def test_query_homeruns(client: TestClient):
+    """Test filtering and ranking home runs"""
+    response = client.get(
+        "/api/v1/content/homeruns?season=2024&min_exit_velocity=105&sort_by=hit_distance&limit=5"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] >= len(data["homeruns"])
+    assert len(data["homeruns"]) <= 5
+
+    distances = [hr["hit_distance"] for hr in data["homeruns"]]
+    assert distances == sorted(distances, reverse=True)
+    assert all(hr["exit_velocity"] >= 105 and hr["season"] == "2024" for hr in data["homeruns"])
+
+    response = client.get("/api/v1/content/homeruns?sort_by=spin_rate")
+    assert response.status_code == 422
+
+def test_get_player_hr_stats(client: TestClient):
+    """Test per-season home run aggregates for a player"""
+    response = client.get("/api/v1/content/homeruns/players/Aaron Judge/stats")
+    assert response.status_code == 200
+    player = response.json()["players"][0]
+    assert player["player"] == "Aaron Judge"
+
+    season = player["seasons"][0]
+    assert all(key in season for key in ["season", "home_runs", "exit_velocity", "launch_angle", "hit_distance"])
+    assert all(key in season["hit_distance"] for key in ["mean", "max", "p25", "p50", "p75", "p90"])
+
+    response = client.get("/api/v1/content/homeruns/players/Not A Player/stats")
+    assert response.status_code == 404
+
+def test_similar_homeruns(client: TestClient):
+    """Test nearest-neighbour home runs for a batch of plays"""
+    response = client.get("/api/v1/content/homeruns?season=2024&limit=2")
+    play_ids = [hr["play_id"] for hr in response.json()["homeruns"]]
+
+    query = "&".join(f"play_id={play_id}" for play_id in play_ids + ["not-a-play"])
+    response = client.get(f"/api/v1/content/homeruns/similar?{query}&k=3")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["missing"] == ["not-a-play"]
+    for play_id in play_ids:
+        matches = data["results"][play_id]
+        assert len(matches) == 3
+        assert all(match["play_id"] != play_id for match in matches)
+        distances = [match["distance"] for match in matches]
+        assert distances == sorted(distances)
+
+def test_search_homeruns(client: TestClient):
+    """Test full-text search over home run titles with pagination"""
+    response = client.get("/api/v1/content/homeruns/search?q=grand slam&limit=5")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] >= len(data["homeruns"])
+    assert len(data["homeruns"]) <= 5
+    assert all("grand slam" in hr["title"].lower() for hr in data["homeruns"])
+
+    response = client.get("/api/v1/content/homeruns/search?q=grand slam&offset=5&limit=5")
+    assert response.status_code == 200
+    assert response.json()["offset"] == 5
+
+    response = client.get("/api/v1/content/homeruns/search?q=")
+    assert response.status_code == 422
+
+def test_reload_homeruns_requires_admin_token(client: TestClient, monkeypatch):
+    """Test the home run reload is refused without a matching admin token"""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", None)
+    response = client.post("/api/v1/content/homeruns/reload")
+    assert response.status_code == 403
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    response = client.post("/api/v1/content/homeruns/reload", headers={"X-Admin-Token": "wrong"})
+    assert response.status_code == 401
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.homerun_dataset import HR_COLUMNS, HomeRunDataset
+
+def make_frame():
+    rows = [
+        ("2024", "a1", "Aaron Judge homers (1) on a fly ball to left field.", 110.2, 28.0, 430.0, "v/a1"),
+        ("2024", "b1", "José Ramírez homers (1) on a line drive to right field.", 104.5, 22.0, 395.0, "v/b1"),
+        ("2024", "a2", "Aaron Judge hits a grand slam (2) to center field.", 112.9, 30.0, 455.0, "v/a2"),
+        ("2016", "c1", "Vladimir Guerrero Jr. homers (1) on a fly ball to center field.", np.nan, 31.0, 410.0, "v/c1"),
+        ("2016", "x1", np.nan, 101.0, 25.0, 380.0, "v/x1"),
+    ]
+    return pd.DataFrame(rows, columns=HR_COLUMNS)
+
+def test_batter_index_lookups():
+    """Batter lookups match full names, single tokens and accent-free spellings"""
+    dataset = HomeRunDataset.from_frame(make_frame())
+
+    assert dataset.rows_for_batter("Aaron Judge").tolist() == [0, 2]
+    assert dataset.rows_for_batter("judge").tolist() == [0, 2]
+    assert dataset.rows_for_batter("jose ramirez").tolist() == [1]
+    assert dataset.rows_for_batter("Guerrero").tolist() == [3]
+    assert dataset.rows_for_batter("Nobody").tolist() == []
+
+    record = dataset.records(dataset.rows_for_batter("Guerrero"))[0]
+    assert record["play_id"] == "c1"
+    assert record["exit_velocity"] is None
+
+def test_query_filters_and_top_k():
+    """Range filters, season filters and top-k ranking over the metric columns"""
+    dataset = HomeRunDataset.from_frame(make_frame())
+
+    rows, total = dataset.query(sort_by="hit_distance", limit=2)
+    assert total == 5
+    assert dataset.columns["play_id"][rows].tolist() == ["a2", "a1"]
+
+    rows, total = dataset.query(seasons=[2024], ranges={"exit_velocity": (105, None)}, sort_by="exit_velocity", descending=False)
+    assert dataset.columns["play_id"][rows].tolist() == ["a1", "a2"]
+
+    # Rows missing the ranked metric are left out
+    rows, total = dataset.query(seasons=[2016], sort_by="exit_velocity")
+    assert dataset.columns["play_id"][rows].tolist() == ["x1"]
+
+def test_player_aggregates_extend_incrementally():
+    """Adding a season file only aggregates its rows and matches a full rebuild"""
+    frame = make_frame()
+    full = HomeRunDataset.from_frame(frame)
+    partial = HomeRunDataset.from_frame(frame[frame["season"] == "2024"])
+    # The season file goes into a copy; the original keeps serving unchanged
+    extended = partial.copy()
+    extended.add_source("2016", HomeRunDataset.from_frame(frame[frame["season"] == "2016"]).columns)
+    assert partial.source_keys == ["2024"] and partial.size < full.size
+    assert partial.find_batters("guerrero") == [] and "guerrero" not in partial.title_index.postings
+    partial = extended
+
+    assert partial.aggregates == full.aggregates
+    assert partial.rows_for_batter("guerrero").tolist() == full.rows_for_batter("guerrero").tolist()
+
+    judge = full.player_aggregates("Aaron Judge")[0]
+    assert judge["player"] == "Aaron Judge"
+    season = judge["seasons"][0]
+    assert season["home_runs"] == 2
+    assert season["hit_distance"]["max"] == 455.0
+    assert season["exit_velocity"]["mean"] == 111.55
+
+    # Keys without a leading year are rejected before any rows are appended
+    with pytest.raises(ValueError, match="Invalid season file key"):
+        partial.add_source("postseason", HomeRunDataset.from_frame(frame[frame["season"] == "2016"]).columns)
+    assert partial.size == full.size
+
+def test_similar_by_launch_metrics():
+    """Neighbours come back closest first, without the play itself, in one batched query"""
+    dataset = HomeRunDataset.from_frame(make_frame())
+
+    similar = dataset.similar(["a1", "x1", "c1", "missing"], k=2)
+    assert set(similar) == {"a1", "x1"}
+    assert [dataset.columns["play_id"][row] for row, _ in similar["a1"]] == ["a2", "b1"]
+    assert [dataset.columns["play_id"][row] for row, _ in similar["x1"]] == ["b1", "a1"]
+    assert similar["a1"][0][1] <= similar["a1"][1][1]
+
+    # Rows missing a metric are never returned as neighbours
+    assert all(
+        dataset.columns["play_id"][row] != "c1"
+        for matches in dataset.similar(["a1", "a2", "b1", "x1"], k=10).values()
+        for row, _ in matches
+    )
+
+def test_title_search():
+    """AND terms, phrases, prefixes and pagination over the title index, extended per season file"""
+    frame = make_frame()
+    dataset = HomeRunDataset.from_frame(frame[frame["season"] == "2024"])
+    dataset.add_source("2016", HomeRunDataset.from_frame(frame[frame["season"] == "2016"]).columns)
+
+    def search(query, **kwargs):
+        rows, total = dataset.search_titles(query, **kwargs)
+        return dataset.columns["play_id"][rows].tolist(), total
+
+    assert search("fly ball") == (["a1", "c1"], 2)
+    assert search('"fly ball" judge') == (["a1"], 1)
+    assert search('"ball fly"') == ([], 0)
+    assert search("guerrero-jr") == (["c1"], 1)
+    assert search("ramirez") == (["b1"], 1)
+    assert search('"grand sl*"') == (["a2"], 1)
+    assert search("cent*") == (["a2", "c1"], 2)
+    assert search("cent*", seasons=[2016]) == (["c1"], 1)
+    assert search("field", offset=1, limit=2) == (["b1", "a2"], 4)
+    assert search("!!!") == ([], 0)
@@ -35,4 +35,47 @@ def test_get_team_logo_not_found(client: TestClient):
     """Test getting logo for non-existent team should return 404"""
     response = client.get("/api/v1/player/team/logo/NonExistentTeam")
     assert response.status_code == 404
-    assert "Team logo not found" in response.json()["detail"] 
\ No newline at end of file
+    assert "Team logo not found" in response.json()["detail"]
+
+def test_search_players(client: TestClient):
+    """Test accent-insensitive player name autocomplete"""
+    response = client.get("/api/v1/player/search?q=acuna&limit=5")
+    assert response.status_code == 200
+    players = response.json()["players"]
+    assert 0 < len(players) <= 5
+    assert players[0]["fullName"] == "Ronald Acuña Jr."
+
+    response = client.get("/api/v1/player/search?q=")
+    assert response.status_code == 422
+
+def test_get_teams(client: TestClient):
+    """Test listing every team with its logo"""
+    response = client.get("/api/v1/player/teams")
+    assert response.status_code == 200
+    teams = response.json()["teams"]
+    assert len(teams) == 30
+    giants = next(team for team in teams if team["abbreviation"] == "SF")
+    assert giants["name"] == "San Francisco Giants"
+    assert giants["logo_url"].endswith(f"/{giants['id']}.svg")
+
+def test_get_players_info_batch(client: TestClient):
+    """Test batch player info by name and id with per-player errors"""
+    response = client.get("/api/v1/player/info?player=Yosver Zulueta&player=691172&player=NonExistentPlayer")
+    assert response.status_code == 200
+    players = response.json()["players"]
+    assert [player["query"] for player in players] == ["Yosver Zulueta", "691172", "NonExistentPlayer"]
+    assert players[0]["info"]["id"] == 691172
+    assert players[1]["info"]["id"] == 691172
+    assert "headshot_url" in players[0]
+    assert players[2]["error"] == "Player not found"
+
+def test_get_player_profile(client: TestClient):
+    """Test the aggregated player profile returns every section and lists degraded ones"""
+    response = client.get("/api/v1/player/profile/Aaron Judge?limit=3&langs=en,ja")
+    assert response.status_code == 200
+    profile = response.json()
+    assert all(key in profile for key in ["info", "headshot_url", "images", "news", "videos", "homeruns", "degraded"])
+    assert all(len(profile[section]) <= 3 for section in ["news", "videos", "homeruns"])
+    for hr in profile["homeruns"]:
+        assert "title_en" in hr and "title_ja" in hr
+    assert set(profile["degraded"]) <= {"info", "headshot", "images", "news", "videos", "homeruns"}
@@ -0,0 +1,101 @@
+import asyncio
+import json
+
+import httpx
+
+import app.core.upstream_index as upstream_index
+from app.core.name_search import NameSearchIndex
+from app.core.roster_index import RosterIndex
+from app.core.team_directory import TeamDirectory
+
+ROSTER = {"people": [
+    {"id": 592450, "fullName": "Aaron Judge"},
+    {"id": 608070, "fullName": "José Ramírez"},
+    {"id": 691172, "fullName": "Yosver Zulueta"},
+]}
+
+class ConditionalUpstream:
+    """Stand-in for the shared HTTP client serving the roster with an ETag"""
+    def __init__(self):
+        self.requests = []
+
+    async def get(self, url, headers=None):
+        self.requests.append(headers or {})
+        request = httpx.Request("GET", url)
+        if (headers or {}).get("If-None-Match") == '"v1"':
+            return httpx.Response(304, request=request)
+        return httpx.Response(200, content=json.dumps(ROSTER).encode(), headers={"ETag": '"v1"'}, request=request)
+
+def test_roster_loaded_once_and_revalidated(monkeypatch):
+    """Lookups are served from memory; a scheduled refresh sends the ETag and keeps the index on 304"""
+    upstream = ConditionalUpstream()
+    monkeypatch.setattr(upstream_index, "http_client", upstream)
+    roster = RosterIndex("https://statsapi.test/players", refresh_interval=0)
+
+    async def lookups():
+        found = await asyncio.gather(*(roster.find_id(name) for name in ["Aaron Judge", "jose ramirez", "Zulueta", "Nobody"]))
+        assert found == [592450, 608070, 691172, None]
+        assert len(upstream.requests) == 1
+
+        # Past the refresh interval the next lookup still answers immediately and re-validates in the background
+        assert await roster.find_id("Aaron Judge") == 592450
+        await asyncio.sleep(0)
+        assert upstream.requests[-1] == {"If-None-Match": '"v1"'}
+        assert roster.not_modified == 1
+        assert roster.stats()["entries"] == 3
+
+    asyncio.run(lookups())
+
+def test_fuzzy_name_search():
+    """Accent-insensitive, typo-tolerant and prefix matches over names, nicknames and box score names"""
+    index = NameSearchIndex([
+        {"id": 660670, "fullName": "Ronald Acuña Jr.", "nickName": "El Abusador", "boxscoreName": "Acuña Jr."},
+        {"id": 650391, "fullName": "Eloy Jiménez", "boxscoreName": "Jiménez, E"},
+        {"id": 669257, "fullName": "Will Smith", "boxscoreName": "Smith, W"},
+        {"id": 519293, "fullName": "Will Smith", "boxscoreName": "Smith, Wi"},
+        {"id": None, "fullName": "Corbin Carroll", "team": "Arizona Diamondbacks"},
+    ])
+
+    assert index.search("acuna")[0]["id"] == 660670
+    assert index.search("abusad")[0]["matched"] == "El Abusador"
+    assert index.search("jimenz")[0]["id"] == 650391
+    assert [player["id"] for player in index.search("will smith")] == [669257, 519293]
+    corbin = index.search("corbin car")
+    assert [player["team"] for player in corbin] == ["Arizona Diamondbacks"]
+    # A prefix covering every query trigram ranks above any plain similarity score
+    assert corbin[0]["score"] > 1
+    assert index.search("zzz") == []
+    assert index.best_id("corbin carroll") is None
+
+def test_team_directory_snapshot_fallback(monkeypatch):
+    """Teams are served from the bundled snapshot when upstream is down, by any name or abbreviation"""
+    class DownUpstream:
+        async def get(self, url, headers=None):
+            raise httpx.ConnectError("unreachable")
+
+    monkeypatch.setattr(upstream_index, "http_client", DownUpstream())
+    directory = TeamDirectory("https://statsapi.test/teams", refresh_interval=3600, snapshot_path="data/teams.json")
+
+    async def lookups():
+        names = ["San Francisco Giants", "giants", "SF", "NY Yankees", "Bronx", "Red Sox", "NonExistentTeam"]
+        found = [await directory.find(name) for name in names]
+        assert [team and team["id"] for team in found] == [137, 137, 137, 147, 147, 111, None]
+        assert len(await directory.all()) == 30
+        assert directory.stats()["source"] == "snapshot"
+
+    asyncio.run(lookups())
+
+def test_roster_served_from_last_good_snapshot(monkeypatch, tmp_path):
+    """A roster downloaded once is kept on disk and served when upstream is down at the next start"""
+    snapshot_path = str(tmp_path / "roster.json")
+    monkeypatch.setattr(upstream_index, "http_client", ConditionalUpstream())
+    asyncio.run(RosterIndex("https://statsapi.test/players", 3600, snapshot_path=snapshot_path).find_id("Aaron Judge"))
+
+    class DownUpstream:
+        async def get(self, url, headers=None):
+            raise httpx.ConnectError("unreachable")
+
+    monkeypatch.setattr(upstream_index, "http_client", DownUpstream())
+    roster = RosterIndex("https://statsapi.test/players", 3600, snapshot_path=snapshot_path)
+    assert asyncio.run(roster.find_id("jose ramirez")) == 608070
+    assert roster.stats()["source"] == "snapshot"
@@ -0,0 +1,213 @@
+import asyncio
+import json
+import statistics
+import threading
+import time
+from types import SimpleNamespace
+
+from app.core.translate_assistant import TranslateAssistant
+from app.core.translation_batcher import TranslationBatcher
+from app.core.translation_store import TranslationStore
+
+class RecordingModels:
+    """Stand-in for client.aio.models that records the size of every prompt it receives"""
+    def __init__(self):
+        self.prompt_chars = []
+        self.requests = []
+        self.chunks_sent = 0
+
+    def generate_content_stream(self, model, contents, config=None):
+        self.prompt_chars.append(len(contents) + len(config.system_instruction))
+        request = json.loads(contents)
+        self.requests.append(request)
+        response = json.dumps({
+            "results": [
+                {
+                    "id": task["id"],
+                    "originalText": task["text"],
+                    "translatedEnText": task["text"],
+                    "translatedJaText": task["text"],
+                    "translatedEsText": task["text"]
+                }
+                for task in request["translations"]
+            ]
+        })
+        # Arrive in small pieces, the way streamed model output does
+        for start in range(0, len(response), 64):
+            self.chunks_sent += 1
+            yield SimpleNamespace(text=response[start:start + 64])
+
+def test_stateless_translation_latency_is_flat():
+    """Regression benchmark: prompt size and per-call latency stay flat over 10k consecutive batches"""
+    translator = TranslateAssistant("test-key")
+    models = RecordingModels()
+    translator.assistant.client = SimpleNamespace(models=models)
+
+    async def run_batches():
+        timings = []
+        for i in range(10_000):
+            batch = [
+                {"id": f"title_{j}", "text": f"Aaron Judge homers ({i:05d}-{j})", "type": "news_title"}
+                for j in range(5)
+            ]
+            start = time.perf_counter()
+            result = await translator._translate_sub_batch(batch)
+            timings.append(time.perf_counter() - start)
+            assert len(result) == 5
+        return timings
+
+    timings = asyncio.run(run_batches())
+
+    # Every call carries only the system instruction and its own batch
+    assert max(models.prompt_chars) == min(models.prompt_chars)
+
+    first = statistics.median(timings[:1000])
+    last = statistics.median(timings[-1000:])
+    assert last < first * 1.5, f"median per-call latency grew from {first * 1e6:.1f}us to {last * 1e6:.1f}us"
+
+def test_sub_batch_requests_only_selected_languages():
+    """Only the requested languages and their character limits are sent to the model"""
+    translator = TranslateAssistant("test-key")
+    models = RecordingModels()
+    translator.assistant.client = SimpleNamespace(models=models)
+
+    task = {"id": "title_0", "text": "Ohtani homers", "type": "news_title", "max_chars_ja": 30, "langs": ["ja"]}
+    asyncio.run(translator._translate_sub_batch([task]))
+
+    request = models.requests[0]["translations"][0]
+    assert request["languages"] == ["ja"]
+    assert request["maxJaCharacters"] == 30
+    assert "maxEnCharacters" not in request and "maxEsCharacters" not in request
+
+def test_english_sources_skip_the_model_for_english(tmp_path):
+    """English text within its limit (or shortened in fast mode) is used directly; only other languages are sent"""
+    translator = TranslateAssistant("test-key", store=TranslationStore(f"sqlite:///{tmp_path / 'translations.db'}"))
+    models = RecordingModels()
+    translator.assistant.client = SimpleNamespace(models=models)
+
+    tasks = [
+        {"id": "fits", "text": "Judge homers in the 9th", "type": "news_title",
+         "max_chars_en": 50, "langs": ["en"]},
+        {"id": "fast", "text": "Shohei Ohtani hits his 50th home run of the season", "type": "news_title",
+         "max_chars_en": 30, "langs": ["en", "ja"], "mode": "fast"},
+    ]
+    results = asyncio.run(translator.translate_batch(tasks))
+
+    assert results["fits"]["translatedEnText"] == "Judge homers in the 9th"
+    assert results["fast"]["translatedEnText"] == "Shohei Ohtani hits his 50th…"
+    assert "translatedJaText" in results["fast"]
+    sent = [item for request in models.requests for item in request["translations"]]
+    assert [item["languages"] for item in sent] == [["ja"]]
+
+def test_spanish_sources_without_stopwords_are_translated(tmp_path):
+    """Short Spanish titles with no stopwords of either language are not mistaken for English"""
+    translator = TranslateAssistant("test-key", store=TranslationStore(f"sqlite:///{tmp_path / 'translations.db'}"))
+    models = RecordingModels()
+    translator.assistant.client = SimpleNamespace(models=models)
+
+    tasks = [
+        {"id": "hr", "text": "Ohtani pega cuadrangular", "type": "news_title", "max_chars_en": 50, "langs": ["en"]},
+        {"id": "win", "text": "Yankees vencen a Red Sox", "type": "news_title", "max_chars_en": 50, "langs": ["en"]},
+    ]
+    asyncio.run(translator.translate_batch(tasks))
+
+    sent = [item for request in models.requests for item in request["translations"]]
+    assert sorted(item["text"] for item in sent) == ["Ohtani pega cuadrangular", "Yankees vencen a Red Sox"]
+    assert all(item["languages"] == ["en"] for item in sent)
+
+def test_streamed_items_are_delivered_before_the_call_ends():
+    """Each result reaches the callback while later items are still being generated"""
+    class GatedModels(RecordingModels):
+        """Holds back the last chunk until the first result has been delivered"""
+        def generate_content_stream(self, model, contents, config=None):
+            chunks = list(super().generate_content_stream(model, contents, config))
+            self.chunks_sent = 0
+            for chunk in chunks[:-1]:
+                self.chunks_sent += 1
+                yield chunk
+            first_delivered.wait(timeout=2)
+            self.chunks_sent += 1
+            yield chunks[-1]
+
+    translator = TranslateAssistant("test-key")
+    models = GatedModels()
+    translator.assistant.client = SimpleNamespace(models=models)
+    first_delivered = threading.Event()
+    delivered = []
+
+    def on_result(task_id, result):
+        delivered.append((task_id, models.chunks_sent))
+        first_delivered.set()
+
+    batch = [{"id": f"title_{i}", "text": f"Soto homers ({i})", "type": "news_title"} for i in range(3)]
+    results = asyncio.run(translator._translate_sub_batch(batch, on_result))
+
+    assert [task_id for task_id, _ in delivered] == ["title_0", "title_1", "title_2"]
+    assert set(results) == {"title_0", "title_1", "title_2"}
+    # The first item was handed over before the last chunk of the response arrived
+    assert delivered[0][1] < models.chunks_sent
+
+def test_event_loop_keeps_running_while_a_slow_stream_is_read():
+    """The blocking SDK stream is read off the event loop, so other tasks and the call timeout still run"""
+    class SlowModels:
+        def generate_content_stream(self, model, contents, config=None):
+            for text in ['{"results": [', '{"id": "q0", "translatedEnText": "x"}', ']}']:
+                time.sleep(0.2)
+                yield SimpleNamespace(text=text)
+
+    translator = TranslateAssistant("test-key", call_timeout=0.3)
+    translator.assistant.client = SimpleNamespace(models=SlowModels())
+
+    async def run():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        started = time.monotonic()
+        results = await translator._translate_sub_batch([{"id": "q0", "text": "Judge homers", "type": "news_title"}])
+        elapsed = time.monotonic() - started
+        ticker.cancel()
+        return results, ticks, elapsed
+
+    results, ticks, elapsed = asyncio.run(run())
+    # The timeout fired mid-stream instead of waiting for the blocking reads to finish
+    assert results == {}
+    assert elapsed < 0.5
+    assert ticks >= 10
+
+def test_batcher_skips_abandoned_tasks_and_fails_instead_of_hanging():
+    """Tasks whose caller gave up are not sent; a dispatch-loop error reaches the waiting callers"""
+    sent = []
+
+    async def send(tasks, on_result):
+        sent.extend(task["text"] for task in tasks)
+        return {task["id"]: {"id": task["id"], "translatedEnText": task["text"]} for task in tasks}
+
+    async def run():
+        batcher = TranslationBatcher(send, max_concurrency=2, max_wait_ms=50)
+
+        async def abandoned():
+            async for _ in batcher.stream([{"id": "a", "text": "abandoned", "langs": ["en"]}]):
+                pass
+
+        caller = asyncio.create_task(abandoned())
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        assert list(await batcher.submit([{"id": "b", "text": "kept", "langs": ["en"]}])) == ["b"]
+        assert sent == ["kept"]
+
+        def broken_split(batch):
+            raise ValueError("bad plan")
+
+        batcher._split = broken_split
+        try:
+            await asyncio.wait_for(batcher.submit([{"id": "c", "text": "lost", "langs": ["en"]}]), 1)
+        except ValueError as e:
+            return str(e)
+
+    assert asyncio.run(run()) == "bad plan"